@@ -2,26 +2,86 @@
 """
 네이버 호텔 크롤러 (품질 우선 최적화 + 멀티프로세스 병렬 + 워커 프리픽스 로그)
 - 단위 작업: (지역, 숙소유형) 조합
-- 프로세스 별 독립 Chrome 프로필 사용(충돌 방지)
+- 프로세스 별 독립 Chrome 프로필 사용(충돌 방지), 워커 프로세스당 드라이버 1개를 조합 간 재사용
 - 상세 패널 '텍스트 로딩 완료'까지 대기 + 카드 타이틀 백업으로 이름 누락 방지
-- 조합별 CSV 저장 → 최종 병합(중복 제거 / region_idx & idx 재계산)
-- 모든 콘솔 출력 앞에 [W{번호}] 프리픽스 부착
+- 조합별 CSV 저장 → 최종 병합(중복 제거 / region_idx & idx 재계산, 해시 인덱스 + 외부 정렬 스트리밍)
+- combo_catalog.json: 조합별 페이지/카드 수·소요 시간을 실행마다 기록 → 다음 실행은 큰 조합부터 배정(LPT),
+  여러 번 연속 빈 조합은 HTTP 1회 탐색으로 확인 후 건너뜀, dry_run/plan 으로 예상 소요 시간 출력
+- 근접 중복: 숙소 ID + 전화/주소 블록 안 이름 MinHash(LSH) 비교로 같은 숙소를 묶고 대표 1행만 남김 (*_clusters.csv 보고서)
+- 모든 콘솔 출력 앞에 [W{번호}] 프리픽스 부착 (워커 로그는 큐로 모아 마스터 리스너 1곳에서 출력, text/JSON lines)
+- capture_mode="network": CDP Network 응답(JSON)에서 바로 HotelRow 채움 (DOM 파싱은 폴백)
+- backend="http": Chrome 없이 keep-alive 세션 + lxml 로 목록/상세 수집 (출력 스키마 동일)
+- detail_tabs=N: 한 드라이버에서 N개 탭으로 상세 페이지를 동시에 열고 먼저 준비된 탭부터 수집
+- readiness="event": 고정 sleep_jitter 말미 대신 DOM 안정(MutationObserver)+리소스 정지 시점에 진행
+- scheduler="pages": 조합을 페이지 구간(샤드)으로 나눠 놀고 있는 워커가 남은 페이지를 가져감
+- scheduler="pipeline": 목록 워커(list_workers)가 페이지별 카드 참조를 유한 큐(queue_pages)에 넣고
+  상세 워커(max_workers)가 꺼내 수집 → 목록이 상세를 기다리지 않음, 큐 깊이로 병목 단계 판정([PIPE])
+- result_db: 워커 공유 SQLite(WAL) 결과 저장소에 체크포인트마다 숙소 키 기준 upsert → 병합은 정렬 순서 내보내기 1회
+  (조합별 결과 CSV 없음, 실행 중에도 조회 가능: python NaverStayCrawler_multi.py store out/results.sqlite)
+- journal_path: SQLite(WAL) 재개 저널에 완료 페이지/상세 URL 기록 → 중단 후 재실행 시 남은 페이지부터
+- shared_dedup(기본 꺼짐): 카드의 숙소 ID 를 열기 전에 워커 공유 집합(Manager dict)과 대조 → 다른 조합에서 이미 수집한 숙소는 열지 않음
+  (어느 숙소유형 행으로 남을지는 먼저 끝난 조합이 정하므로 실행마다 달라질 수 있음)
+- 증분 재수집: 카드 지문(fingerprints.csv)이 이전 실행과 같으면 상세를 열지 않고 이전 results.csv 행을 이월
+- out_format="parquet"|"both": 타입 지정 Parquet 출력(체크포인트마다 row group), 최종 CSV 는 항상 기록
+- autoscale: max_workers 를 상한으로 작게 시작해 CPU/가용 메모리/처리량을 보고 동시 작업 수를 늘리거나 줄임
+- rate_limit: 워커 전체가 공유하는 토큰 버킷으로 요청률 상한, 차단성 실패율에 따라 AIMD 로 자동 조절
+- 수집 후 실패 카드만 페이지 단위로 병렬 재시도, 복구 행은 병합에 포함되고 남은 실패만 failures.csv 에
+- recycle_pages / recycle_rss_mb: 드라이버 기동 후 페이지 수·브라우저 프로세스 트리 RSS 상한을 넘으면 페이지 경계에서 교체
+- block_profile: CDP URL 차단(글꼴/트래커/지도 타일 등) + 페이지별 리소스 수/전송량 집계 (교차 출처 바이트는 capture_network 일 때만)
+- 단계별 지연 히스토그램(목록/카드/열기/파싱/체크포인트 등) → 종료 시 out/stats.json + out/stats.prom
 """
 
 import os
 import re
 import time
 import csv
+import json
+import base64
+import hashlib
+import zlib
 import sys
 import random
 import tempfile
 import shutil
+import heapq
+import bisect
+import functools
+import threading
+import logging
+import logging.handlers
+import multiprocessing as mp
+import multiprocessing.util as mp_util
+import sqlite3
+import queue
+from array import array
+from collections import deque
+from itertools import chain
+from contextlib import contextmanager
 from dataclasses import dataclass
 from typing import List, Dict, Tuple, Optional
+from urllib.parse import urljoin
 
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED
 
-import pandas as pd
+try:  # HTTP 백엔드 전용 (선택)
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+except ImportError:
+    requests = None
+try:
+    import lxml.html
+except ImportError:
+    lxml = None
+try:  # Parquet 출력 전용 (선택)
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+try:
+    import psutil
+except ImportError:
+    psutil = None
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
@@ -32,10 +92,11 @@ from selenium.common.exceptions import (
     TimeoutException,
     ElementClickInterceptedException,
     StaleElementReferenceException,
+    WebDriverException,
 )
 
 # ---------- 설정 영역 ----------
-BASE = "https://hotels.naver.com"
+BASE = os.environ.get("NAVER_STAY_BASE", "https://hotels.naver.com").rstrip("/")  # 로컬 픽스처 서버 테스트 시 재정의
 
 # 지역 목록 (이름, 코드)
 REGIONS: List[Tuple[str, str]] = [
@@ -81,8 +142,71 @@ DEFAULT_PAGE_PAUSE = 1.0   # 페이지 전환 후 말미
 DEFAULT_DETAIL_PAUSE = 1.0 # 카드 클릭 후 말미(품질 우선)
 
 # ------------ 유틸 로그 ------------
-def log(prefix: str, msg: str):
-    print(f"{prefix} {msg}", flush=True)
+# 워커는 QueueHandler 로 레코드만 보내고, 마스터의 QueueListener 1개가 출력 (stdout 경합/flush 비용 제거)
+LOGGER = logging.getLogger("naver_stay")
+LOGGER.propagate = False
+LOG_LEVELS = {"debug": logging.DEBUG, "info": logging.INFO, "warning": logging.WARNING}
+LOG_FORMATS = ("text", "json")
+CARD_LOG = logging.DEBUG   # 카드별 "→ [idx] ..." 줄 (log_level="debug" 일 때만 출력)
+_LOG = {"listener": None}
+
+class JsonLineFormatter(logging.Formatter):
+    """JSON lines: {"ts", "level", "worker": "W3", "pid", "msg"}"""
+    def format(self, record: logging.LogRecord) -> str:
+        return json.dumps({"ts": round(record.created, 3), "level": record.levelname.lower(),
+                           "worker": getattr(record, "worker", "").strip("[]"), "pid": record.process,
+                           "msg": record.getMessage()}, ensure_ascii=False)
+
+def log(prefix: str, msg: str, level: int = logging.INFO):
+    if level == logging.INFO and msg.startswith(("[WARN]", "[ERROR]")):
+        level = logging.WARNING
+    if not LOGGER.handlers:   # 로깅 미설정(모듈 단독 사용) → 기존처럼 바로 출력
+        print(f"{prefix} {msg}", flush=True)
+        return
+    LOGGER.log(level, msg, extra={"worker": prefix})
+
+def log_handler(fmt: str = "text", path: Optional[str] = None) -> logging.Handler:
+    if fmt not in LOG_FORMATS:
+        raise ValueError(f"알 수 없는 log_format: {fmt} (가능: {LOG_FORMATS})")
+    if path:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        h = logging.FileHandler(path, encoding="utf-8")
+    else:
+        h = logging.StreamHandler(sys.stdout)
+    h.setFormatter(JsonLineFormatter() if fmt == "json" else logging.Formatter("%(worker)s %(message)s"))
+    return h
+
+def _set_handler(handler: logging.Handler, level: str):
+    for h in list(LOGGER.handlers):
+        LOGGER.removeHandler(h)
+    LOGGER.addHandler(handler)
+    LOGGER.setLevel(LOG_LEVELS.get(level, logging.INFO))
+
+def configure_logging(level: str = "info", fmt: str = "text", path: Optional[str] = None):
+    """단일 프로세스용: 리스너 없이 바로 출력"""
+    _set_handler(log_handler(fmt, path), level)
+
+def start_log_listener(level: str = "info", fmt: str = "text", path: Optional[str] = None):
+    """마스터: 공유 큐 + 리스너 스레드 시작 → 워커 initializer 에 넘길 큐 반환"""
+    q = mp.Queue(-1)
+    listener = logging.handlers.QueueListener(q, log_handler(fmt, path), respect_handler_level=False)
+    listener.start()
+    _LOG["listener"] = listener
+    _set_handler(logging.handlers.QueueHandler(q), level)
+    return q
+
+def stop_log_listener():
+    """남은 레코드를 모두 출력하고 리스너 종료, 이후 log() 는 기본 출력으로 복귀"""
+    listener, _LOG["listener"] = _LOG["listener"], None
+    if listener:
+        listener.stop()
+    for h in list(LOGGER.handlers):
+        LOGGER.removeHandler(h)
+
+def setup_worker_logging(q, level: str = "info"):
+    """워커: 레벨 미달 레코드는 큐에 넣기 전에 버림"""
+    if q is not None:
+        _set_handler(logging.handlers.QueueHandler(q), level)
 
 # ------------ 데이터 모델 ------------
 @dataclass
@@ -106,18 +230,6 @@ def list_url(region_code: str, property_type: int, adult: int = 2, page: int = 1
 def sleep_jitter(base: float):
     time.sleep(base + random.uniform(0.05, 0.25))
 
-def clean_address(raw: str) -> str:
-    if not raw:
-        return ""
-    s = re.sub(r"\s+", " ", raw).strip()
-    s = re.sub(r"(위치\s*길찾기\s*거리뷰)\s*$", "", s)
-    for w in ["위치", "길찾기", "거리뷰"]:
-        s = re.sub(rf"\s*{w}\s*$", "", s)
-        s = re.sub(rf"\s*{w}\s*", " ", s)
-    s = s.replace("\u00a0", " ")
-    s = re.sub(r"\s{2,}", " ", s).strip()
-    return s
-
 def text_or_empty(el) -> str:
     try:
         return el.text.strip()
@@ -140,7 +252,536 @@ def safe_find(ctx, by, value, multi=False, timeout=8):
     except Exception:
         return [] if multi else None
 
+# ------------ 단계별 지연 통계 ------------
+STAGE_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)  # 초 (상한)
+STAGE_QUANTILES: Tuple[float, ...] = (0.5, 0.9, 0.99)
+PROM_METRIC = "naver_stay_stage_seconds"
+
+class StageStats:
+    """
+    단계별 지연 히스토그램 (프로세스 단위 누적)
+    - observe(stage, sec) / with STATS.time(stage) / @timed(stage)
+    - count(name, n): 단순 누적 카운터 (페이지 요청 수/바이트 등)
+    - take() 로 스냅샷(dict, pickle 가능)을 꺼내 마스터로 보내고, 마스터는 merge() 로 합산
+    """
+    def __init__(self):
+        self.stages: Dict[str, Dict] = {}
+        self.counters: Dict[str, float] = {}
+        self._lock = threading.Lock()   # HTTP 상세 스레드풀에서도 기록
+
+    def observe(self, stage: str, sec: float):
+        with self._lock:
+            st = self.stages.get(stage)
+            if st is None:
+                st = self.stages[stage] = {"buckets": [0] * (len(STAGE_BUCKETS) + 1), "count": 0, "sum": 0.0, "max": 0.0}
+            st["buckets"][bisect.bisect_left(STAGE_BUCKETS, sec)] += 1
+            st["count"] += 1
+            st["sum"] += sec
+            st["max"] = max(st["max"], sec)
+
+    def count(self, name: str, n: float = 1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    @contextmanager
+    def time(self, stage: str):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - t0)
+
+    def merge(self, snap: Dict[str, Dict]):
+        with self._lock:
+            for name, n in (snap.get("counters") or {}).items():
+                self.counters[name] = self.counters.get(name, 0) + n
+            for stage, o in (snap.get("stages") or {}).items():
+                st = self.stages.setdefault(stage, {"buckets": [0] * (len(STAGE_BUCKETS) + 1), "count": 0, "sum": 0.0, "max": 0.0})
+                st["buckets"] = [a + b for a, b in zip(st["buckets"], o["buckets"])]
+                st["count"] += o["count"]
+                st["sum"] += o["sum"]
+                st["max"] = max(st["max"], o["max"])
+
+    def take(self) -> Dict[str, Dict]:
+        with self._lock:
+            snap = {"stages": self.stages, "counters": self.counters}
+            self.stages, self.counters = {}, {}
+        return snap
+
+    def quantile(self, stage: str, q: float) -> float:
+        """버킷 내 선형 보간 추정치 (마지막 버킷은 max 로 상한)"""
+        st = self.stages.get(stage)
+        if not st or not st["count"]:
+            return 0.0
+        rank, acc = q * st["count"], 0
+        for i, n in enumerate(st["buckets"]):
+            if n and acc + n >= rank:
+                lo = STAGE_BUCKETS[i - 1] if i > 0 else 0.0
+                hi = STAGE_BUCKETS[i] if i < len(STAGE_BUCKETS) else st["max"]
+                return min(st["max"], lo + (hi - lo) * (rank - acc) / n)
+            acc += n
+        return st["max"]
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        out = {}
+        for stage, st in sorted(self.stages.items()):
+            row = {"count": st["count"], "sum": round(st["sum"], 3), "mean": round(st["sum"] / max(1, st["count"]), 4),
+                   "max": round(st["max"], 4)}
+            row.update({f"p{int(q * 100)}": round(self.quantile(stage, q), 4) for q in STAGE_QUANTILES})
+            out[stage] = row
+        return out
+
+STATS = StageStats()
+
+def timed(stage: str):
+    """함수 호출 시간을 STATS 의 stage 로 기록하는 데코레이터"""
+    def deco(fn):
+        @functools.wraps(fn)
+        def wrapper(*a, **kw):
+            t0 = time.perf_counter()
+            try:
+                return fn(*a, **kw)
+            finally:
+                STATS.observe(stage, time.perf_counter() - t0)
+        return wrapper
+    return deco
+
+def prom_lines(stats: StageStats, labels: str = "") -> List[str]:
+    lines = []
+    for stage, st in sorted(stats.stages.items()):
+        lab = f'stage="{stage}"' + (f",{labels}" if labels else "")
+        acc = 0
+        for le, n in zip([*map(str, STAGE_BUCKETS), "+Inf"], st["buckets"]):
+            acc += n
+            lines.append(f'{PROM_METRIC}_bucket{{{lab},le="{le}"}} {acc}')
+        lines.append(f"{PROM_METRIC}_sum{{{lab}}} {st['sum']:.6f}")
+        lines.append(f"{PROM_METRIC}_count{{{lab}}} {st['count']}")
+    return lines
+
+def prom_counter_lines(stats: StageStats, labels: str = "") -> List[str]:
+    return [f'naver_stay_counter_total{{name="{name}"' + (f",{labels}" if labels else "") + f"}} {n:g}"
+            for name, n in sorted(stats.counters.items())]
+
+def write_stats_report(total: StageStats, per_worker: Dict[str, StageStats], extra: Dict,
+                       json_path: Optional[str], prom_path: Optional[str], prefix: str):
+    """실행 요약: JSON 보고서 + Prometheus textfile (node_exporter textfile collector 형식, 원자적 교체)"""
+    for stage, row in total.summary().items():
+        log(prefix, f"[STAGE] {stage:<16} n={row['count']:<6} p50={row['p50']:.3f}s p90={row['p90']:.3f}s "
+                    f"p99={row['p99']:.3f}s max={row['max']:.3f}s sum={row['sum']:.1f}s")
+    if json_path:
+        os.makedirs(os.path.dirname(json_path) or ".", exist_ok=True)
+        report = dict(extra, buckets=list(STAGE_BUCKETS), stages=total.summary(), counters=total.counters,
+                      per_worker={w: dict(s.summary(), counters=s.counters) for w, s in sorted(per_worker.items())})
+        with open(json_path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        os.replace(json_path + ".tmp", json_path)
+        log(prefix, f"[STATS] JSON → {json_path}")
+    if prom_path:
+        os.makedirs(os.path.dirname(prom_path) or ".", exist_ok=True)
+        lines = [f"# HELP {PROM_METRIC} 크롤러 단계별 소요 시간(초)", f"# TYPE {PROM_METRIC} histogram"]
+        lines += prom_lines(total, 'worker="all"')
+        for w, s in sorted(per_worker.items()):
+            lines += prom_lines(s, f'worker="{w}"')
+        lines += ["# HELP naver_stay_counter_total 누적 카운터 (페이지 요청 수/전송 바이트 등)",
+                  "# TYPE naver_stay_counter_total counter"]
+        lines += prom_counter_lines(total, 'worker="all"')
+        for w, s in sorted(per_worker.items()):
+            lines += prom_counter_lines(s, f'worker="{w}"')
+        lines += ["# HELP naver_stay_rows_total 수집 결과 행 수", "# TYPE naver_stay_rows_total counter",
+                  f'naver_stay_rows_total{{result="ok"}} {extra.get("ok", 0)}',
+                  f'naver_stay_rows_total{{result="fail"}} {extra.get("fail", 0)}',
+                  "# HELP naver_stay_wall_seconds 전체 실행 시간", "# TYPE naver_stay_wall_seconds gauge",
+                  f'naver_stay_wall_seconds {extra.get("wall_sec", 0.0):.3f}']
+        with open(prom_path + ".tmp", "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(prom_path + ".tmp", prom_path)
+        log(prefix, f"[STATS] Prometheus → {prom_path}")
+
+# ------------ 전역 요청 속도 조절 (토큰 버킷 + AIMD) ------------
+DEFAULT_RATE_FLOOR = 0.2      # req/s 하한 (전체 워커 합)
+GOV_WINDOW = 20               # 결과 N건마다 속도 재조정
+GOV_BAD_RATIO = 0.25          # 실패율 이 이상 → 속도 절반 (곱 감소)
+GOV_GOOD_RATIO = 0.05         # 실패율 이 이하 → 상한의 10% 씩 회복 (합 증가)
+GOV_BAD_REASONS: Tuple[str, ...] = ("Timeout", "parse_detail:empty", "http:")   # 차단/과부하 신호로 보는 실패
+_GOV = {"gov": None}
+
+class RateGovernor:
+    """
+    모든 워커 프로세스가 공유하는 토큰 버킷 (state: Manager dict, lock: Manager Lock / 단일 프로세스는 dict + threading.Lock)
+    - acquire(): 요청 1건 전에 토큰 1개 확보까지 대기 → 전체 요청률 <= rate
+    - report(ok): GOV_WINDOW 건마다 차단성 실패율로 rate 조정 (ceiling ~ floor)
+    """
+    def __init__(self, state, lock, ceiling: float, floor: float = DEFAULT_RATE_FLOOR):
+        self.state, self.lock = state, lock
+        self.ceiling, self.floor = ceiling, min(floor, ceiling)
+
+    @staticmethod
+    def initial_state(ceiling: float) -> Dict:
+        return {"rate": ceiling, "tokens": 1.0, "ts": time.time(), "ok": 0, "bad": 0}
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                st = dict(self.state)
+                now = time.time()
+                rate = st["rate"]
+                tokens = min(max(1.0, rate), st["tokens"] + (now - st["ts"]) * rate)
+                if tokens >= 1.0:
+                    self.state.update(tokens=tokens - 1.0, ts=now)
+                    return
+                self.state.update(tokens=tokens, ts=now)
+            time.sleep((1.0 - tokens) / rate + random.uniform(0, 0.02))
+
+    def report(self, ok: bool) -> Optional[Tuple[float, float, float]]:
+        """rate 가 바뀌면 (이전, 이후, 실패율) 반환"""
+        with self.lock:
+            st = dict(self.state)
+            st["ok" if ok else "bad"] += 1
+            n = st["ok"] + st["bad"]
+            if n < GOV_WINDOW:
+                self.state.update(ok=st["ok"], bad=st["bad"])
+                return None
+            ratio, old = st["bad"] / n, st["rate"]
+            if ratio >= GOV_BAD_RATIO:
+                rate = max(self.floor, old * 0.5)
+            elif ratio <= GOV_GOOD_RATIO:
+                rate = min(self.ceiling, old + self.ceiling * 0.1)
+            else:
+                rate = old
+            self.state.update(ok=0, bad=0, rate=rate)
+        return (old, rate, ratio) if rate != old else None
+
+def install_governor(gov: Optional[RateGovernor]):
+    _GOV["gov"] = gov
+
+@timed("throttle")
+def throttle():
+    """요청 직전 호출: 전역 토큰 버킷이 설정돼 있으면 차례를 기다림"""
+    if _GOV["gov"] is not None:
+        _GOV["gov"].acquire()
+
+def governor_report(reason: str, prefix: str):
+    """카드 결과를 전역 조절기에 보고 (성공 / 차단성 실패만 반영, 그 외 실패는 무시)"""
+    gov = _GOV["gov"]
+    if gov is None or (reason and not reason.startswith(GOV_BAD_REASONS)):
+        return
+    changed = gov.report(not reason)
+    if changed:
+        old, new, ratio = changed
+        log(prefix, f"[GOV] 실패율 {ratio:.0%} → 전체 요청률 {old:.2f} → {new:.2f} req/s")
+
+# ------------ 워커 수 자동 조절 ------------
+AUTOSCALE_INTERVAL = 30.0       # 판단 주기(초)
+AUTOSCALE_CPU_HIGH = 90.0       # 이 이상이면 축소
+AUTOSCALE_CPU_LOW = 70.0        # 이 미만이어야 확장
+AUTOSCALE_MEM_FLOOR_MB = 1024   # 가용 메모리 하한 (미만이면 축소, 확장 후에도 이만큼은 남아야 함)
+AUTOSCALE_WORKER_MB = 600       # 워커 1개(Chrome 포함) 최소 추정치, 관측 평균이 더 크면 관측값 사용
+AUTOSCALE_GAIN = 1.1            # 확장 후 전체 처리량이 이 배율 이상 늘지 않으면 되돌리고 상한 고정
+
+# 워커 → 마스터 수집 건수 (mp.Value, 풀 initializer 로 전달)
+_PROGRESS: Dict[str, object] = {"counter": None}
+
+def install_progress(counter):
+    _PROGRESS["counter"] = counter
+
+def report_progress(n: int = 1):
+    counter = _PROGRESS["counter"]
+    if counter is not None:
+        with counter.get_lock():
+            counter.value += n
+
+def system_load() -> Tuple[Optional[float], Optional[float]]:
+    """(CPU 사용률 %, 가용 메모리 MB). psutil 없으면 loadavg, /proc/meminfo 로 근사 (알 수 없으면 None)"""
+    if psutil is not None:
+        return psutil.cpu_percent(None), psutil.virtual_memory().available / 2 ** 20
+    cpu = mem = None
+    try:
+        cpu = 100.0 * os.getloadavg()[0] / (os.cpu_count() or 1)
+    except (OSError, AttributeError):
+        pass
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    mem = int(line.split()[1]) / 1024
+                    break
+    except OSError:
+        pass
+    return cpu, mem
+
+def children_rss_mb() -> Optional[float]:
+    """현재 프로세스 하위 전체(워커 + chromedriver + Chrome) RSS 합계 MB"""
+    if psutil is None:
+        return None
+    total = 0
+    for p in psutil.Process().children(recursive=True):
+        try:
+            total += p.memory_info().rss
+        except psutil.Error:
+            pass
+    return total / 2 ** 20
+
+class Autoscaler:
+    """
+    풀은 max_workers(상한) 크기로 만들고, 동시에 돌릴 작업 수 target 만 interval 마다 1씩 조절.
+    - 축소: 가용 메모리 < mem_floor_mb, CPU ≥ cpu_high, 또는 직전 확장이 처리량을 gain 배 이상 늘리지 못함(상한 고정)
+    - 확장: CPU < cpu_low 이고 워커 1개분 메모리를 더 써도 mem_floor_mb 이상 남으며 수집이 진행 중일 때
+    - 축소로 남는 워커 수는 retire 에 쌓아 두고 iter_pool 이 retire_worker 작업으로 드라이버를 반납시킴
+    progress: 워커들이 report_progress() 로 올리는 수집 건수 (mp.Value)
+    """
+    def __init__(self, start: int, ceiling: int, progress, interval: float = AUTOSCALE_INTERVAL,
+                 cpu_high: float = AUTOSCALE_CPU_HIGH, cpu_low: float = AUTOSCALE_CPU_LOW,
+                 mem_floor_mb: float = AUTOSCALE_MEM_FLOOR_MB, gain: float = AUTOSCALE_GAIN):
+        self.ceiling = max(1, ceiling)
+        self.target = max(1, min(start, self.ceiling))
+        self.progress = progress
+        self.interval = interval
+        self.cpu_high, self.cpu_low = cpu_high, cpu_low
+        self.mem_floor_mb = mem_floor_mb
+        self.gain = gain
+        self.grew_from: Optional[Tuple[int, float]] = None   # (확장 전 target, 그때 처리량)
+        self.retire = 0
+        self.decisions = 0
+        self.t_last, self.cards_last = time.time(), 0
+        if psutil is not None:
+            psutil.cpu_percent(None)   # 다음 호출의 측정 기준점
+
+    def tick(self, running: int, prefix: str):
+        now = time.time()
+        if now - self.t_last < self.interval:
+            return
+        cards = self.progress.value
+        rate = (cards - self.cards_last) / (now - self.t_last)
+        self.t_last, self.cards_last = now, cards
+        cpu, mem = system_load()
+        worker_mb = max(AUTOSCALE_WORKER_MB, (children_rss_mb() or 0.0) / max(1, running))
+
+        old, why = self.target, ""
+        if mem is not None and mem < self.mem_floor_mb:
+            self.target, why = old - 1, f"가용 메모리 {mem:.0f}MB < {self.mem_floor_mb:.0f}MB"
+        elif cpu is not None and cpu >= self.cpu_high:
+            self.target, why = old - 1, f"CPU {cpu:.0f}% ≥ {self.cpu_high:.0f}%"
+        elif self.grew_from and rate < self.grew_from[1] * self.gain:
+            self.target = self.ceiling = self.grew_from[0]
+            why = f"확장 효과 없음 ({self.grew_from[1]:.2f} → {rate:.2f} cards/s) → 상한 {self.ceiling} 고정"
+        elif (old < self.ceiling and rate > 0 and (cpu is None or cpu < self.cpu_low)
+              and (mem is None or mem - worker_mb >= self.mem_floor_mb)):
+            self.target, why = old + 1, f"여유 있음 (워커당 {worker_mb:.0f}MB 예상)"
+        self.target = max(1, self.target)
+        self.grew_from = (old, rate) if self.target > old else None
+        if self.target < old:
+            self.retire += old - self.target
+        elif self.target > old:
+            self.retire = 0
+
+        fmt = lambda v, unit: f"{v:.0f}{unit}" if v is not None else "-"
+        status = (f"CPU {fmt(cpu, '%')}, 가용 {fmt(mem, 'MB')}, {rate:.2f} cards/s "
+                  f"(워커당 {rate / max(1, running):.2f}), 실행 중 {running}")
+        if self.target != old:
+            self.decisions += 1
+            log(prefix, f"[SCALE] workers {old} → {self.target}: {why} | {status}")
+        else:
+            log(prefix, f"[SCALE] 유지 {old}/{self.ceiling} | {status}", logging.DEBUG)
+
+    def take_retire(self) -> int:
+        n, self.retire = self.retire, 0
+        return n
+
+def iter_pool(ex: ProcessPoolExecutor, jobs: List[Tuple], scaler: Optional[Autoscaler], prefix: str):
+    """
+    jobs = [(fn, task)] 를 순서대로 제출. scaler 가 있으면 동시 실행을 scaler.target 개로 제한하고 주기적으로 조절.
+    완료되는 순서대로 (jobs 인덱스, future) 반환
+    """
+    pending = deque(enumerate(jobs))
+    running: Dict = {}
+    while pending or running:
+        limit = scaler.target if scaler else len(jobs)
+        while pending and len(running) < limit:
+            i, (fn, task) = pending.popleft()
+            running[ex.submit(fn, task)] = i
+        if scaler:
+            for _ in range(scaler.take_retire()):
+                ex.submit(retire_worker)   # 다음에 비는 워커가 드라이버 반납
+        done, _ = wait(running, timeout=scaler.interval / 3 if scaler else None, return_when=FIRST_COMPLETED)
+        for fut in done:
+            yield running.pop(fut), fut
+        if scaler and pending:
+            scaler.tick(len(running), prefix)   # 남은 작업이 없으면 조절할 필요 없음
+
+# ------------ 이벤트 기반 준비 감지 ------------
+LIST_READY_SELECTORS = ["ul[class*=SearchList_SearchList] li", "div.Condition_NoItemWithCondition__hPSou"]
+PANEL_NAME_SELECTOR = "div.Info_Info__Nutkw h3.Info_name__ogaJE span.Info_txt__5XJl0"
+DEFAULT_QUIET_MS = 150          # 이 시간 동안 DOM 변경/새 리소스가 없으면 안정으로 판단
+DEFAULT_POLITENESS_FLOOR = 0.15 # 이벤트 모드에서도 요청 사이 최소 간격(초)
+JITTER_MEAN = 0.15              # sleep_jitter 의 평균 추가 시간
+
+WAIT_STABLE_JS = """
+const [sels, notText, quietMs, timeoutMs, done] = arguments;
+const t0 = performance.now();
+let last = t0, lastRes = performance.getEntriesByType("resource").length;
+const ready = () => sels.some(s => {
+  const el = document.querySelector(s);
+  const t = el ? el.textContent.trim() : "";
+  return t && t !== notText;
+});
+const obs = new MutationObserver(() => { last = performance.now(); });
+obs.observe(document.documentElement || document, {subtree: true, childList: true, characterData: true});
+const tick = () => {
+  const now = performance.now();
+  const res = performance.getEntriesByType("resource").length;
+  if (res !== lastRes) { lastRes = res; last = now; }
+  if (ready() && now - last >= quietMs) { obs.disconnect(); done(true); return; }
+  if (now - t0 > timeoutMs) { obs.disconnect(); done(false); return; }
+  setTimeout(tick, 25);
+};
+tick();
+"""
+
+def wait_dom_stable(driver, selectors: List[str], quiet_ms: int = DEFAULT_QUIET_MS,
+                    timeout: float = 12.0, not_text: str = "") -> bool:
+    """selectors 중 하나에 (not_text 와 다른) 텍스트가 생기고 quiet_ms 동안 DOM/네트워크가 조용하면 True"""
+    try:
+        driver.set_script_timeout(timeout + 5)
+        return bool(driver.execute_async_script(WAIT_STABLE_JS, selectors, not_text, quiet_ms, int(timeout * 1000)))
+    except Exception:
+        return False
+
+@dataclass
+class Readiness:
+    """이벤트 기반 대기 설정 + 페이지 단위 통계 (waited: 실제 대기, skipped: 생략된 고정 말미)"""
+    quiet_ms: int = DEFAULT_QUIET_MS
+    floor: float = DEFAULT_POLITENESS_FLOOR
+    timeout: float = 12.0
+    waited: float = 0.0
+    skipped: float = 0.0
+
+    def wait(self, driver, selectors: List[str], fixed_pause: float, not_text: str = "") -> bool:
+        t0 = time.time()
+        ok = wait_dom_stable(driver, selectors, self.quiet_ms, self.timeout, not_text)
+        spent = time.time() - t0
+        if spent < self.floor:
+            time.sleep(self.floor - spent)
+        self.waited += time.time() - t0
+        self.skipped += fixed_pause
+        return ok
+
+    def take(self) -> Tuple[float, float]:
+        out = (self.waited, self.skipped)
+        self.waited, self.skipped = 0.0, 0.0
+        return out
+
 # ------------ 드라이버 ------------
+# CDP Network.setBlockedURLs 패턴 (와일드카드 *). 파서가 보는 HTML/JSON/스크립트는 건드리지 않음
+BLOCK_FONTS = ("*.woff*", "*.ttf*", "*.otf*", "*.eot*", "*fonts.googleapis.com*", "*fonts.gstatic.com*")
+BLOCK_MEDIA = ("*.mp4*", "*.webm*", "*.m3u8*", "*.ico*")
+BLOCK_TRACKERS = (
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*", "*googlesyndication.com*",
+    "*facebook.net*", "*criteo*", "*wcs.naver.net*", "*lcs.naver.com*", "*tivan.naver.com*",
+    "*veta.naver.com*", "*nelo2-col*", "*ntm.pstatic.net*",
+)
+BLOCK_MAPS = (
+    "*map.pstatic.net*", "*oapi.map.naver.com*", "*nrbe.map.naver.net*", "*map.naver.net/*tile*",
+    "*naveropenapi.apigw.ntruss.com/map*", "*simg.pstatic.net/static.map*",
+)
+BLOCK_PROFILES: Dict[str, Tuple[str, ...]] = {
+    "off": (),
+    # 기본: 글꼴/미디어/광고·분석/지도 타일만 차단 → 레이아웃(CSS)이 살아 있어 클릭·innerText 결과 동일
+    "safe": BLOCK_FONTS + BLOCK_MEDIA + BLOCK_TRACKERS + BLOCK_MAPS,
+    # 스타일시트까지 차단: 더 가볍지만 숨김 요소가 보이거나 클릭 가림이 달라질 수 있어 검증 후 사용
+    "aggressive": BLOCK_FONTS + BLOCK_MEDIA + BLOCK_TRACKERS + BLOCK_MAPS + ("*.css*",),
+}
+DEFAULT_BLOCK_PROFILE = "safe"
+
+# 현재 문서가 받은 리소스 수/전송 바이트 (차단된 요청은 잡히지 않으므로 프로필 간 비교로 절감 확인).
+# Resource Timing 은 Timing-Allow-Origin 이 없는 교차 출처 리소스(글꼴/지도 타일/추적기 등 차단 대상 대부분)의
+# 크기를 0 으로 주므로 바이트는 사실상 동일 출처분만. 정확한 값은 capture_network 드라이버의 CDP 집계(page_traffic)
+TRAFFIC_JS = """
+const es = performance.getEntriesByType("navigation").concat(performance.getEntriesByType("resource"));
+let bytes = 0;
+for (const e of es) bytes += e.transferSize || e.encodedBodySize || 0;
+return [es.length, bytes];
+"""
+
+def block_patterns(profile: Optional[str], extra: Optional[List[str]] = None) -> List[str]:
+    if profile and profile not in BLOCK_PROFILES:
+        raise ValueError(f"알 수 없는 block_profile: {profile} (가능: {tuple(BLOCK_PROFILES)})")
+    return list(BLOCK_PROFILES.get(profile or "off", ())) + list(extra or [])
+
+def page_traffic(driver) -> Optional[Tuple[int, int]]:
+    """
+    (요청 수, 전송 바이트). HTTP 백엔드/스크립트 실패 시 None.
+    performance 로그를 받는 드라이버는 drain_network_json 이 모은 Network.loadingFinished.encodedDataLength
+    합계(교차 출처 포함, 지난 호출 이후분)를, 아니면 TRAFFIC_JS(동일 출처분만)를 사용
+    """
+    net = getattr(driver, "_net_traffic", None)
+    if net is not None:
+        driver._net_traffic = (0, 0)
+        return net
+    if not hasattr(driver, "execute_script"):
+        return None
+    try:
+        n, b = driver.execute_script(TRAFFIC_JS)
+        return int(n), int(b)
+    except Exception:
+        return None
+
+# 장시간 구동 시 Chrome 메모리 누수 대비: 페이지 경계에서 드라이버 교체
+DEFAULT_RECYCLE_PAGES = 300       # 드라이버 기동 후 처리 페이지 수 상한 (0/None: 끔)
+DEFAULT_RECYCLE_RSS_MB = 1500     # chromedriver + chrome 자식 전체 RSS 상한 (psutil 필요)
+
+def browser_rss(driver) -> Optional[int]:
+    """chromedriver 와 하위 프로세스(브라우저/렌더러/GPU) RSS 합계(bytes). psutil 없음/HTTP 백엔드/조회 실패 시 None"""
+    proc = getattr(getattr(driver, "service", None), "process", None)
+    if psutil is None or proc is None:
+        return None
+    try:
+        root = psutil.Process(proc.pid)
+        procs = [root] + root.children(recursive=True)
+    except psutil.Error:
+        return None
+    total = 0
+    for p in procs:
+        try:
+            total += p.memory_info().rss
+        except psutil.Error:
+            pass
+    return total
+
+class DriverRecycler:
+    """
+    crawl_region_property 가 페이지를 끝낼 때마다 check() 호출 → 계속 쓸 드라이버 반환.
+    드라이버 기동 후 페이지 수 >= max_pages 또는 브라우저 RSS >= max_rss_mb 면 restart(old) 로 교체.
+    restart: 기존 드라이버를 정리하고 새 드라이버를 반환하는 함수 / driver: 마지막으로 확인(또는 교체)한 드라이버
+    """
+    def __init__(self, restart, max_pages: Optional[int] = DEFAULT_RECYCLE_PAGES,
+                 max_rss_mb: Optional[float] = DEFAULT_RECYCLE_RSS_MB):
+        self.restart = restart
+        self.max_pages = max_pages
+        self.max_rss_mb = max_rss_mb
+        self.driver = None
+        self.pages = 0
+
+    def check(self, driver, prefix: str = ""):
+        if not hasattr(driver, "execute_script") or not (self.max_pages or self.max_rss_mb):
+            return driver
+        if driver is not self.driver:
+            # 오류 재기동 등 다른 경로로 바뀐 드라이버 → 카운트 새로 시작
+            self.driver, self.pages = driver, 0
+        self.pages += 1
+        reason = ""
+        if self.max_pages and self.pages >= self.max_pages:
+            reason = f"페이지 {self.pages}개"
+        elif self.max_rss_mb:
+            rss = browser_rss(driver)
+            if rss is not None and rss >= self.max_rss_mb * 2 ** 20:
+                reason = f"RSS {rss / 2 ** 20:.0f}MB ≥ {self.max_rss_mb:.0f}MB"
+        if not reason:
+            return driver
+        log(prefix, f"[RECYCLE] {reason} → 드라이버 교체 후 다음 페이지부터 계속")
+        STATS.count("driver_recycles")
+        self.driver, self.pages = self.restart(driver), 0
+        return self.driver
+
 def make_driver(
     headless: bool = True,
     user_data_dir: Optional[str] = None,
@@ -150,7 +791,12 @@ def make_driver(
     block_cookies: bool = False,
     user_agent: Optional[str] = None,
     window_size: str = "1280,900",
+    capture_network: bool = False,
+    page_load_strategy: Optional[str] = None,
+    block_profile: Optional[str] = DEFAULT_BLOCK_PROFILE,
+    block_urls: Optional[List[str]] = None,
 ):
+    patterns = block_patterns(block_profile, block_urls)
     opts = Options()
     if headless:
         opts.add_argument("--headless=new")
@@ -191,20 +837,40 @@ def make_driver(
     if user_agent:
         opts.add_argument(f"--user-agent={user_agent}")
 
+    if page_load_strategy:
+        # 멀티 탭 모드는 "none": 탭 전환/폴링이 다른 탭의 로딩 완료를 기다리지 않도록
+        opts.page_load_strategy = page_load_strategy
+
+    if capture_network:
+        # CDP Network.* 이벤트를 performance 로그로 수신 (응답 본문은 Network.getResponseBody)
+        opts.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        opts.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
+
     service = ChromeService(log_path=os.devnull) if suppress_logs else ChromeService()
     driver = webdriver.Chrome(service=service, options=opts)
 
-    if disable_cache:
-        try:
-            driver.execute_cdp_cmd("Network.enable", {})
-            driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": True})
-        except Exception:
-            pass
+    cdp: List[Tuple[str, Dict]] = []
+    if disable_cache or capture_network or patterns:
+        cdp.append(("Network.enable", {}))
+        if disable_cache:
+            cdp.append(("Network.setCacheDisabled", {"cacheDisabled": True}))
+        if patterns:
+            cdp.append(("Network.setBlockedURLs", {"urls": patterns}))
+    driver._cdp_network = cdp   # 새 탭(ensure_tab_pool)에도 다시 적용
+    apply_network_settings(driver)
 
     driver.set_page_load_timeout(45)
     driver.implicitly_wait(0)
     return driver
 
+def apply_network_settings(driver):
+    """make_driver 의 CDP Network 설정(캐시 끔/URL 차단)을 현재 탭에 적용. CDP 설정은 탭마다 따로라 새 탭마다 호출"""
+    try:
+        for cmd, params in getattr(driver, "_cdp_network", None) or []:
+            driver.execute_cdp_cmd(cmd, params)
+    except Exception:
+        pass
+
 # ------------ 파서/수집 ------------
 def card_name_fallback(card) -> str:
     sels = [
@@ -222,85 +888,95 @@ def card_name_fallback(card) -> str:
                 return t
     return ""
 
-def parse_detail_panel(driver, fallback_name: str = "") -> Dict[str, str]:
-    out = {"name":"", "name_en":"", "grade":"", "tel":"", "address":"", "website":"", "detail_url":driver.current_url}
-    root = safe_find(driver, By.CSS_SELECTOR, "div.Info_Info__Nutkw", timeout=10)
-    if not root:
-        out["name"] = fallback_name
-        return out
-
-    name_el = safe_find(driver, By.CSS_SELECTOR, "h3.Info_name__ogaJE span.Info_txt__5XJl0", timeout=3)
-    if name_el:
-        out["name"] = text_or_empty(name_el)
-    if not out["name"]:
-        try:
-            out["name"] = wait_text_nonempty(driver, "h3.Info_name__ogaJE span.Info_txt__5XJl0", timeout=6)
-        except Exception:
-            pass
-    if not out["name"] and fallback_name:
-        out["name"] = fallback_name
-
-    en_el = safe_find(driver, By.CSS_SELECTOR, "i.Info_eng__InlcK", timeout=2)
-    if en_el:
-        out["name_en"] = text_or_empty(en_el)
-
-    grade_el = safe_find(driver, By.CSS_SELECTOR, "div.Info_grade__Xn_uy i.Info_gradetxt___V9AF", timeout=2)
-    if grade_el:
-        out["grade"] = text_or_empty(grade_el)
+# 상세 패널 전체 필드 + 평점을 스크립트 1회로 읽음 (필드별 WebDriverWait 왕복 제거)
+PANEL_EXTRACT_JS = r"""
+const q = (s) => document.querySelector(s);
+const txt = (el) => el ? (el.innerText || el.textContent || "").trim() : "";
+if (!q("div.Info_Info__Nutkw")) return null;
+const tel = q("li.Info_item__bDb4b [data-label='tel'] + div span.Info_txt__5XJl0")
+         || q("li.Info_item__bDb4b i[data-label='tel'] ~ div span.Info_txt__5XJl0");
+const home = q("li.Info_item__bDb4b.homepage a.Info_link__ikjyU");
+let blocks = [...document.querySelectorAll("li.Info_item__bDb4b i[data-label='rating'] ~ div span.Info_txt__5XJl0")];
+if (!blocks.length) blocks = [...document.querySelectorAll("li.Info_item__bDb4b")];
+const ratings = [];
+for (const b of blocks) {
+  const a = b.querySelector("a.Info_link__ikjyU"), v = b.querySelector("b.Info_current__Ocnim");
+  if (a && v) ratings.push([txt(a), txt(v)]);
+}
+return {
+  name: txt(q("h3.Info_name__ogaJE span.Info_txt__5XJl0")),
+  name_en: txt(q("i.Info_eng__InlcK")),
+  grade: txt(q("div.Info_grade__Xn_uy i.Info_gradetxt___V9AF")),
+  website: home ? (home.href || "") : "",
+  address: txt(q("li.Info_item__bDb4b.address span.Info_txt__5XJl0")),
+  tel: txt(tel),
+  ratings: ratings,
+  url: location.href,
+};
+"""
+RATING_LABELS = [
+    ("호텔스컴바인", "hotelscombined"),
+    ("부킹닷컴", "booking"),
+    ("트립어드바이저", "tripadvisor"),
+    ("네이버", "naver"),
+]
 
-    homepage_el = safe_find(driver, By.CSS_SELECTOR, "li.Info_item__bDb4b.homepage a.Info_link__ikjyU", timeout=2)
-    if homepage_el:
+def read_panel(driver, timeout: float = 10) -> Optional[Dict]:
+    """패널이 뜨고 이름 텍스트가 찰 때까지 PANEL_EXTRACT_JS 를 폴링. 시간 초과 시 마지막 결과(없으면 None)."""
+    last = [None]
+    def _ok(drv):
         try:
-            out["website"] = homepage_el.get_attribute("href") or ""
-        except Exception:
-            pass
+            last[0] = drv.execute_script(PANEL_EXTRACT_JS)
+        except StaleElementReferenceException:
+            return False
+        return last[0] if last[0] and last[0].get("name") else False
+    try:
+        return WebDriverWait(driver, timeout, poll_frequency=0.1).until(_ok)
+    except TimeoutException:
+        return last[0]
+    except WebDriverException:
+        return None
 
-    addr_li = safe_find(driver, By.CSS_SELECTOR, "li.Info_item__bDb4b.address span.Info_txt__5XJl0", timeout=3)
-    if addr_li:
-        out["address"] = clean_address(text_or_empty(addr_li))
+def panel_detail(raw: Optional[Dict], url: str, fallback_name: str = "") -> Dict[str, str]:
+    out = {"name":"", "name_en":"", "grade":"", "tel":"", "address":"", "website":"", "detail_url":url}
+    if not raw:
+        out["name"] = fallback_name
+        return out
+    out["name"] = raw.get("name") or fallback_name
+    out["name_en"] = raw.get("name_en") or ""
+    out["grade"] = raw.get("grade") or ""
+    out["website"] = raw.get("website") or ""
+    out["address"] = (raw.get("address") or "").strip()   # 주소/전화 정리는 병합 시 normalize_rows 에서 일괄
+    out["tel"] = (raw.get("tel") or "").strip()
+    out["detail_url"] = raw.get("url") or url
+    return out
 
-    tel_li = safe_find(driver, By.CSS_SELECTOR, "li.Info_item__bDb4b [data-label='tel'] + div span.Info_txt__5XJl0", timeout=2)
-    if not tel_li:
-        tel_li = safe_find(driver, By.CSS_SELECTOR, "li.Info_item__bDb4b i[data-label='tel'] ~ div span.Info_txt__5XJl0", timeout=2)
-    if tel_li:
-        tel_text = text_or_empty(tel_li).replace("복사", "").strip()
-        out["tel"] = tel_text
+def panel_ratings(raw: Optional[Dict]) -> Dict[str, str]:
+    out = {key: "" for _, key in RATING_LABELS}
+    for label, val in (raw or {}).get("ratings") or []:
+        for kor, key in RATING_LABELS:
+            if kor in label:
+                out[key] = val
+                break
+    return out
 
+@timed("parse_panel")
+def parse_panel(driver, fallback_name: str = "", timeout: float = 10) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """상세 필드와 평점을 한 번에: (detail, ratings)"""
+    raw = read_panel(driver, timeout)
     try:
-        out["detail_url"] = driver.current_url
+        url = driver.current_url
     except Exception:
-        pass
+        url = ""
+    return panel_detail(raw, url, fallback_name), panel_ratings(raw)
 
-    return out
+def parse_detail_panel(driver, fallback_name: str = "") -> Dict[str, str]:
+    return parse_panel(driver, fallback_name)[0]
 
 def parse_ratings_from_detail(driver) -> Dict[str, str]:
-    out = {"hotelscombined": "", "booking": "", "tripadvisor": "", "naver": ""}
-    pairs = [
-        ("호텔스컴바인", "hotelscombined"),
-        ("부킹닷컴", "booking"),
-        ("트립어드바이저", "tripadvisor"),
-        ("네이버", "naver"),
-    ]
-    try:
-        blocks = driver.find_elements(By.CSS_SELECTOR, "li.Info_item__bDb4b i[data-label='rating'] ~ div span.Info_txt__5XJl0")
-        if not blocks:
-            blocks = driver.find_elements(By.CSS_SELECTOR, "li.Info_item__bDb4b")
-        for b in blocks:
-            try:
-                a = b.find_element(By.CSS_SELECTOR, "a.Info_link__ikjyU")
-                label = a.text.strip()
-                val_el = b.find_element(By.CSS_SELECTOR, "b.Info_current__Ocnim")
-                val = val_el.text.strip()
-                for kor, key in pairs:
-                    if kor in label:
-                        out[key] = val
-                        break
-            except Exception:
-                continue
-    except Exception:
-        pass
-    return out
+    return panel_ratings(read_panel(driver, timeout=0))
 
+@timed("collect_cards")
 def collect_cards(driver) -> List:
     no_item = driver.find_elements(By.CSS_SELECTOR, "div.Condition_NoItemWithCondition__hPSou")
     if no_item:
@@ -310,18 +986,31 @@ def collect_cards(driver) -> List:
         return cards
     return []
 
-def open_card(driver, card, detail_pause: float, prefix: str):
+@timed("open_card")
+def open_card(driver, card, detail_pause: float, prefix: str, readiness: Optional[Readiness] = None):
     try:
         info = card.find_element(By.CSS_SELECTOR, "div[class*=SearchList_InfoArea]")
     except Exception:
         info = card
     driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", info)
-    sleep_jitter(0.12)
+    if readiness:
+        prev = driver.execute_script(
+            "const el = document.querySelector(arguments[0]); return el ? el.textContent.trim() : '';",
+            PANEL_NAME_SELECTOR) or ""
+    else:
+        sleep_jitter(0.12)
+    throttle()
     try:
         info.click()
     except ElementClickInterceptedException:
         driver.execute_script("arguments[0].click();", info)
 
+    if readiness:
+        # 이전 카드의 이름과 다른 텍스트가 패널에 뜨고 DOM 이 안정되면 진행
+        if not readiness.wait(driver, [PANEL_NAME_SELECTOR], 0.12 + detail_pause + 2 * JITTER_MEAN, not_text=prev):
+            raise TimeoutException("detail panel not ready")
+        return
+
     WebDriverWait(driver, 12).until(EC.presence_of_element_located((By.CSS_SELECTOR, "div.Info_Info__Nutkw")))
     try:
         _ = wait_text_nonempty(driver, "h3.Info_name__ogaJE span.Info_txt__5XJl0", timeout=8)
@@ -329,11 +1018,17 @@ def open_card(driver, card, detail_pause: float, prefix: str):
         pass
     sleep_jitter(detail_pause)
 
+@timed("list_page")
 def go_list_page(driver, region_code: str, ptype: int, page: int,
-                 page_pause: float, prefix: str) -> bool:
+                 page_pause: float, prefix: str, readiness: Optional[Readiness] = None) -> bool:
     url = list_url(region_code, ptype, page=page)
+    throttle()
     driver.get(url)
     log(prefix, f"[PAGE {page}] {url}")
+    if readiness:
+        if not readiness.wait(driver, LIST_READY_SELECTORS, page_pause + JITTER_MEAN):
+            sleep_jitter(0.6)
+        return True
     sleep_jitter(page_pause)
     try:
         WebDriverWait(driver, 10).until(
@@ -355,40 +1050,1140 @@ def has_next(driver) -> bool:
     except Exception:
         return True
 
-# ------------ 파일 I/O ------------
-def write_csv(path: str, rows: List[HotelRow], header: bool = False):
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "a", newline="", encoding="utf-8-sig") as f:
-        w = csv.writer(f)
-        if header:
-            w.writerow([
-                "idx","city","region_idx",
-                "name","name_en","property_type",
-                "grade","tel","address",
-                "rating_hotelscombined","rating_booking","rating_tripadvisor","rating_naver",
-                "website","detail_url",
-            ])
-        for r in rows:
-            w.writerow([
-                r.idx, r.city, r.region_idx,
-                r.name, r.name_en, r.property_type,
-                r.grade, r.tel, r.address,
-                getattr(r, "rating_hotelscombined", ""),
-                getattr(r, "rating_booking", ""),
-                getattr(r, "rating_tripadvisor", ""),
-                getattr(r, "rating_naver", ""),
-                r.website, r.detail_url,
-            ])
+# ------------ 네트워크 캡처 (CDP) ------------
+# 프론트엔드가 목록/상세 데이터를 받아오는 XHR 중 이 문자열을 포함하는 JSON 응답만 캡처
+CAPTURE_URL_HINTS: Tuple[str, ...] = ("/api/", "graphql")
+DEFAULT_CAPTURE_TIMEOUT = 6.0
+
+HOTEL_ID_RE = re.compile(r"^N\d{4,}$")
+HOTEL_URL_ID_RE = re.compile(r"/hotels/(N\d+)")
+
+# HotelRow 필드 ← JSON 키 후보 (앞쪽 우선)
+CAPTURE_FIELD_KEYS: Dict[str, Tuple[str, ...]] = {
+    "hotel_id": ("hotelId", "hotelKey", "nid", "id", "key"),
+    "name": ("name", "hotelName", "koName", "title"),
+    "name_en": ("nameEn", "engName", "enName", "englishName", "hotelNameEn"),
+    "grade": ("gradeText", "grade", "hotelGrade", "starRating", "star"),
+    "tel": ("tel", "phone", "phoneNumber", "telephone"),
+    "address": ("address", "roadAddress", "fullAddress", "addr"),
+    "website": ("homepage", "homepageUrl", "website", "officialUrl"),
+}
+CAPTURE_RATING_KEYS: Tuple[str, ...] = ("ratings", "reviewScores", "scores", "reviews")
+RATING_PROVIDERS: List[Tuple[str, str]] = [
+    ("호텔스컴바인", "hotelscombined"), ("hotelscombined", "hotelscombined"),
+    ("부킹닷컴", "booking"), ("booking", "booking"),
+    ("트립어드바이저", "tripadvisor"), ("tripadvisor", "tripadvisor"),
+    ("네이버", "naver"), ("naver", "naver"),
+]
+
+def hotel_detail_url(region_code: str, hotel_id: str, property_type: int, adult: int = 2, page: int = 1) -> str:
+    return f"{BASE}/{region_code}/hotels/{hotel_id}?adultCnt={adult}&pageIndex={page}&propertyTypes={property_type}"
+
+def hotel_id_from_url(url: str) -> str:
+    m = HOTEL_URL_ID_RE.search(url or "")
+    return m.group(1) if m else ""
+
+def fetch_response_json(driver, request_id: str):
+    try:
+        body = driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+    except Exception:
+        return None
+    text = body.get("body", "") or ""
+    if body.get("base64Encoded"):
+        text = base64.b64decode(text).decode("utf-8", "replace")
+    try:
+        return json.loads(text)
+    except ValueError:
+        return None
+
+def drain_network_json(driver, url_hints: Tuple[str, ...] = CAPTURE_URL_HINTS) -> List[Tuple[str, object]]:
+    """
+    performance 로그를 비우면서 로딩이 끝난 JSON 응답을 (url, payload) 목록으로 반환.
+    로딩이 끝난 모든 요청의 수/인코딩 바이트는 driver._net_traffic 에 누적 (page_traffic 이 가져감)
+    """
+    try:
+        entries = driver.get_log("performance")
+    except Exception:
+        return []
+    # responseReceived 와 loadingFinished 가 서로 다른 drain 에 걸칠 수 있어 드라이버에 보관
+    pending: Dict[str, str] = getattr(driver, "_net_pending", None)
+    if pending is None:
+        pending = {}
+        driver._net_pending = pending
+    out = []
+    n_req, n_bytes = getattr(driver, "_net_traffic", None) or (0, 0)
+    for ent in entries:
+        try:
+            msg = json.loads(ent["message"])["message"]
+        except Exception:
+            continue
+        method = msg.get("method", "")
+        params = msg.get("params", {})
+        if method == "Network.responseReceived":
+            resp = params.get("response", {})
+            url = resp.get("url", "")
+            if "json" in (resp.get("mimeType") or "") and any(h in url for h in url_hints):
+                pending[params.get("requestId")] = url
+        elif method == "Network.loadingFinished":
+            n_req += 1
+            n_bytes += int(params.get("encodedDataLength") or 0)
+            url = pending.pop(params.get("requestId"), None)
+            if url is None:
+                continue
+            payload = fetch_response_json(driver, params.get("requestId"))
+            if payload is not None:
+                out.append((url, payload))
+        elif method == "Network.loadingFailed":
+            pending.pop(params.get("requestId"), None)
+    driver._net_traffic = (n_req, n_bytes)
+    return out
+
+def _json_scalar(d: Dict, keys: Tuple[str, ...]) -> str:
+    for k in keys:
+        v = d.get(k)
+        if isinstance(v, bool) or v is None:
+            continue
+        if isinstance(v, (str, int, float)) and str(v).strip():
+            return str(v).strip()
+    return ""
+
+def _json_ratings(d: Dict) -> Dict[str, str]:
+    out = {"hotelscombined": "", "booking": "", "tripadvisor": "", "naver": ""}
+    for rk in CAPTURE_RATING_KEYS:
+        v = d.get(rk)
+        if isinstance(v, dict):
+            items = [{"provider": k, "score": s} for k, s in v.items()]
+        elif isinstance(v, list):
+            items = [it for it in v if isinstance(it, dict)]
+        else:
+            continue
+        for it in items:
+            label = _json_scalar(it, ("provider", "name", "label", "site", "source")).lower()
+            val = _json_scalar(it, ("score", "value", "rating", "current"))
+            for kw, key in RATING_PROVIDERS:
+                if kw in label:
+                    out[key] = val
+                    break
+    return out
+
+def _json_hotel(d: Dict) -> Optional[Dict[str, str]]:
+    name = _json_scalar(d, CAPTURE_FIELD_KEYS["name"])
+    if not name:
+        return None
+    hid = ""
+    for k in CAPTURE_FIELD_KEYS["hotel_id"]:
+        v = d.get(k)
+        if isinstance(v, str) and HOTEL_ID_RE.match(v.strip()):
+            hid = v.strip()
+            break
+    has_detail = any(_json_scalar(d, CAPTURE_FIELD_KEYS[f]) for f in ("address", "tel"))
+    if not hid and not has_detail:
+        return None
+    h = {f: _json_scalar(d, keys) for f, keys in CAPTURE_FIELD_KEYS.items()}
+    h["hotel_id"] = hid
+    if h["grade"].isdigit():
+        h["grade"] = f"{h['grade']}급"   # DOM 표기(예: 4급)와 맞춤
+    h["ratings"] = _json_ratings(d)
+    return h
+
+def extract_hotels_from_json(payload) -> List[Dict[str, str]]:
+    """스키마를 가정하지 않고 JSON 트리를 순회하며 숙소로 보이는 객체를 순서대로 수집 (hotel_id 기준 중복 제거)"""
+    found: List[Dict[str, str]] = []
+    ids = set()
+
+    def _walk(node):
+        if isinstance(node, dict):
+            h = _json_hotel(node)
+            if h:
+                if h["hotel_id"] and h["hotel_id"] in ids:
+                    return
+                if h["hotel_id"]:
+                    ids.add(h["hotel_id"])
+                found.append(h)
+                return   # 숙소 객체 내부(객실명 등)는 더 내려가지 않음
+            for v in node.values():
+                _walk(v)
+        elif isinstance(node, list):
+            for v in node:
+                _walk(v)
+
+    _walk(payload)
+    return found
+
+def merge_hotel(base: Dict[str, str], extra: Dict[str, str]) -> Dict[str, str]:
+    """목록 JSON 항목에 상세 JSON 값을 덮어씀 (빈 값은 무시)"""
+    out = dict(base)
+    for k, v in extra.items():
+        if k == "ratings":
+            r = dict(out.get("ratings") or {})
+            r.update({rk: rv for rk, rv in (v or {}).items() if rv})
+            out["ratings"] = r
+        elif v:
+            out[k] = v
+    return out
+
+@timed("net_wait")
+def wait_network_hotels(driver, timeout: float = DEFAULT_CAPTURE_TIMEOUT,
+                        want_id: str = "", dump=None) -> List[Dict[str, str]]:
+    """숙소 JSON 이 도착할 때까지 폴링. want_id 지정 시 해당 숙소가 잡히면 즉시 반환"""
+    hotels: List[Dict[str, str]] = []
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        got = drain_network_json(driver)
+        for url, payload in got:
+            hs = extract_hotels_from_json(payload)
+            if hs and dump:
+                dump(payload)
+            hotels.extend(hs)
+        if want_id and any(h["hotel_id"] == want_id for h in hotels):
+            break
+        if hotels and not want_id and not got:
+            break   # 응답이 들어온 뒤 한 번 조용하면 목록 완료로 간주
+        time.sleep(0.1)
+    return hotels
+
+def dump_capture(base_dir: str, kind: str, key: str, payload):
+    """캡처한 원본 응답 저장 (fixture_server.py 가 같은 구조로 재생)"""
+    path = os.path.join(base_dir, kind, f"{key}.json")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False)
+
+# ------------ 카드별 상세 수집 ------------
+# 각 함수는 (card_index, detail, ratings, fail_reason) 를 순서대로 yield
+def iter_dom_details(driver, cards: List, detail_pause: float, prefix: str,
+                     indices: Optional[List[int]] = None, readiness: Optional[Readiness] = None):
+    for ci, card in zip(indices or range(1, len(cards) + 1), cards):
+        try:
+            fb_name = card_name_fallback(card)
+            open_card(driver, card, detail_pause=detail_pause, prefix=prefix, readiness=readiness)
+        except (TimeoutException, StaleElementReferenceException, ElementClickInterceptedException) as e:
+            yield ci, None, None, type(e).__name__
+            continue
+        detail, ratings = parse_panel(driver, fallback_name=fb_name)
+        yield ci, detail, ratings, ""
+
+def iter_network_details(driver, cards: List, net_hotels: List[Dict[str, str]],
+                         region_code: str, property_type_code: int, page: int,
+                         capture_timeout: float, capture_dump_dir: Optional[str], prefix: str,
+                         indices: Optional[List[int]] = None):
+    """
+    목록 카드마다 링크의 숙소 ID 로 목록 JSON 항목을 찾아 채움 (JSON 순서/개수와 무관).
+    JSON 으로 부족하거나 짝이 없는 카드만 열어 상세 JSON 대기 (없으면 DOM 폴백) → 카드마다 행 또는 실패 1건
+    indices: 주어지면 해당 카드 번호(1부터)만 처리. 번호는 항상 페이지 기준 원래 번호
+    """
+    wanted = set(indices) if indices is not None else None
+    by_id = {h["hotel_id"]: h for h in net_hotels if h.get("hotel_id")}
+    hrefs = card_detail_urls(driver, cards)
+    for ci, card in enumerate(cards, start=1):
+        if wanted is not None and ci not in wanted:
+            continue
+        hid = hotel_id_from_url(hrefs[ci - 1])
+        h = by_id.get(hid) if hid else None
+        if h is None:
+            h = {"hotel_id": hid, "name": card_name_fallback(card)}
+        if not (h.get("address") or h.get("tel")):
+            try:
+                drain_network_json(driver)
+                open_card(driver, card, detail_pause=0, prefix=prefix)
+            except (TimeoutException, StaleElementReferenceException, ElementClickInterceptedException) as e:
+                yield ci, None, None, type(e).__name__
+                continue
+            if not h["hotel_id"]:
+                h = dict(h, hotel_id=hotel_id_from_url(driver.current_url))
+            dump = None
+            if capture_dump_dir and h["hotel_id"]:
+                dump = lambda p, hid=h["hotel_id"]: dump_capture(capture_dump_dir, "detail", hid, p)
+            more = [x for x in wait_network_hotels(driver, capture_timeout, want_id=h["hotel_id"], dump=dump)
+                    if not h["hotel_id"] or x["hotel_id"] == h["hotel_id"]]
+            if more:
+                h = merge_hotel(h, more[0])
+            else:
+                dom, dom_ratings = parse_panel(driver, fallback_name=h.get("name", ""))
+                h = merge_hotel(h, {k: v for k, v in dom.items() if k != "detail_url"})
+                h = merge_hotel(h, {"ratings": dom_ratings})
+        durl = hotel_detail_url(region_code, h["hotel_id"], property_type_code, page=page) if h.get("hotel_id") else ""
+        detail = {k: h.get(k, "") for k in ("name", "name_en", "grade", "tel", "address", "website")}
+        detail["detail_url"] = durl
+        yield ci, detail, h.get("ratings") or {}, ""
+
+# ------------ 멀티 탭 상세 수집 ------------
+DEFAULT_TAB_TIMEOUT = 15.0
+
+CARD_HREFS_JS = """
+return arguments[0].map(c => {
+  const a = c.querySelector("a[href*='/hotels/N']") || c.closest("a[href*='/hotels/N']");
+  return a ? a.href : "";
+});
+"""
+# arguments: [이 탭에 연 상세 URL, 이 탭이 직전에 보여준 숙소 이름]. 준비됐으면 숙소 이름, 아니면 ""
+# 재사용 탭은 새 문서가 커밋될 때까지 이전 숙소 패널이 그대로 → 경로가 목표와 같고 이름이 바뀐 뒤에만 준비
+PANEL_READY_JS = """
+const [target, prev] = arguments;
+if (location.pathname !== new URL(target, location.href).pathname) return "";
+const el = document.querySelector("div.Info_Info__Nutkw h3.Info_name__ogaJE span.Info_txt__5XJl0");
+const name = el ? el.textContent.trim() : "";
+return name && name !== prev ? name : "";
+"""
+
+def card_detail_urls(driver, cards: List) -> List[str]:
+    """카드(또는 감싼 a 태그)의 상세 링크. 링크가 없는 카드는 빈 문자열"""
+    try:
+        urls = driver.execute_script(CARD_HREFS_JS, cards) or []
+    except Exception:
+        urls = []
+    return [u or "" for u in urls] if len(urls) == len(cards) else [""] * len(cards)
+
+def ensure_tab_pool(driver, n: int) -> List[str]:
+    """목록 탭 외에 상세용 탭 n개 확보 (드라이버에 보관해 페이지 간 재사용)"""
+    home = driver.current_window_handle
+    alive = set(driver.window_handles)
+    pool = [h for h in (getattr(driver, "_tab_pool", None) or []) if h in alive and h != home]
+    while len(pool) < n:
+        driver.switch_to.new_window("tab")
+        apply_network_settings(driver)
+        pool.append(driver.current_window_handle)
+    driver.switch_to.window(home)
+    driver._tab_pool = pool
+    return pool[:n]
+
+def iter_tab_details(driver, cards: List, tabs: int, detail_pause: float, prefix: str,
+                     timeout: float = DEFAULT_TAB_TIMEOUT, readiness: Optional[Readiness] = None):
+    """
+    상세 링크가 있는 카드는 N개 탭에 나눠 동시에 로딩 → 준비된 탭부터 파싱 (완료 순서대로 yield)
+    링크가 없는 카드는 목록 탭으로 돌아와 기존 클릭 방식으로 처리
+    detail_pause 는 탭 수로 나눠 새 로딩 사이 간격으로만 사용 (전체 요청 속도는 직렬과 비슷하게 유지)
+    """
+    home = driver.current_window_handle
+    fb_names = [card_name_fallback(c) for c in cards]
+    urls = card_detail_urls(driver, cards)
+    work = deque((ci, u, fb_names[ci - 1]) for ci, u in enumerate(urls, start=1) if u)
+    no_url = [ci for ci, u in enumerate(urls, start=1) if not u]
+
+    free = deque(ensure_tab_pool(driver, tabs)) if work else deque()
+    shown = getattr(driver, "_tab_shown", None)   # 탭 → (마지막 상세 URL, 숙소 이름). 페이지를 넘어 재사용
+    if shown is None:
+        shown = driver._tab_shown = {}
+    inflight: Dict[str, Tuple[int, str, float, str, str]] = {}
+    gap = detail_pause / max(1, tabs)
+    while work or inflight:
+        while work and free:
+            ci, url, fb = work.popleft()
+            h = free.popleft()
+            last_url, last_name = shown.get(h, ("", ""))
+            driver.switch_to.window(h)
+            throttle()
+            driver.execute_script("window.location.href = arguments[0];", url)
+            inflight[h] = (ci, fb, time.time(), url, last_name if last_url != url else "")
+            if gap > 0:
+                sleep_jitter(gap)
+        harvested = False
+        for h, (ci, fb, t0, url, prev) in list(inflight.items()):
+            driver.switch_to.window(h)
+            try:
+                name = driver.execute_script(PANEL_READY_JS, url, prev) or ""
+            except Exception:
+                name = ""
+            if name:
+                shown[h] = (url, name)
+                detail, ratings = parse_panel(driver, fallback_name=fb)
+                del inflight[h]
+                free.append(h)
+                harvested = True
+                yield ci, detail, ratings, ""
+            elif time.time() - t0 > timeout:
+                del inflight[h]
+                free.append(h)
+                harvested = True
+                yield ci, None, None, "TimeoutException"
+        if not harvested:
+            time.sleep(0.05)
+
+    driver.switch_to.window(home)
+    if no_url:
+        yield from iter_dom_details(driver, [cards[ci - 1] for ci in no_url], detail_pause, prefix,
+                                    indices=no_url, readiness=readiness)
+
+# ------------ HTTP 백엔드 (브라우저 없음) ------------
+# make_driver 와 같은 자리에 들어가는 두 번째 백엔드: keep-alive 세션 + lxml 파서
+BACKENDS: Tuple[str, ...] = ("chrome", "http")
+DEFAULT_HTTP_CONCURRENCY = 8
+HTTP_USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                   "(KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36")
+
+def _xp_has(part: str) -> str:
+    """CSS [class*=part] 에 해당하는 XPath 조건"""
+    return f"contains(@class, '{part}')"
+
+def _xp_cls(cls: str) -> str:
+    """CSS .cls 에 해당하는 XPath 조건"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')"
+
+def node_text(el) -> str:
+    if el is None:
+        return ""
+    try:
+        return " ".join(el.text_content().split())
+    except Exception:
+        return ""
+
+def xfirst(ctx, xp: str):
+    try:
+        r = ctx.xpath(xp)
+    except Exception:
+        return None
+    return r[0] if r else None
+
+class HttpBackend:
+    """Chrome 없이 목록/상세 HTML 을 받아 파싱. crawl_region_property 에 driver 자리로 전달"""
+
+    def __init__(self, pool_size: int = DEFAULT_HTTP_CONCURRENCY, user_agent: Optional[str] = None,
+                 timeout: float = 15.0, retries: int = 2):
+        if requests is None or lxml is None:
+            raise RuntimeError("HTTP 백엔드에는 requests, lxml 패키지가 필요합니다")
+        self.session = requests.Session()
+        retry = Retry(total=retries, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({
+            "User-Agent": user_agent or HTTP_USER_AGENT,
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
+        })
+        self.timeout = timeout
+        self.concurrency = pool_size
+        self.current_url = ""
+        self.doc = None
+
+    def fetch(self, url: str):
+        throttle()
+        return self._fetch(url)
+
+    @timed("http_fetch")
+    def _fetch(self, url: str):
+        r = self.session.get(url, timeout=self.timeout)
+        r.raise_for_status()
+        return lxml.html.fromstring(r.content.decode("utf-8", "replace"), base_url=r.url)
+
+    def get(self, url: str):
+        self.doc = self.fetch(url)
+        self.current_url = url
+
+    def quit(self):
+        self.session.close()
+
+def make_backend(backend: str = "chrome", http_concurrency: int = DEFAULT_HTTP_CONCURRENCY, **driver_kwargs):
+    """backend="chrome" → make_driver(**driver_kwargs), "http" → HttpBackend"""
+    if backend == "http":
+        return HttpBackend(pool_size=http_concurrency, user_agent=driver_kwargs.get("user_agent"))
+    if backend != "chrome":
+        raise ValueError(f"알 수 없는 backend: {backend} (가능: {BACKENDS})")
+    return make_driver(**driver_kwargs)
+
+def html_embedded_hotels(doc) -> List[Dict[str, str]]:
+    """SSR 페이지에 심어진 JSON(__NEXT_DATA__ 등)에서 숙소 추출"""
+    out: List[Dict[str, str]] = []
+    if doc is None:
+        return out
+    for txt in doc.xpath("//script[@id='__NEXT_DATA__' or @type='application/json']/text()"):
+        try:
+            out.extend(extract_hotels_from_json(json.loads(txt)))
+        except ValueError:
+            continue
+    return out
+
+@timed("list_page")
+def http_go_list_page(hb: HttpBackend, region_code: str, ptype: int, page: int,
+                      page_pause: float, prefix: str) -> bool:
+    """요청 실패는 예외 그대로 (go_list_page 와 같음) → 조합을 끝난 것으로 보지 않고 저널 재개/재기동"""
+    url = list_url(region_code, ptype, page=page)
+    log(prefix, f"[PAGE {page}] {url}")
+    try:
+        hb.get(url)
+    except Exception as e:
+        log(prefix, f"[WARN] HTTP 목록 요청 실패: {type(e).__name__}: {e}")
+        raise
+    if page_pause > 0:
+        sleep_jitter(page_pause)
+    return True
+
+def http_no_items(hb: HttpBackend) -> bool:
+    """목록 HTML 에 '조건에 맞는 숙소 없음' 표시가 있는지 (빈 목록으로 확정할 수 있는 유일한 신호)"""
+    return hb.doc is not None and bool(hb.doc.xpath(f"//div[{_xp_cls('Condition_NoItemWithCondition__hPSou')}]"))
+
+@timed("collect_cards")
+def http_collect_cards(hb: HttpBackend, region_code: str, ptype: int, page: int) -> List[Tuple[str, str]]:
+    """목록 HTML → [(카드 이름, 상세 URL)]. 카드에 링크가 없으면 심어진 JSON 의 순서로 보완"""
+    doc = hb.doc
+    if doc is None or http_no_items(hb):
+        return []
+    cards = doc.xpath(f"//ul[{_xp_has('SearchList_SearchList')}]//li[{_xp_has('SearchList_item')}]"
+                      f"//div[{_xp_has('HotelItem')}]")
+    embedded = html_embedded_hotels(doc)
+    refs: List[Tuple[str, str]] = []
+    for ci, card in enumerate(cards):
+        name = ""
+        for xp in (f".//div[{_xp_has('SearchList_InfoArea')}]//h3", ".//h3", ".//strong"):
+            name = node_text(xfirst(card, xp))
+            if name:
+                break
+        href = xfirst(card, ".//a[contains(@href, '/hotels/N')]/@href") or \
+               xfirst(card, "ancestor::a[contains(@href, '/hotels/N')][1]/@href")
+        url = urljoin(hb.current_url, href) if href else ""
+        if not url and ci < len(embedded) and embedded[ci]["hotel_id"]:
+            url = hotel_detail_url(region_code, embedded[ci]["hotel_id"], ptype, page=page)
+        refs.append((name, url))
+    if not cards:
+        refs = [(h["name"], hotel_detail_url(region_code, h["hotel_id"], ptype, page=page))
+                for h in embedded if h["hotel_id"]]
+    return refs
+
+def http_has_next(hb: HttpBackend) -> bool:
+    btns = hb.doc.xpath(f"//a[{_xp_has('Pagination_next')}] | //button[@aria-label='다음']") if hb.doc is not None else []
+    if not btns:
+        return True
+    def _usable(b):
+        style = (b.get("style") or "").replace(" ", "").lower()
+        return b.get("disabled") is None and b.get("aria-disabled") != "true" and "display:none" not in style
+    return any(_usable(b) for b in btns)
+
+@timed("parse_panel")
+def parse_detail_html(doc, url: str, fallback_name: str = "") -> Dict[str, str]:
+    """parse_detail_panel 과 같은 셀렉터/후처리를 lxml 문서에 적용"""
+    out = {"name":"", "name_en":"", "grade":"", "tel":"", "address":"", "website":"", "detail_url":url}
+    if xfirst(doc, f"//div[{_xp_cls('Info_Info__Nutkw')}]") is None:
+        hid = hotel_id_from_url(url)
+        for h in html_embedded_hotels(doc):
+            if not hid or h["hotel_id"] == hid:
+                out.update({k: h.get(k, "") for k in ("name", "name_en", "grade", "tel", "address", "website")})
+                break
+        if not out["name"]:
+            out["name"] = fallback_name
+        return out
+
+    txt = f"span[{_xp_cls('Info_txt__5XJl0')}]"
+    item = f"li[{_xp_cls('Info_item__bDb4b')}]"
+    out["name"] = node_text(xfirst(doc, f"//h3[{_xp_cls('Info_name__ogaJE')}]//{txt}")) or fallback_name
+    out["name_en"] = node_text(xfirst(doc, f"//i[{_xp_cls('Info_eng__InlcK')}]"))
+    out["grade"] = node_text(xfirst(doc, f"//div[{_xp_cls('Info_grade__Xn_uy')}]//i[{_xp_cls('Info_gradetxt___V9AF')}]"))
+    out["website"] = xfirst(doc, f"//li[{_xp_cls('Info_item__bDb4b')} and {_xp_cls('homepage')}]"
+                                 f"//a[{_xp_cls('Info_link__ikjyU')}]/@href") or ""
+    out["address"] = node_text(xfirst(doc, f"//li[{_xp_cls('Info_item__bDb4b')} and {_xp_cls('address')}]//{txt}"))
+    tel_el = xfirst(doc, f"//{item}//*[@data-label='tel']/following-sibling::*[1][self::div]//{txt}")
+    if tel_el is None:
+        tel_el = xfirst(doc, f"//{item}//i[@data-label='tel']/following-sibling::div//{txt}")
+    out["tel"] = node_text(tel_el)
+    return out
+
+def parse_ratings_html(doc) -> Dict[str, str]:
+    out = {"hotelscombined": "", "booking": "", "tripadvisor": "", "naver": ""}
+    pairs = [
+        ("호텔스컴바인", "hotelscombined"),
+        ("부킹닷컴", "booking"),
+        ("트립어드바이저", "tripadvisor"),
+        ("네이버", "naver"),
+    ]
+    item = f"li[{_xp_cls('Info_item__bDb4b')}]"
+    blocks = doc.xpath(f"//{item}//i[@data-label='rating']/following-sibling::div//span[{_xp_cls('Info_txt__5XJl0')}]")
+    if not blocks:
+        blocks = doc.xpath(f"//{item}")
+    for b in blocks:
+        a = xfirst(b, f".//a[{_xp_cls('Info_link__ikjyU')}]")
+        v = xfirst(b, f".//b[{_xp_cls('Info_current__Ocnim')}]")
+        if a is None or v is None:
+            continue
+        label = node_text(a)
+        for kor, key in pairs:
+            if kor in label:
+                out[key] = node_text(v)
+                break
+    return out
+
+def iter_http_details(hb: HttpBackend, refs: List[Tuple[str, str]], detail_pause: float, prefix: str):
+    """상세 페이지를 세션 풀 크기만큼 동시에 받아 카드 순서대로 yield"""
+    def _one(arg):
+        ci, (fb_name, url) = arg
+        if not url:
+            return ci, None, None, "http:no_detail_url"
+        if detail_pause > 0:
+            sleep_jitter(detail_pause)
+        try:
+            doc = hb.fetch(url)
+        except Exception as e:
+            return ci, None, None, f"http:{type(e).__name__}"
+        return ci, parse_detail_html(doc, url, fallback_name=fb_name), parse_ratings_html(doc), ""
+
+    with ThreadPoolExecutor(max_workers=max(1, hb.concurrency)) as ex:
+        for item in ex.map(_one, enumerate(refs, start=1)):
+            yield item
+
+# ------------ 파일 I/O ------------
+RESULT_COLS = ["idx","city","region_idx","name","name_en","property_type",
+               "grade","tel","address","rating_hotelscombined","rating_booking",
+               "rating_tripadvisor","rating_naver","website","detail_url"]
+
+def hotel_row_values(r: HotelRow) -> List:
+    return [
+        r.idx, r.city, r.region_idx,
+        r.name, r.name_en, r.property_type,
+        r.grade, r.tel, r.address,
+        getattr(r, "rating_hotelscombined", ""),
+        getattr(r, "rating_booking", ""),
+        getattr(r, "rating_tripadvisor", ""),
+        getattr(r, "rating_naver", ""),
+        r.website, r.detail_url,
+    ]
+
+def write_csv(path: str, rows: List[HotelRow], header: bool = False):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "a", newline="", encoding="utf-8-sig") as f:
+        w = csv.writer(f)
+        if header:
+            w.writerow(RESULT_COLS)
+        for r in rows:
+            w.writerow(hotel_row_values(r))
+
+@timed("checkpoint")
+def write_failures(path: str, failures: List[Dict], header: bool = False):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "a", newline="", encoding="utf-8-sig") as f:
+        w = csv.writer(f)
+        if header:
+            w.writerow(["city", "property_type", "page", "card_index", "reason", "page_url"])
+        for it in failures:
+            w.writerow([it.get("city",""), it.get("property_type",""), it.get("page",0),
+                        it.get("card_index",-1), it.get("reason",""), it.get("page_url","")])
+
+# ------------ 컬럼형 출력 (Parquet) ------------
+OUT_FORMATS = ("csv", "parquet", "both")
+RATING_COLS = ("rating_hotelscombined", "rating_booking", "rating_tripadvisor", "rating_naver")
+NUM_RE = re.compile(r"\d+(?:\.\d+)?")
+
+def result_schema():
+    cat = pa.dictionary(pa.int32(), pa.string())
+    types = {"idx": pa.int64(), "region_idx": pa.int64(), "city": cat, "property_type": cat}
+    types.update({c: pa.float64() for c in RATING_COLS})
+    return pa.schema([(c, types.get(c, pa.string())) for c in RESULT_COLS])
+
+def to_float(v) -> Optional[float]:
+    if v is None or v == "":
+        return None
+    if isinstance(v, (int, float)):
+        return float(v)
+    m = NUM_RE.search(str(v).replace(",", "."))
+    return float(m.group(0)) if m else None
+
+def to_int(v) -> Optional[int]:
+    try:
+        return int(v)
+    except (TypeError, ValueError):
+        return None
+
+def rows_to_table(rows: List[List]):
+    """RESULT_COLS 순서의 행 목록 → 타입 지정 Arrow 테이블 (평점 float, city/property_type 사전 인코딩)"""
+    schema = result_schema()
+    cols = list(zip(*rows)) if rows else [()] * len(RESULT_COLS)
+    arrays = []
+    for field, vals in zip(schema, cols):
+        if pa.types.is_floating(field.type):
+            vals = [to_float(v) for v in vals]
+        elif pa.types.is_integer(field.type):
+            vals = [to_int(v) for v in vals]
+        else:
+            vals = ["" if v is None else str(v) for v in vals]
+        arrays.append(pa.array(vals, type=field.type))
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+def table_str_rows(table) -> List[List[str]]:
+    """Arrow 테이블 → CSV 와 같은 문자열 행 (병합 입력용)"""
+    cols = []
+    for c in RESULT_COLS:
+        vals = table.column(c).to_pylist() if c in table.column_names else [None] * table.num_rows
+        cols.append(["" if v is None else (f"{v:g}" if isinstance(v, float) else str(v)) for v in vals])
+    return [list(r) for r in zip(*cols)]
+
+def parquet_segment_path(out_csv: str) -> str:
+    """조합 CSV 옆의 새 Parquet 세그먼트 경로 (재시작/샤드마다 새 파일: {stem}.{n}.parquet)"""
+    stem = os.path.splitext(out_csv)[0]
+    n = 0
+    while os.path.exists(f"{stem}.{n}.parquet"):
+        n += 1
+    return f"{stem}.{n}.parquet"
+
+class ResultSink:
+    """
+    결과 행 출력 대상. out_format: "csv" | "parquet" | "both"
+    - csv: 기존 write_csv 추가 기록
+    - parquet: write() 한 번(= 체크포인트 1회)이 row group 1개, close()/flush() 시 footer 기록
+      (footer 전에 프로세스가 죽으면 해당 세그먼트는 읽을 수 없음 → 저널 커밋 전에 flush() 로 세그먼트를 닫음)
+    - store: 주어지면 조합별 파일 대신 공유 결과 저장소에 upsert (out_format 은 최종 출력에만 적용)
+    """
+    def __init__(self, out_csv: str, out_format: str = "csv", store: Optional["ResultStore"] = None):
+        if out_format not in OUT_FORMATS:
+            raise ValueError(f"알 수 없는 out_format: {out_format} (가능: {OUT_FORMATS})")
+        if out_format != "csv" and pa is None:
+            raise RuntimeError("Parquet 출력에는 pyarrow 패키지가 필요합니다")
+        self.out_csv = out_csv
+        self.store = store
+        self.csv = out_format in ("csv", "both") and store is None
+        self.parquet = out_format in ("parquet", "both") and store is None
+        self.path = ""
+        self._writer = None
+
+    @timed("checkpoint")
+    def write(self, rows: List[HotelRow]):
+        if self.store and rows:
+            self.store.upsert(rows)
+        if self.csv:
+            write_csv(self.out_csv, rows, header=False)
+        if self.parquet and rows:
+            if self._writer is None:
+                self.path = parquet_segment_path(self.out_csv)
+                self._writer = pq.ParquetWriter(self.path, result_schema(), compression="zstd")
+            self._writer.write_table(rows_to_table([hotel_row_values(r) for r in rows]))
+
+    def flush(self):
+        """지금까지 쓴 행을 읽을 수 있게 확정 (Parquet 세그먼트를 닫고 다음 write 는 새 세그먼트). 저널 커밋 직전 호출"""
+        self.close()
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+def parquet_segments(out_csv: str) -> List[str]:
+    """out_csv 옆의 Parquet 세그먼트 ({stem}.{n}.parquet) 를 n 순서로"""
+    d, stem = os.path.split(os.path.splitext(out_csv)[0])
+    pat = re.compile(re.escape(stem) + r"\.(\d+)\.parquet$")
+    found = [(int(m.group(1)), f) for f in os.listdir(d or ".") for m in [pat.match(f)] if m]
+    return [os.path.join(d, f) for _, f in sorted(found)]
+
+# ------------ 출력 정규화 (병합 시 일괄) ------------
+# 크롤 루프는 추출한 값을 그대로 기록하고, 병합에서 컬럼 단위로 한 번에 정리 → 중복 제거/근접 중복 키의 기준값
+WS_RE = re.compile(r"\s+")                                       # \u00a0 포함
+ADDR_NOISE_RE = re.compile(r"\s*(?:위치|길찾기|거리뷰)\s*")        # 주소 줄에 붙는 지도 버튼 문구
+TEL_NOISE_RE = re.compile(r"복사|전화|tel\.?:?", re.I)
+TEL_SPLIT_RE = re.compile(r"[,/]")
+# 번호 모양 토큰만: 0(또는 +82)으로 시작하는 지역/휴대/050 번호, 15xx-xxxx 대표번호. 뒤의 내선/범위(~8) 문구는 버림
+TEL_TOKEN_RE = re.compile(r"(?<![\d+])(?:\+82[\s.-]*(?:\(0\))?[\s.-]*|0)(\d{1,3})[\s.)-]*(\d{3,4})[\s.-]*(\d{4})(?!\d)"
+                          r"|(?<![\d+])(1[5-9]\d{2})[\s.-]*(\d{4})(?!\d)")
+NON_DIGIT_RE = re.compile(r"\D+")
+GRADE_STAR_RE = re.compile(r"^([1-5])\s*(?:성급|성|-?stars?)$", re.I)
+GRADE_CLASS_RE = re.compile(r"^(특\s*)?([1-3])\s*급$")
+
+def collapse_ws(s: str) -> str:
+    return WS_RE.sub(" ", s).strip()
+
+def normalize_address(s: str) -> str:
+    return WS_RE.sub(" ", ADDR_NOISE_RE.sub(" ", s)).strip()
+
+def format_tel(d: str) -> str:
+    """숫자만 남은 국내 번호 → 하이픈 표기 (02-123-4567, 010-1234-5678, 1588-1234, 0507-1234-5678)"""
+    if len(d) == 8 and d[0] in "156":
+        return f"{d[:4]}-{d[4:]}"
+    if d.startswith("02") and len(d) in (9, 10):
+        return f"02-{d[2:-4]}-{d[-4:]}"
+    if d.startswith("050") and len(d) == 12:
+        return f"{d[:4]}-{d[4:8]}-{d[8:]}"
+    if d.startswith("0") and len(d) in (10, 11):
+        return f"{d[:3]}-{d[3:-4]}-{d[-4:]}"
+    return d
+
+@functools.lru_cache(maxsize=65536)
+def canonical_tel(raw: str) -> str:
+    """
+    '복사' 등 버튼 문구 제거, +82 → 0, 번호별 하이픈 표기 통일 (여러 번호는 ', ' 로 연결)
+    번호 모양 토큰만 골라 내선/범위 문구는 버리고, 번호가 없는 조각은 원문 유지 (숫자를 이어 붙여 새 번호를 만들지 않음)
+    """
+    out = []
+    for part in TEL_SPLIT_RE.split(TEL_NOISE_RE.sub(" ", raw)):
+        found = False
+        for m in TEL_TOKEN_RE.finditer(part):
+            found = True
+            out.append(format_tel(m.group(4) + m.group(5) if m.group(4) else "0" + "".join(m.group(1, 2, 3))))
+        if not found and collapse_ws(part):
+            out.append(collapse_ws(part))
+    return ", ".join(out)
+
+def tel_digits(tel: str) -> str:
+    """중복 판단용 키: 첫 번호의 숫자만"""
+    return NON_DIGIT_RE.sub("", tel.split(",", 1)[0])
+
+@functools.lru_cache(maxsize=1024)
+def canonical_grade(raw: str) -> str:
+    """성급(3성, 3 성급, ★★★, 3-star → 3성급)과 등급(특 1 급 → 특1급) 표기 통일. 두 체계는 서로 바꾸지 않음"""
+    s = collapse_ws(raw)
+    if s and set(s) <= {"★", "☆"}:
+        return f"{s.count('★')}성급" if "★" in s else ""
+    m = GRADE_STAR_RE.match(s)
+    if m:
+        return f"{m.group(1)}성급"
+    m = GRADE_CLASS_RE.match(s)
+    if m:
+        return f"{'특' if m.group(1) else ''}{m.group(2)}급"
+    return s
+
+@functools.lru_cache(maxsize=4096)
+def canonical_rating(raw: str) -> str:
+    """'8.5점', '8,5', '4.37/5' → 숫자 문자열 (Parquet 의 float 표기와 동일)"""
+    v = to_float(raw)
+    return "" if v is None else f"{v:g}"
+
+NORMALIZERS = {
+    "name": collapse_ws,
+    "name_en": collapse_ws,
+    "grade": canonical_grade,
+    "tel": canonical_tel,
+    "address": normalize_address,
+    "website": str.strip,
+    **{c: canonical_rating for c in RATING_COLS},
+}
+_NORM_COLS = [(RESULT_COLS.index(c), fn) for c, fn in NORMALIZERS.items()]
+
+def normalize_rows(rows: List[List[str]]) -> List[List[str]]:
+    """RESULT_COLS 순서 행 목록을 컬럼 단위로 정규화 (제자리 수정, 멱등)"""
+    for i, fn in _NORM_COLS:
+        col = list(map(fn, [r[i] or "" for r in rows]))
+        for r, v in zip(rows, col):
+            r[i] = v
+    return rows
+
+def iter_row_batches(rows, size: int = 5_000):
+    """dict 행 스트림 → RESULT_COLS 순서 리스트 행 묶음"""
+    batch = []
+    for r in rows:
+        batch.append([r.get(c) or "" for c in RESULT_COLS])
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def normalize_csv(path: str, prefix: str = "", segments: Optional[List[str]] = None):
+    """
+    결과 CSV 하나를 제자리 정규화 (병합을 거치지 않는 단일 프로세스 실행용)
+    segments: 주면 CSV 대신 이 Parquet 세그먼트들을 읽어 path 에 정규화된 최종 CSV 기록 (out_format="parquet")
+    """
+    if segments is None and not os.path.exists(path):
+        return
+    if segments is None:
+        rows = iter_csv_rows(path, prefix)
+    else:
+        rows = chain.from_iterable(iter_parquet_rows(seg, prefix) for seg in segments)
+    part, n = path + ".part", 0
+    with open(part, "w", newline="", encoding="utf-8-sig") as f:
+        w = csv.writer(f, lineterminator="\n")
+        w.writerow(RESULT_COLS)
+        for batch in iter_row_batches(rows):
+            w.writerows(normalize_rows(batch))
+            n += len(batch)
+    os.replace(part, path)
+    log(prefix, f"[NORMALIZE] {n} rows → {path}")
+
+# ------------ 재개 저널 (SQLite WAL) ------------
+class CrawlJournal:
+    """
+    크래시 안전 재개 기록. 페이지 결과를 CSV 에 flush 한 뒤에 커밋하므로
+    커밋된 페이지는 항상 파일에 있음 (커밋 직전 크래시 → 해당 페이지만 재수집, 병합 시 중복 제거)
+    """
+
+    def __init__(self, path: str):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS pages (
+                combo TEXT NOT NULL, page INTEGER NOT NULL, cards INTEGER NOT NULL,
+                ok INTEGER NOT NULL, fail INTEGER NOT NULL, done_at REAL NOT NULL,
+                PRIMARY KEY (combo, page));
+            CREATE TABLE IF NOT EXISTS urls (
+                combo TEXT NOT NULL, detail_url TEXT NOT NULL,
+                PRIMARY KEY (combo, detail_url));
+            CREATE TABLE IF NOT EXISTS combos (
+                combo TEXT PRIMARY KEY, end_page INTEGER NOT NULL, done_at REAL NOT NULL);
+        """)
+
+    def combo_end(self, combo: str) -> Optional[int]:
+        r = self.conn.execute("SELECT end_page FROM combos WHERE combo=?", (combo,)).fetchone()
+        return r[0] if r else None
+
+    def done_pages(self, combo: str) -> Dict[int, int]:
+        """완료된 페이지 → 카드 수"""
+        return dict(self.conn.execute("SELECT page, cards FROM pages WHERE combo=?", (combo,)))
+
+    def seen_urls(self, combo: str) -> set:
+        return {r[0] for r in self.conn.execute("SELECT detail_url FROM urls WHERE combo=?", (combo,))}
+
+    @timed("journal_commit")
+    def commit_page(self, combo: str, page: int, cards: int, ok: int, fail: int, urls: List[str]):
+        with self.conn:
+            self.conn.execute("BEGIN IMMEDIATE")
+            self.conn.executemany("INSERT OR IGNORE INTO urls VALUES (?, ?)", [(combo, u) for u in urls])
+            self.conn.execute("INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?)",
+                              (combo, page, cards, ok, fail, time.time()))
+
+    def finish_combo(self, combo: str, end_page: int):
+        with self.conn:
+            # 샤드 여러 개가 끝을 보고할 수 있어 가장 앞선 페이지 유지
+            self.conn.execute("INSERT INTO combos VALUES (?, ?, ?) ON CONFLICT(combo) DO UPDATE SET "
+                              "end_page=MIN(end_page, excluded.end_page)", (combo, end_page, time.time()))
+
+    def close(self):
+        try:
+            self.conn.close()
+        except Exception:
+            pass
+
+_JOURNALS: Dict[str, CrawlJournal] = {}
+
+def get_journal(path: Optional[str]) -> Optional[CrawlJournal]:
+    """프로세스별 저널 연결 (sqlite 연결은 프로세스 간 공유 불가)"""
+    if not path:
+        return None
+    if path not in _JOURNALS:
+        _JOURNALS[path] = CrawlJournal(path)
+    return _JOURNALS[path]
+
+# ------------ 공유 결과 저장소 (SQLite WAL upsert) ------------
+class ResultStore:
+    """
+    워커 전체가 쓰는 결과 테이블. 체크포인트마다 묶음 upsert, 숙소 키 UNIQUE 인덱스로 중복 제거.
+    - 키: 상세 URL 의 숙소 ID(N…), 없으면 정규화된 이름|주소
+    - 같은 키를 다시 쓰면 비어 있지 않은 새 값만 덮어씀 (city/property_type 과 처음 들어온 순서 seq 는 유지)
+    - 행은 쓰기 전에 normalize_rows 로 정리, idx/region_idx 는 저장하지 않고 내보낼 때 정렬 순서로 부여
+    - WAL 이라 크롤 중에도 다른 연결에서 읽을 수 있음 (summary / export_store)
+    """
+    COLS = [c for c in RESULT_COLS if c not in ("idx", "region_idx")]
+    KEEP = ("city", "property_type")
+    _VALS = [RESULT_COLS.index(c) for c in COLS]
+    _URL, _NAME, _ADDR = (RESULT_COLS.index(c) for c in ("detail_url", "name", "address"))
+
+    def __init__(self, path: str):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        cols = ", ".join(f"{c} TEXT NOT NULL DEFAULT ''" for c in self.COLS)
+        self.conn.executescript(f"""
+            CREATE TABLE IF NOT EXISTS hotels (
+                seq INTEGER PRIMARY KEY, hotel_key TEXT NOT NULL, {cols}, updated_at REAL NOT NULL);
+            CREATE UNIQUE INDEX IF NOT EXISTS hotels_key ON hotels (hotel_key);
+            CREATE INDEX IF NOT EXISTS hotels_order ON hotels (city, property_type, name);
+        """)
+        sets = ", ".join(f"{c}=COALESCE(NULLIF(excluded.{c}, ''), {c})" for c in self.COLS if c not in self.KEEP)
+        self._upsert = (f"INSERT INTO hotels (hotel_key, {', '.join(self.COLS)}, updated_at) "
+                        f"VALUES ({', '.join('?' * (len(self.COLS) + 2))}) "
+                        f"ON CONFLICT(hotel_key) DO UPDATE SET {sets}, updated_at=excluded.updated_at")
+
+    @classmethod
+    def row_key(cls, row: List[str]) -> str:
+        return hotel_id_from_url(row[cls._URL]) or f"{row[cls._NAME]}|{row[cls._ADDR]}"
+
+    def upsert(self, rows: List[HotelRow]):
+        vals = normalize_rows([["" if v is None else str(v) for v in hotel_row_values(r)] for r in rows])
+        now = time.time()
+        params = [(self.row_key(v), *(v[i] for i in self._VALS), now) for v in vals]
+        with self.conn:
+            self.conn.execute("BEGIN IMMEDIATE")
+            self.conn.executemany(self._upsert, params)
+
+    def count(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM hotels").fetchone()[0]
+
+    def summary(self) -> List[Tuple[str, str, int]]:
+        """(city, property_type, 행 수) — 실행 중간 확인용"""
+        return self.conn.execute("SELECT city, property_type, COUNT(*) FROM hotels "
+                                 "GROUP BY city, property_type ORDER BY city, property_type").fetchall()
+
+    def iter_rows(self):
+        """merge_sort_key 와 같은 순서의 RESULT_COLS 행 스트림 (idx/region_idx 자리는 빈 값)"""
+        cur = self.conn.execute(f"SELECT {', '.join(self.COLS)} FROM hotels ORDER BY "
+                                f"city='', city, property_type='', property_type, name='', name, seq")
+        pos = [self.COLS.index(c) if c in self.COLS else None for c in RESULT_COLS]
+        for rec in cur:
+            yield ["" if i is None else rec[i] for i in pos]
+
+    def close(self):
+        try:
+            self.conn.close()
+        except Exception:
+            pass
+
+_STORES: Dict[str, ResultStore] = {}
+
+def get_result_store(path: Optional[str]) -> Optional[ResultStore]:
+    """프로세스별 저장소 연결 (get_journal 과 같은 이유)"""
+    if not path:
+        return None
+    if path not in _STORES:
+        _STORES[path] = ResultStore(path)
+    return _STORES[path]
+
+# ------------ 증분 재수집 (카드 지문) ------------
+# 카드에 보이는 링크/이름/등급만으로 지문 생성 (가격 등 매일 바뀌는 값은 제외)
+CARD_FINGERPRINT_JS = """
+return arguments[0].map(c => {
+  const a = c.querySelector("a[href*='/hotels/N']") || c.closest("a[href*='/hotels/N']");
+  const n = c.querySelector("div[class*=SearchList_InfoArea] h3") || c.querySelector("h3") || c.querySelector("strong");
+  const g = Array.from(c.querySelectorAll("[class*=grade], [class*=Grade]")).map(e => e.textContent.trim()).join("|");
+  return [a ? a.href : "", n ? n.textContent.trim() : "", g];
+});
+"""
+FP_HEADER = ["city", "property_type", "hotel_key", "fingerprint"]
+
+def hotel_key(detail_url: str, name: str) -> str:
+    """숙소 식별 키: 상세 URL 의 숙소 ID, 없으면 이름"""
+    return hotel_id_from_url(detail_url) or (name or "").strip()
+
+def fingerprint(*parts: str) -> str:
+    return hashlib.sha1("\x1f".join(" ".join((p or "").split()) for p in parts).encode("utf-8")).hexdigest()[:16]
+
+@timed("fingerprint")
+def card_fingerprints(driver, cards: List) -> List[Tuple[str, str]]:
+    """카드별 (hotel_key, 지문). 한 번의 스크립트 호출로 페이지 전체 계산"""
+    try:
+        raw = driver.execute_script(CARD_FINGERPRINT_JS, cards) or []
+    except Exception:
+        raw = []
+    if len(raw) != len(cards):
+        return [("", "")] * len(cards)
+    out = []
+    for href, name, grade in raw:
+        key = hotel_key(href, name)
+        out.append((key, fingerprint(key, name, grade) if key else ""))
+    return out
+
+def http_card_fingerprints(refs: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    out = []
+    for name, url in refs:
+        key = hotel_key(url, name)
+        out.append((key, fingerprint(key, name) if key else ""))
+    return out
+
+def write_fingerprints(path: str, city: str, ptype_name: str, fps: List[Tuple[str, str]]):
+    new = not os.path.exists(path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "a", newline="", encoding="utf-8-sig") as f:
+        w = csv.writer(f)
+        if new:
+            w.writerow(FP_HEADER)
+        for key, fp in fps:
+            if key and fp:
+                w.writerow([city, ptype_name, key, fp])
+
+def merge_fingerprints(fp_dir: str, final_fp_csv: str, prefix: str):
+    """조합별 지문 파일 → 하나로 (같은 키는 마지막 값)"""
+    if not os.path.isdir(fp_dir):
+        return
+    latest: Dict[Tuple[str, str, str], str] = {}
+    for fn in sorted(os.listdir(fp_dir)):
+        if not fn.endswith(".csv"):
+            continue
+        with open(os.path.join(fp_dir, fn), newline="", encoding="utf-8-sig") as f:
+            for r in csv.DictReader(f):
+                latest[(r["city"], r["property_type"], r["hotel_key"])] = r["fingerprint"]
+    os.makedirs(os.path.dirname(final_fp_csv) or ".", exist_ok=True)
+    with open(final_fp_csv, "w", newline="", encoding="utf-8-sig") as f:
+        w = csv.writer(f)
+        w.writerow(FP_HEADER)
+        for (city, ptype_name, key), fp in latest.items():
+            w.writerow([city, ptype_name, key, fp])
+    log(prefix, f"[MERGE FP] {len(latest)} keys → {final_fp_csv}")
+
+class PrevCatalog:
+    """
+    이전 실행의 results.csv + fingerprints.csv. 지문이 같은 숙소의 이전 행을 돌려줌.
+    병합(near_dup)은 같은 숙소 ID 를 숙소 유형이 달라도 한 행으로 합치므로, 지문은 조합별로 남아 있어도
+    (도시, 유형) 행이 없을 수 있음 → 숙소 ID 만으로 찾은 행으로 폴백 (상세 필드만 이월되므로 무방)
+    """
+
+    def __init__(self, results_csv: str, fp_csv: str):
+        self.fps: Dict[Tuple[str, str, str], str] = {}
+        self.rows: Dict[Tuple[str, str, str], Dict[str, str]] = {}
+        self.by_id: Dict[str, Dict[str, str]] = {}
+        if os.path.exists(fp_csv):
+            with open(fp_csv, newline="", encoding="utf-8-sig") as f:
+                for r in csv.DictReader(f):
+                    self.fps[(r["city"], r["property_type"], r["hotel_key"])] = r["fingerprint"]
+        if os.path.exists(results_csv):
+            with open(results_csv, newline="", encoding="utf-8-sig") as f:
+                for r in csv.DictReader(f):
+                    key = hotel_key(r.get("detail_url", ""), r.get("name", ""))
+                    if key:
+                        self.rows[(r.get("city", ""), r.get("property_type", ""), key)] = r
+                    if SharedSeen.usable(key):
+                        self.by_id.setdefault(key, r)
+
+    def lookup(self, city: str, ptype_name: str, key: str, fp: str) -> Optional[Dict[str, str]]:
+        k = (city, ptype_name, key)
+        if not key or not fp or self.fps.get(k) != fp:
+            return None
+        return self.rows.get(k) or self.by_id.get(key)
+
+_PREV_CATALOGS: Dict[Tuple[str, str], PrevCatalog] = {}
+
+def get_prev_catalog(results_csv: Optional[str], fp_csv: Optional[str]) -> Optional[PrevCatalog]:
+    """프로세스별 1회 로딩"""
+    if not results_csv or not fp_csv:
+        return None
+    k = (results_csv, fp_csv)
+    if k not in _PREV_CATALOGS:
+        _PREV_CATALOGS[k] = PrevCatalog(results_csv, fp_csv)
+    return _PREV_CATALOGS[k]
+
+class SharedSeen:
+    """
+    워커 전체가 보는 '이미 수집한 숙소' 집합. 키는 카드 href 의 숙소 ID(N…)만 사용
+    (이름 폴백 키는 지역이 달라도 겹칠 수 있어 제외).
+    store: 멀티프로세스는 Manager dict, 단일 프로세스는 일반 dict. 값은 처음 수집한 조합 키
+    """
+    def __init__(self, store):
+        self.store = store
+
+    @staticmethod
+    def usable(key: str) -> bool:
+        return key[:1] == "N" and key[1:].isdigit()
+
+    def known(self, keys: List[str]) -> set:
+        """이미 수집된 카드 번호(1부터) 집합"""
+        return {ci for ci, key in enumerate(keys, start=1) if self.usable(key) and key in self.store}
 
-def write_failures(path: str, failures: List[Dict], header: bool = False):
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "a", newline="", encoding="utf-8-sig") as f:
-        w = csv.writer(f)
-        if header:
-            w.writerow(["city", "property_type", "page", "card_index", "reason", "page_url"])
-        for it in failures:
-            w.writerow([it.get("city",""), it.get("property_type",""), it.get("page",0),
-                        it.get("card_index",-1), it.get("reason",""), it.get("page_url","")])
+    def add(self, keys: List[str], combo: str):
+        for key in keys:
+            if self.usable(key):
+                self.store.setdefault(key, combo)
+
+def carried_detail(prev: Dict[str, str]) -> Tuple[Dict[str, str], Dict[str, str]]:
+    detail = {k: prev.get(k, "") or "" for k in ("name", "name_en", "grade", "tel", "address", "website", "detail_url")}
+    ratings = {k: prev.get(f"rating_{k}", "") or "" for k in ("hotelscombined", "booking", "tripadvisor", "naver")}
+    return detail, ratings
+
+def detail_row(city: str, ptype_name: str, idx: int, region_idx: int,
+               detail: Dict[str, str], ratings: Dict[str, str]) -> HotelRow:
+    row = HotelRow(
+        city=city,
+        property_type=ptype_name,
+        idx=idx,
+        region_idx=region_idx,
+        name=detail.get("name",""),
+        name_en=detail.get("name_en",""),
+        grade=detail.get("grade",""),
+        tel=detail.get("tel",""),
+        address=detail.get("address",""),
+        detail_url=detail.get("detail_url",""),
+        website=detail.get("website",""),
+    )
+    setattr(row, "rating_hotelscombined", ratings.get("hotelscombined",""))
+    setattr(row, "rating_booking", ratings.get("booking",""))
+    setattr(row, "rating_tripadvisor", ratings.get("tripadvisor",""))
+    setattr(row, "rating_naver", ratings.get("naver",""))
+    return row
 
 # ------------ 단일 조합 수집 루프 ------------
 def crawl_region_property(driver,
@@ -405,9 +2200,37 @@ def crawl_region_property(driver,
                           max_pages: Optional[int] = None,
                           global_index_start: int = 1,
                           region_index_start: int = 1,
-                          prefix: str = "[W?]"):
+                          prefix: str = "[W?]",
+                          capture_mode: str = "dom",
+                          capture_timeout: float = DEFAULT_CAPTURE_TIMEOUT,
+                          capture_dump_dir: Optional[str] = None,
+                          detail_tabs: int = 1,
+                          readiness: str = "sleep",
+                          politeness_floor: float = DEFAULT_POLITENESS_FLOOR,
+                          state: Optional[Dict] = None,
+                          journal: Optional[CrawlJournal] = None,
+                          fp_csv: Optional[str] = None,
+                          prev_catalog: Optional[PrevCatalog] = None,
+                          out_format: str = "csv",
+                          only_cards: Optional[set] = None,
+                          recycle: Optional[DriverRecycler] = None,
+                          shared_seen: Optional[SharedSeen] = None,
+                          result_store: Optional[ResultStore] = None):
     """
     한 지역 + 숙소유형 전체 페이지 크롤링.
+    capture_mode: "dom"(카드 클릭 + CSS 파싱) | "network"(CDP JSON 응답 사용, make_driver(capture_network=True) 필요)
+    driver 자리에 HttpBackend 를 넘기면 브라우저 없이 HTTP 로 수집 (capture_mode 무시)
+    detail_tabs>1: 상세 페이지를 탭 N개로 동시 로딩 (make_driver(page_load_strategy="none") 권장)
+    readiness: "sleep"(고정 말미) | "event"(DOM 안정 감지 + politeness_floor 최소 간격)
+    state: 넘기면 종료 정보 기록 {"empty_pages": [...], "end_page": 조합 끝으로 판단한 페이지 or None, "pages": 로드한 페이지 수,
+           "cards": 목록에서 본 카드 수(저널 완료 페이지 포함), "ok"/"fail": 끝낸 페이지의 성공/실패 누계 (예외로 중단돼도 남음)}
+    journal: 완료 페이지는 건너뛰고, 페이지마다 CSV flush 후 커밋 (끝난 조합은 즉시 반환)
+    fp_csv: 카드 지문 기록 파일 / prev_catalog: 지문이 같은 카드는 열지 않고 이전 행 이월 (network 모드 제외)
+    out_format: "csv" | "parquet" | "both" (Parquet 은 out_csv 옆 세그먼트 파일, 체크포인트마다 row group)
+    only_cards: 주어지면 해당 카드 번호(1부터)만 수집 (실패 재시도용)
+    shared_seen: 카드 숙소 ID 가 이미 들어 있으면 열지도 이월하지도 않음, 수집한 숙소는 페이지 끝에 추가 (network 모드 제외)
+    result_store: 결과 행을 out_csv 대신 공유 저장소에 upsert (체크포인트/저널 커밋 시점은 동일)
+    recycle: 페이지를 끝낼 때마다 recycle.check() → 임계 초과 시 새 드라이버로 다음 페이지부터 계속
     반환: (수집성공개수, 실패개수, global_idx_last, region_idx_last)
     """
     results_buffer: List[HotelRow] = []
@@ -415,15 +2238,46 @@ def crawl_region_property(driver,
     total_ok, total_fail = 0, 0
     global_idx = global_index_start
     region_idx = region_index_start
+    sink = ResultSink(out_csv, out_format, result_store)
 
     if checkpoint_enabled:
-        if not os.path.exists(out_csv):
+        if sink.csv and not os.path.exists(out_csv):
             write_csv(out_csv, [], header=True)
         if not os.path.exists(fail_csv):
             write_failures(fail_csv, [], header=True)
 
     ptype_name = PROPERTY_TYPES.get(property_type_code, f"type_{property_type_code}")
     seen = set()
+    if state is None:
+        state = {}
+    state.setdefault("empty_pages", [])
+    state.setdefault("end_page", None)
+    state.setdefault("pages", 0)
+    state.setdefault("cards", 0)
+    state.setdefault("ok", 0)
+    state.setdefault("fail", 0)
+    http = isinstance(driver, HttpBackend)
+    if http:
+        capture_mode = "dom"
+    ready = Readiness(floor=politeness_floor) if readiness == "event" and not http else None
+
+    jkey = combo_key(region_code, property_type_code)
+    done_pages: Dict[int, int] = {}
+    end_page: Optional[int] = None
+    if journal:
+        done_pages = journal.done_pages(jkey)
+        end_page = journal.combo_end(jkey)
+        if end_page is not None:
+            # 끝은 다른 샤드가 기록했을 수 있음 → 이 구간의 끝 앞 페이지가 모두 완료일 때만 건너뜀
+            hi = min(end_page, max_pages + 1) if max_pages else end_page
+            missing = [p for p in range(start_page, hi) if p not in done_pages]
+            if not missing:
+                log(prefix, f"[RESUME] {city}/{ptype_name} 저널상 완료(p{end_page}) → 건너뜀")
+                state["end_page"] = end_page
+                state["cards"] += sum(done_pages.get(p, 0) for p in range(start_page, hi))
+                return 0, 0, global_index_start - 1, region_index_start - 1
+            log(prefix, f"[RESUME] {city}/{ptype_name} 끝 p{end_page} 기록됨, 미완료 {len(missing)}페이지만 수집")
+        seen |= journal.seen_urls(jkey)
 
     page = start_page
     empty_runs = 0
@@ -432,34 +2286,122 @@ def crawl_region_property(driver,
         if max_pages and page > max_pages:
             log(prefix, f"[STOP] page>{max_pages} → break")
             break
-
-        ok = go_list_page(driver, region_code, property_type_code, page, page_pause=page_pause, prefix=prefix)
-        if not ok:
-            log(prefix, f"[WARN] 페이지 로드 실패: p={page}")
+        if end_page is not None and page >= end_page:
+            state["end_page"] = end_page
             break
 
-        cards = collect_cards(driver)
+        if page in done_pages:
+            empty_runs = empty_runs + 1 if done_pages[page] == 0 else 0
+            if done_pages[page] == 0:
+                state["empty_pages"].append(page)
+            state["cards"] += done_pages[page]
+            log(prefix, f"[RESUME] p={page} 저널상 완료 → 건너뜀")
+            page += 1
+            continue
+
+        t_page = time.perf_counter()
+        if capture_mode == "network":
+            drain_network_json(driver)   # 이전 페이지의 잔여 응답 비우기
+        # 로드 실패는 예외 → 남은 페이지를 버리고 완료 처리하지 않음 (저널이 있으면 재기동 후 이 페이지부터)
+        if http:
+            http_go_list_page(driver, region_code, property_type_code, page, page_pause=page_pause, prefix=prefix)
+        else:
+            go_list_page(driver, region_code, property_type_code, page, page_pause=page_pause, prefix=prefix,
+                         readiness=ready)
+        state["pages"] += 1
+
+        cards = http_collect_cards(driver, region_code, property_type_code, page) if http else collect_cards(driver)
+        state["cards"] += len(cards)
+        list_page_url = driver.current_url   # 상세 탭/패널로 옮겨간 뒤에도 실패 기록은 목록 URL
         log(prefix, f"[PAGE {page}] cards: {len(cards)}")
 
+        net_hotels: List[Dict[str, str]] = []
+        if capture_mode == "network" and cards:
+            dump = None
+            if capture_dump_dir:
+                dump = lambda p: dump_capture(capture_dump_dir, "list", f"{region_code}_{property_type_code}_{page}", p)
+            net_hotels = wait_network_hotels(driver, capture_timeout, dump=dump)
+            log(prefix, f"[PAGE {page}] network hotels: {len(net_hotels)}")
+
         if len(cards) == 0:
             empty_runs += 1
-            if empty_runs >= 2 or not has_next(driver):
+            state["empty_pages"].append(page)
+            if journal:
+                journal.commit_page(jkey, page, 0, 0, 0, [])
+            if empty_runs >= 2 or not (http_has_next(driver) if http else has_next(driver)):
                 log(prefix, "[STOP] 카드 없음 or 다음 없음 → 종료")
+                state["end_page"] = page
+                if journal:
+                    journal.finish_combo(jkey, page)
                 break
             page += 1
             continue
         else:
             empty_runs = 0
 
-        for ci, card in enumerate(cards, start=1):
-            try:
-                fb_name = card_name_fallback(card)
-                open_card(driver, card, detail_pause=detail_pause, prefix=prefix)
-            except (TimeoutException, StaleElementReferenceException, ElementClickInterceptedException) as e:
+        carried: List[Tuple[int, Dict, Dict, str]] = []
+        todo = list(range(1, len(cards) + 1))
+        fps: List[Tuple[str, str]] = []
+        if (fp_csv or prev_catalog or shared_seen) and not net_hotels:
+            fps = http_card_fingerprints(cards) if http else card_fingerprints(driver, cards)
+            if fp_csv:
+                write_fingerprints(fp_csv, city, ptype_name, fps)
+            if prev_catalog:
+                todo = []
+                for ci, (key, fp) in enumerate(fps, start=1):
+                    prev = prev_catalog.lookup(city, ptype_name, key, fp)
+                    if prev:
+                        carried.append((ci,) + carried_detail(prev) + ("",))
+                    else:
+                        todo.append(ci)
+                log(prefix, f"[PAGE {page}] 변경 없음 {len(carried)} → 이월, 새로 열기 {len(todo)}")
+        if shared_seen and fps:
+            dup = shared_seen.known([key for key, _ in fps])
+            if dup:
+                carried = [c for c in carried if c[0] not in dup]
+                todo = [ci for ci in todo if ci not in dup]
+                STATS.count("cards_shared_skip", len(dup))
+                log(prefix, f"[PAGE {page}] 다른 조합에서 이미 수집 {len(dup)} → 건너뜀")
+        if only_cards is not None:
+            carried = [c for c in carried if c[0] in only_cards]
+            todo = [ci for ci in todo if ci in only_cards]
+        sub = [cards[ci - 1] for ci in todo]
+
+        if not sub:
+            details = iter([])
+        elif http:
+            details = iter_http_details(driver, sub, detail_pause, prefix)
+        elif net_hotels:
+            details = iter_network_details(driver, cards, net_hotels, region_code, property_type_code, page,
+                                           capture_timeout, capture_dump_dir, prefix,
+                                           indices=todo if len(sub) != len(cards) else None)
+        elif detail_tabs > 1:
+            details = iter_tab_details(driver, sub, detail_tabs, detail_pause, prefix, readiness=ready)
+        else:
+            details = iter_dom_details(driver, sub, detail_pause, prefix, readiness=ready)
+        if len(sub) != len(cards) and not net_hotels:
+            # 부분 목록의 카드 번호를 원래 번호로 되돌림 (network 모드는 이미 원래 번호)
+            details = ((todo[ci - 1], d, r, why) for ci, d, r, why in details)
+        if carried:
+            details = chain(carried, details)
+
+        page_ok, page_fail, page_urls, page_keys = 0, 0, [], []
+        carried_ci = {c[0] for c in carried}
+        t_card = time.perf_counter()
+        for ci, detail, ratings, reason in details:
+            if only_cards is not None and ci not in only_cards:
+                continue   # 안전망: 요청하지 않은 카드는 기록하지 않음
+            now = time.perf_counter()
+            if ci not in carried_ci:
+                STATS.observe("card", now - t_card)   # 카드 1건 상세 확보까지 (열기+대기+파싱)
+                governor_report(reason or ("" if any(detail.values()) else "parse_detail:empty"), prefix)
+            t_card = now
+            if reason:
+                page_fail += 1
                 failures_buffer.append({
                     "city": city, "property_type": ptype_name, "page": page,
-                    "card_index": ci, "reason": type(e).__name__,
-                    "page_url": driver.current_url
+                    "card_index": ci, "reason": reason,
+                    "page_url": list_page_url
                 })
                 total_fail += 1
                 if checkpoint_enabled and len(failures_buffer) >= max(1, checkpoint_every//2):
@@ -467,9 +2409,6 @@ def crawl_region_property(driver,
                     failures_buffer.clear()
                 continue
 
-            detail = parse_detail_panel(driver, fallback_name=fb_name)
-            ratings = parse_ratings_from_detail(driver)
-
             durl = detail.get("detail_url","")
             if durl and durl in seen:
                 continue
@@ -477,10 +2416,11 @@ def crawl_region_property(driver,
                 seen.add(durl)
 
             if not any(detail.values()):
+                page_fail += 1
                 failures_buffer.append({
                     "city": city, "property_type": ptype_name, "page": page,
                     "card_index": ci, "reason": "parse_detail:empty",
-                    "page_url": driver.current_url
+                    "page_url": list_page_url
                 })
                 total_fail += 1
                 if checkpoint_enabled and len(failures_buffer) >= max(1, checkpoint_every//2):
@@ -488,162 +2428,1363 @@ def crawl_region_property(driver,
                     failures_buffer.clear()
                 continue
 
-            row = HotelRow(
-                city=city,
-                property_type=ptype_name,
-                idx=global_idx,
-                region_idx=region_idx,
-                name=detail.get("name",""),
-                name_en=detail.get("name_en",""),
-                grade=detail.get("grade",""),
-                tel=detail.get("tel",""),
-                address=detail.get("address",""),
-                detail_url=detail.get("detail_url",""),
-                website=detail.get("website",""),
-            )
-            setattr(row, "rating_hotelscombined", ratings.get("hotelscombined",""))
-            setattr(row, "rating_booking", ratings.get("booking",""))
-            setattr(row, "rating_tripadvisor", ratings.get("tripadvisor",""))
-            setattr(row, "rating_naver", ratings.get("naver",""))
-
-            log(prefix, f"→ [{row.idx}] {row.city}/{row.property_type} | {row.name} | {row.grade} | {row.tel} | {row.address}")
+            row = detail_row(city, ptype_name, global_idx, region_idx, detail, ratings)
+            log(prefix, f"→ [{row.idx}] {row.city}/{row.property_type} | {row.name} | {row.grade} | {row.tel} | {row.address}", CARD_LOG)
 
             results_buffer.append(row)
+            page_ok += 1
+            if durl:
+                page_urls.append(durl)
+            if fps:
+                page_keys.append(fps[ci - 1][0])
             total_ok += 1
+            report_progress()
             global_idx += 1
             region_idx += 1
 
             if checkpoint_enabled and (len(results_buffer) >= checkpoint_every):
-                write_csv(out_csv, results_buffer, header=False)
+                sink.write(results_buffer)
+                results_buffer.clear()
+
+        if journal:
+            # 이 페이지 결과를 파일에 확정한 뒤 커밋
+            if results_buffer:
+                sink.write(results_buffer)
                 results_buffer.clear()
+            if failures_buffer:
+                write_failures(fail_csv, failures_buffer, header=False)
+                failures_buffer.clear()
+            sink.flush()
+            journal.commit_page(jkey, page, len(cards), page_ok, page_fail, page_urls)
+        state["ok"] += page_ok
+        state["fail"] += page_fail
+        if shared_seen and page_keys:
+            shared_seen.add(page_keys, jkey)
 
+        STATS.observe("page", time.perf_counter() - t_page)
+        traffic = None if http else page_traffic(driver)
+        if traffic:
+            STATS.count("page_requests", traffic[0])
+            STATS.count("page_bytes", traffic[1])
+            STATS.count("pages_measured")
+            log(prefix, f"[PAGE {page}] 리소스 {traffic[0]}건 / {traffic[1] / 1024:.0f}KB")
+        if ready:
+            waited, skipped = ready.take()
+            log(prefix, f"[PAGE {page}] 대기 {waited:.1f}s (고정 말미 {skipped:.1f}s 생략, 절감 {skipped - waited:+.1f}s)")
+        if recycle:
+            driver = recycle.check(driver, prefix)
         page += 1
 
     if results_buffer and checkpoint_enabled:
-        write_csv(out_csv, results_buffer, header=False)
+        sink.write(results_buffer)
         results_buffer.clear()
 
     if failures_buffer and checkpoint_enabled:
         write_failures(fail_csv, failures_buffer, header=False)
         failures_buffer.clear()
+    sink.close()
 
     return total_ok, total_fail, global_idx - 1, region_idx - 1
 
 # ------------ 멀티프로세스 워커 & 병합 ------------
-def out_paths(base_dir: str, city: str, ptype_name: str):
+def out_paths(base_dir: str, city: str, ptype_name: str, suffix: str = ""):
     os.makedirs(base_dir, exist_ok=True)
-    tag = f"{city}_{ptype_name}"
+    tag = f"{city}_{ptype_name}{suffix}"
     return (os.path.join(base_dir, f"{tag}.csv"),
             os.path.join(base_dir, f"{tag}_fail.csv"))
 
+# 워커 프로세스 상주 드라이버 (ProcessPoolExecutor initializer 로 기동, 조합 간 재사용)
+_WORKER: Dict[str, object] = {"driver": None, "profile": None, "startup_sec": 0.0, "starts": 0, "recycler": None}
+
+def _backend_kwargs(args: Dict, user_data_dir: Optional[str]) -> Dict:
+    return dict(
+        http_concurrency=args.get("http_concurrency", DEFAULT_HTTP_CONCURRENCY),
+        headless=args.get("headless", True),
+        user_data_dir=user_data_dir,            # 프로세스별 프로필(충돌 방지)
+        suppress_logs=True,
+        block_images=True,
+        disable_cache=True,
+        capture_network=args.get("capture_mode", "dom") == "network",
+        page_load_strategy="none" if args.get("detail_tabs", 1) > 1 else None,
+        block_profile=args.get("block_profile", DEFAULT_BLOCK_PROFILE),
+        block_urls=args.get("block_urls"),
+    )
+
+def acquire_worker_driver(args: Dict, tag: Optional[str] = None):
+    """현재 프로세스의 드라이버 반환 (없으면 새로 기동하고 기동 시간 누적)"""
+    if _WORKER["driver"] is None:
+        t0 = time.time()
+        profile = tempfile.mkdtemp(prefix=f"selenium_{tag or f'w{os.getpid()}'}_")
+        try:
+            _WORKER["driver"] = make_backend(args.get("backend", "chrome"), **_backend_kwargs(args, profile))
+        except Exception:
+            shutil.rmtree(profile, ignore_errors=True)
+            raise
+        _WORKER["profile"] = profile
+        _WORKER["startup_sec"] += time.time() - t0
+        _WORKER["starts"] += 1
+        STATS.observe("driver_start", time.time() - t0)
+    return _WORKER["driver"]
+
+def release_worker_driver():
+    """드라이버 종료 + 프로필 삭제 (실패 시/프로세스 종료 시). 다음 acquire 에서 재기동"""
+    driver, profile = _WORKER["driver"], _WORKER["profile"]
+    _WORKER["driver"], _WORKER["profile"] = None, None
+    try:
+        if driver: driver.quit()
+    except Exception: pass
+    if profile:
+        shutil.rmtree(profile, ignore_errors=True)
+
+def retire_worker(_task=None) -> Dict:
+    """자동 축소 시 유휴 워커가 실행: 상주 드라이버 반납 (다음 작업을 받으면 다시 기동)"""
+    had = _WORKER["driver"] is not None
+    release_worker_driver()
+    return {"pid": os.getpid(), "released": had}
+
+def worker_recycler(args: Dict) -> Optional[DriverRecycler]:
+    """프로세스 상주 드라이버용 재활용기 (조합이 바뀌어도 페이지 수 누적). 임계가 모두 꺼져 있으면 None"""
+    max_pages = args.get("recycle_pages", DEFAULT_RECYCLE_PAGES)
+    max_rss_mb = args.get("recycle_rss_mb", DEFAULT_RECYCLE_RSS_MB)
+    if not (max_pages or max_rss_mb):
+        return None
+    if _WORKER["recycler"] is None:
+        def restart(_old):
+            release_worker_driver()
+            return acquire_worker_driver(args)
+        _WORKER["recycler"] = DriverRecycler(restart, max_pages, max_rss_mb)
+    return _WORKER["recycler"]
+
+def reset_worker_driver(driver):
+    """조합 사이 상태 초기화: 여분 탭 닫기, 쿠키/스토리지 삭제, 빈 페이지로 이동"""
+    if isinstance(driver, HttpBackend):
+        driver.session.cookies.clear()
+        driver.doc, driver.current_url = None, ""
+        return
+    handles = driver.window_handles
+    for h in handles[1:]:
+        driver.switch_to.window(h)
+        driver.close()
+    driver.switch_to.window(handles[0])
+    driver.delete_all_cookies()
+    try:
+        driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": BASE, "storageTypes": "all"})
+    except Exception:
+        pass
+    driver.get("about:blank")
+    if getattr(driver, "_net_pending", None) is not None:
+        drain_network_json(driver)
+        driver._net_pending = {}
+
+def take_startup_stats() -> Tuple[float, int]:
+    """마지막 보고 이후 누적된 드라이버 기동 (초, 횟수) 를 꺼내고 0 으로 리셋"""
+    sec, cnt = _WORKER["startup_sec"], _WORKER["starts"]
+    _WORKER["startup_sec"], _WORKER["starts"] = 0.0, 0
+    return sec, cnt
+
+def _worker_init(args: Dict, log_queue=None, progress=None):
+    """풀 initializer: 로그 큐/진행 카운터 연결 + (reuse_driver 면) 프로세스 시작 시 드라이버 1개 기동 (실패하면 첫 조합에서 재시도)"""
+    setup_worker_logging(log_queue, args.get("log_level", "info"))
+    install_progress(progress)
+    if args.get("rate_limit"):
+        install_governor(RateGovernor(args["rate_state"], args["rate_lock"], args["rate_limit"], args["rate_floor"]))
+    if not args.get("reuse_driver", True):
+        return
+    # fork 로 뜬 풀 워커는 os._exit 로 끝나 atexit 가 돌지 않음 → multiprocessing 종료 훅으로 정리
+    mp_util.Finalize(None, release_worker_driver, exitpriority=10)
+    try:
+        acquire_worker_driver(args)
+    except Exception as e:
+        log(f"[P{os.getpid()}]", f"[WARN] 드라이버 선기동 실패: {type(e).__name__}: {e}")
+
+@contextmanager
+def worker_driver(args: Dict, prefix: str, tag: str):
+    """
+    reuse_driver 면 워커 상주 드라이버(오류 시 폐기 후 재기동), 아니면 작업 단위 Chrome 기동/종료.
+    어느 쪽이든 _WORKER 슬롯에 두므로 페이지 경계 재활용(worker_recycler) 후에도 정리 대상이 어긋나지 않음
+    """
+    reuse = args.get("reuse_driver", True)
+    driver = acquire_worker_driver(args, None if reuse else tag)
+    try:
+        yield driver
+    except Exception:
+        if reuse:
+            log(prefix, "[WARN] 드라이버 오류 → 다음 조합에서 재기동")
+        release_worker_driver()
+        raise
+    if not reuse:
+        release_worker_driver()
+        return
+    try:
+        reset_worker_driver(_WORKER["driver"])   # 작업 중 교체됐을 수 있음
+    except Exception as e:
+        # 작업은 끝났으므로 결과는 그대로 반환, 드라이버만 폐기
+        log(prefix, f"[WARN] 드라이버 초기화 실패 → 폐기 후 다음 조합에서 재기동: {type(e).__name__}: {e}")
+        release_worker_driver()
+
+def _crawl_kwargs(args: Dict) -> Dict:
+    """args 에서 crawl_region_property 공통 옵션 추출"""
+    return dict(
+        page_pause=args.get("page_pause", DEFAULT_PAGE_PAUSE),
+        detail_pause=args.get("detail_pause", DEFAULT_DETAIL_PAUSE),
+        checkpoint_enabled=True,
+        checkpoint_every=args.get("checkpoint_every", 50),
+        global_index_start=1,
+        region_index_start=1,
+        capture_mode=args.get("capture_mode", "dom"),
+        capture_timeout=args.get("capture_timeout", DEFAULT_CAPTURE_TIMEOUT),
+        capture_dump_dir=args.get("capture_dump_dir", None),
+        detail_tabs=args.get("detail_tabs", 1),
+        readiness=args.get("readiness", "sleep"),
+        politeness_floor=args.get("politeness_floor", DEFAULT_POLITENESS_FLOOR),
+        journal=get_journal(args.get("journal_path")),
+        prev_catalog=get_prev_catalog(args.get("prev_results_csv"), args.get("prev_fp_csv")),
+        out_format=args.get("out_format", "csv"),
+        recycle=worker_recycler(args),
+        shared_seen=SharedSeen(args["seen_cards"]) if args.get("seen_cards") is not None else None,
+        result_store=get_result_store(args.get("result_db")),
+    )
+
+def fp_path(args: Dict, city: str, ptype_name: str, suffix: str = "") -> str:
+    return os.path.join(args["tmp_out_dir"], "fingerprints", f"{city}_{ptype_name}{suffix}.csv")
+
+def _prepare_out(args: Dict, city: str, ptype_name: str, suffix: str = "") -> Tuple[str, str]:
+    out_csv, fail_csv = out_paths(args["tmp_out_dir"], city, ptype_name, suffix)
+    if args.get("out_format", "csv") != "parquet" and not args.get("result_db") and not os.path.exists(out_csv):
+        write_csv(out_csv, [], header=True)
+    if not os.path.exists(fail_csv):
+        write_failures(fail_csv, [], header=True)
+    return out_csv, fail_csv
+
 def run_combo(task):
     """
     task = (city, region_code, ptype_code, args, wid)
-    각 프로세스가 독립 Chrome을 띄워 (city, ptype) 하나 처리
+    args["reuse_driver"] (기본 True): 워커 상주 드라이버 사용, 실패 시에만 재기동
+    False 면 조합마다 독립 Chrome(또는 HTTP 백엔드)을 띄우고 종료
+    args["scheduler"] == "pages" 면 조합 전체 대신 공유 커서에서 페이지 샤드를 받아가며 처리
     """
     city, region_code, ptype, args, wid = task
     prefix = f"[W{wid}]"
     ptype_name = PROPERTY_TYPES.get(ptype, f"type_{ptype}")
 
-    tmp_profile = tempfile.mkdtemp(prefix=f"selenium_{city}_{ptype}_")
-    driver = None
-    try:
-        log(prefix, f"시작 → {city}/{ptype_name}")
-        driver = make_driver(
-            headless=args.get("headless", True),
-            user_data_dir=tmp_profile,          # 프로세스별 프로필(충돌 방지)
-            suppress_logs=True,
-            block_images=True,
-            disable_cache=True,
-        )
+    log(prefix, f"시작 → {city}/{ptype_name}")
+    ok_cnt, fail_cnt, restarts, out_csv = 0, 0, 0, ""
+    tally: Dict[str, Dict] = {}
+    while True:
+        done: Dict = {}   # 이번 시도에서 끝낸 페이지의 성공/실패 → 시도가 예외로 끝나도 합산 (재개는 그 다음 페이지부터)
+        try:
+            with worker_driver(args, prefix, f"{city}_{ptype}") as driver:
+                if args.get("scheduler") == "pages":
+                    ok_n, fail_n, shards = crawl_shards(driver, args, city, region_code, ptype, prefix, tally, done)
+                else:
+                    out_csv, fail_csv = _prepare_out(args, city, ptype_name)
+                    state, t0 = done, time.time()
+                    try:
+                        ok_n, fail_n, g_last, r_last = crawl_region_property(
+                            driver=driver,
+                            city=city,
+                            region_code=region_code,
+                            property_type_code=ptype,
+                            out_csv=out_csv,
+                            fail_csv=fail_csv,
+                            start_page=1,
+                            max_pages=args.get("max_pages_per_combo", None),
+                            prefix=prefix,
+                            state=state,
+                            fp_csv=fp_path(args, city, ptype_name),
+                            **_crawl_kwargs(args),
+                        )
+                    except Exception:
+                        # 카드 수는 재개한 시도가 저널 완료 페이지까지 세므로 여기서는 페이지/시간만
+                        tally_combo(tally, combo_key(region_code, ptype), state.get("pages", 0), 0, time.time() - t0)
+                        raise
+                    tally_combo(tally, combo_key(region_code, ptype), state["pages"], state["cards"], time.time() - t0)
+            ok_cnt, fail_cnt = ok_cnt + ok_n, fail_cnt + fail_n
+            break
+        except Exception as e:
+            # 저널이 있으면 드라이버를 새로 띄워 마지막 커밋 페이지 다음부터 재개
+            restarts += 1
+            ok_cnt, fail_cnt = ok_cnt + done.get("ok", 0), fail_cnt + done.get("fail", 0)
+            if not args.get("journal_path") or restarts > args.get("max_restarts", 2):
+                raise
+            log(prefix, f"[RESUME] {type(e).__name__} → 드라이버 재기동 후 재개 ({restarts}/{args.get('max_restarts', 2)})")
+    log(prefix, f"완료 → {city}/{ptype_name} ok:{ok_cnt} fail:{fail_cnt}")
+    startup_sec, starts = take_startup_stats()
+    return {"city": city, "ptype": ptype_name, "ok": ok_cnt, "fail": fail_cnt, "out_csv": out_csv,
+            "startup_sec": startup_sec, "driver_starts": starts, "pid": os.getpid(), "stats": STATS.take(),
+            "combos": tally}
 
-        out_csv, fail_csv = out_paths(args["tmp_out_dir"], city, ptype_name)
-        if not os.path.exists(out_csv):
-            write_csv(out_csv, [], header=True)
-        if not os.path.exists(fail_csv):
-            write_failures(fail_csv, [], header=True)
+# ------------ 페이지 단위 작업 분할 (work stealing) ------------
+# 공유 커서: Manager dict[combo_key] = {"next": 다음 미할당 페이지, "end": 마지막 페이지 or None,
+#                                     "empty": [빈 페이지], "retry": [오류로 반납된 (lo, hi)]}
+DEFAULT_SHARD_PAGES = 2
+
+def combo_key(region_code: str, ptype: int) -> str:
+    return f"{region_code}:{ptype}"
+
+def tally_combo(tally: Dict[str, Dict], key: str, pages: int, cards: int, sec: float):
+    """작업 결과에 실어 보낼 조합별 크기 누적 (샤드/steal 로 나뉘어도 마스터에서 합산)"""
+    t = tally.setdefault(key, {"pages": 0, "cards": 0, "sec": 0.0})
+    t["pages"] += pages
+    t["cards"] += cards
+    t["sec"] += sec
+
+def _pages_left(st: Dict, cap: Optional[int]) -> bool:
+    if st.get("retry"):
+        return True
+    if st["end"] is not None and st["next"] > st["end"]:
+        return False
+    return not (cap and st["next"] > cap)
+
+def claim_pages(args: Dict, key: str) -> Optional[Tuple[int, int]]:
+    """조합의 다음 페이지 구간 [lo, hi] 를 원자적으로 할당. 남은 페이지가 없으면 None"""
+    cap = args.get("max_pages_per_combo")
+    with args["page_lock"]:
+        st = dict(args["page_cursors"].get(key) or {"next": 1, "end": None, "empty": []})
+        if not _pages_left(st, cap):
+            return None
+        if st.get("retry"):
+            st["retry"] = list(st["retry"])
+            lo, hi = st["retry"].pop(0)
+            args["page_cursors"][key] = st
+            return lo, hi
+        lo = st["next"]
+        hi = lo + max(1, args.get("shard_pages", DEFAULT_SHARD_PAGES)) - 1
+        if st["end"] is not None:
+            hi = min(hi, st["end"])
+        if cap:
+            hi = min(hi, cap)
+        st["next"] = hi + 1
+        args["page_cursors"][key] = st
+        return lo, hi
+
+def return_pages(args: Dict, key: str, lo: int, hi: int):
+    """오류로 끝내지 못한 샤드를 반납 → 다음 claim 에서 재할당 (저널이 있으면 완료 페이지는 건너뜀)"""
+    with args["page_lock"]:
+        st = dict(args["page_cursors"][key])
+        st["retry"] = list(st.get("retry") or []) + [(lo, hi)]
+        args["page_cursors"][key] = st
+
+def report_pages(args: Dict, key: str, state: Dict):
+    """샤드 결과 반영: 연속 빈 페이지 2개 또는 '다음 없음' 이면 조합 끝 확정"""
+    with args["page_lock"]:
+        st = dict(args["page_cursors"][key])
+        empty = sorted(set(st["empty"]) | set(state.get("empty_pages", [])))
+        ends = [p for p in empty if p - 1 in empty]
+        if state.get("end_page") is not None:
+            ends.append(state["end_page"])
+        if ends:
+            st["end"] = min(ends + ([st["end"]] if st["end"] is not None else []))
+        st["empty"] = empty
+        args["page_cursors"][key] = st
+
+def crawl_shards(driver, args: Dict, city: str, region_code: str, ptype: int, prefix: str,
+                 tally: Optional[Dict] = None, done: Optional[Dict] = None) -> Tuple[int, int, int]:
+    """
+    한 조합에서 샤드를 더 받을 수 없을 때까지 반복. 출력은 프로세스별 파일(동시 append 방지), tally 에 조합 크기 누적
+    done: {"ok", "fail"} 누계 (예외로 끝나도 그때까지 끝낸 페이지 포함 → 재시도에서 합산)
+    """
+    ptype_name = PROPERTY_TYPES.get(ptype, f"type_{ptype}")
+    out_csv, fail_csv = _prepare_out(args, city, ptype_name, suffix=f"__p{os.getpid()}")
+    key = combo_key(region_code, ptype)
+    ok_sum, fail_sum, shards = 0, 0, 0
+    while True:
+        rng = claim_pages(args, key)
+        if not rng:
+            break
+        lo, hi = rng
+        log(prefix, f"[SHARD] {city}/{ptype_name} p{lo}-{hi}")
+        driver = _WORKER["driver"] or driver   # 이전 샤드에서 재활용됐을 수 있음
+        state: Dict = {}
+        t0 = time.time()
+        try:
+            ok_cnt, fail_cnt, _, _ = crawl_region_property(
+                driver=driver, city=city, region_code=region_code, property_type_code=ptype,
+                out_csv=out_csv, fail_csv=fail_csv, start_page=lo, max_pages=hi,
+                prefix=prefix, state=state, fp_csv=fp_path(args, city, ptype_name, f"__p{os.getpid()}"),
+                **_crawl_kwargs(args),
+            )
+        except Exception:
+            return_pages(args, key, lo, hi)
+            if tally is not None:
+                tally_combo(tally, key, state.get("pages", 0), 0, time.time() - t0)
+            if done is not None:
+                done["ok"] = done.get("ok", 0) + state.get("ok", 0)
+                done["fail"] = done.get("fail", 0) + state.get("fail", 0)
+            raise
+        report_pages(args, key, state)
+        if tally is not None:
+            tally_combo(tally, key, state["pages"], state["cards"], time.time() - t0)
+        if done is not None:
+            done["ok"] = done.get("ok", 0) + ok_cnt
+            done["fail"] = done.get("fail", 0) + fail_cnt
+        ok_sum += ok_cnt
+        fail_sum += fail_cnt
+        shards += 1
+    return ok_sum, fail_sum, shards
+
+def pick_steal_target(args: Dict) -> Optional[Tuple[str, str, int]]:
+    """이미 시작됐고 페이지가 남은 조합 중 가장 깊이 진행된(=가장 큰) 조합 선택"""
+    cap = args.get("max_pages_per_combo")
+    cursors = dict(args["page_cursors"])
+    best, best_next = None, 0
+    for city, region_code, ptype in args["combos"]:
+        st = cursors.get(combo_key(region_code, ptype))
+        if st and _pages_left(st, cap) and st["next"] > best_next:
+            best, best_next = (city, region_code, ptype), st["next"]
+    return best
+
+def run_steal(task):
+    """
+    task = (args, wid). 모든 조합 작업이 배정된 뒤 놀게 된 워커가 실행:
+    진행 중인 큰 조합의 남은 페이지를 샤드 단위로 가져가 처리
+    """
+    args, wid = task
+    prefix = f"[S{wid}]"
+    ok_sum, fail_sum, shards = 0, 0, 0
+    tally: Dict[str, Dict] = {}
+    with worker_driver(args, prefix, f"steal{wid}") as driver:
+        while True:
+            target = pick_steal_target(args)
+            if not target:
+                break
+            city, region_code, ptype = target
+            ok_cnt, fail_cnt, n = crawl_shards(driver, args, city, region_code, ptype, prefix, tally)
+            ok_sum, fail_sum, shards = ok_sum + ok_cnt, fail_sum + fail_cnt, shards + n
+    log(prefix, f"[STEAL] 샤드 {shards}개 처리 ok:{ok_sum} fail:{fail_sum}")
+    startup_sec, starts = take_startup_stats()
+    return {"city": "*", "ptype": f"steal:{shards}", "ok": ok_sum, "fail": fail_sum, "out_csv": "",
+            "startup_sec": startup_sec, "driver_starts": starts, "steal": True,
+            "pid": os.getpid(), "stats": STATS.take(), "combos": tally}
+
+# ------------ 목록/상세 분리 파이프라인 ------------
+# 목록 워커(run_enumerate): 조합의 목록 페이지만 넘기며 페이지별 카드 참조 묶음을 유한 큐에 넣음 (가득 차면 대기 = 역압)
+# 상세 워커(run_extract): 큐에서 묶음을 꺼내 상세 URL 을 열고 행 기록 → 저널 커밋 → shared_seen 갱신
+# 묶음: {"city", "region_code", "ptype", "page", "page_url", "cards",
+#        "refs": [(카드 번호, 이름, 상세 URL, 숙소 키)], "carried": [(카드 번호, detail, ratings, 숙소 키)]}
+DEFAULT_LIST_WORKERS = 1
+DEFAULT_QUEUE_PAGES = 8     # 큐에 쌓아 둘 수 있는 페이지 묶음 수
+PIPE_SAMPLE_SEC = 1.0       # 큐 깊이 표본 주기
+PIPE_REPORT_SEC = 10.0      # [PIPE] 로그 주기
+PIPE_BOTTLENECK = 0.6       # 표본의 이 비율 이상 큐가 가득(→ 상세 병목) / 비어(→ 목록 병목) 있으면 판정
+
+def iter_url_details(driver, refs: List[Tuple[str, str]], detail_pause: float, prefix: str,
+                     readiness: Optional[Readiness] = None):
+    """(카드 이름, 상세 URL) 를 Chrome 탭 하나에서 차례로 열어 (번호, detail, ratings, 실패 사유) yield (목록 페이지 불필요)"""
+    for ci, (fb_name, url) in enumerate(refs, start=1):
+        if not url:
+            yield ci, None, None, "pipeline:no_detail_url"
+            continue
+        throttle()
+        try:
+            driver.get(url)
+            if readiness:
+                readiness.wait(driver, [PANEL_NAME_SELECTOR], detail_pause + JITTER_MEAN)
+            else:
+                sleep_jitter(detail_pause)
+            detail, ratings = parse_panel(driver, fallback_name=fb_name)
+        except Exception as e:
+            yield ci, None, None, type(e).__name__
+            continue
+        yield ci, detail, ratings, ""
+
+def page_refs(driver, cards: List) -> List[Tuple[str, str]]:
+    """목록 카드 → [(이름, 상세 URL)] (HTTP 백엔드의 카드는 이미 이 형태)"""
+    if isinstance(driver, HttpBackend):
+        return list(cards)
+    return list(zip([card_name_fallback(c) for c in cards], card_detail_urls(driver, cards)))
+
+def enumerate_combo(driver, args: Dict, city: str, region_code: str, ptype: int, prefix: str, state: Dict) -> int:
+    """
+    한 조합의 목록 페이지를 넘기며 페이지별 카드 참조 묶음을 args["pipe_queue"] 에 넣음 (상세는 열지 않음).
+    저널 완료 페이지 건너뜀 / 지문 기록 / 이월(prev_catalog) / shared_seen 거름은 crawl_region_property 와 같음.
+    state["pages"] / state["cards"]: 로드한 목록 페이지 수 / 목록에서 본 카드 수(저널 완료 페이지 포함). 반환: 큐에 넣은 카드 수
+    """
+    kw = _crawl_kwargs(args)
+    journal, prev, shared, recycle = kw["journal"], kw["prev_catalog"], kw["shared_seen"], kw["recycle"]
+    ptype_name = PROPERTY_TYPES.get(ptype, f"type_{ptype}")
+    fp_csv = fp_path(args, city, ptype_name)
+    http = isinstance(driver, HttpBackend)
+    ready = Readiness(floor=kw["politeness_floor"]) if kw["readiness"] == "event" and not http else None
+    jkey = combo_key(region_code, ptype)
+    done_pages = journal.done_pages(jkey) if journal else {}
+    cap = args.get("max_pages_per_combo")
+    state.setdefault("pages", 0)
+    state.setdefault("cards", 0)
+    page, empty_runs, queued = 1, 0, 0
+
+    while not (cap and page > cap):
+        if page in done_pages:
+            empty_runs = empty_runs + 1 if done_pages[page] == 0 else 0
+            state["cards"] += done_pages[page]
+            page += 1
+            continue
+
+        t_page = time.perf_counter()
+        if http:   # 로드 실패는 예외 (crawl_region_property 와 같음)
+            http_go_list_page(driver, region_code, ptype, page, page_pause=kw["page_pause"], prefix=prefix)
+        else:
+            go_list_page(driver, region_code, ptype, page, page_pause=kw["page_pause"], prefix=prefix, readiness=ready)
+        state["pages"] += 1
+        cards = http_collect_cards(driver, region_code, ptype, page) if http else collect_cards(driver)
+        state["cards"] += len(cards)
+        log(prefix, f"[PAGE {page}] cards: {len(cards)}")
+
+        if not cards:
+            empty_runs += 1
+            if journal:
+                journal.commit_page(jkey, page, 0, 0, 0, [])
+            if empty_runs >= 2 or not (http_has_next(driver) if http else has_next(driver)):
+                log(prefix, "[STOP] 카드 없음 or 다음 없음 → 종료")
+                break
+            page += 1
+            continue
+        empty_runs = 0
+
+        refs = page_refs(driver, cards)
+        fps = http_card_fingerprints(cards) if http else card_fingerprints(driver, cards)
+        write_fingerprints(fp_csv, city, ptype_name, fps)
+        carried, todo = [], list(range(1, len(cards) + 1))
+        if prev:
+            todo = []
+            for ci, (key, fp) in enumerate(fps, start=1):
+                hit = prev.lookup(city, ptype_name, key, fp)
+                if hit:
+                    carried.append((ci,) + carried_detail(hit) + (key,))
+                else:
+                    todo.append(ci)
+        if shared:
+            dup = shared.known([key for key, _ in fps])
+            if dup:
+                carried = [c for c in carried if c[0] not in dup]
+                todo = [ci for ci in todo if ci not in dup]
+                STATS.count("cards_shared_skip", len(dup))
+                log(prefix, f"[PAGE {page}] 다른 조합에서 이미 수집 {len(dup)} → 건너뜀")
+
+        item = {"city": city, "region_code": region_code, "ptype": ptype, "page": page,
+                "page_url": driver.current_url, "cards": len(cards), "carried": carried,
+                "refs": [(ci,) + refs[ci - 1] + (fps[ci - 1][0],) for ci in todo]}
+        STATS.observe("page", time.perf_counter() - t_page)   # 파이프라인에서는 목록 단계만
+        t_put = time.perf_counter()
+        args["pipe_queue"].put(item)
+        STATS.observe("queue_put", time.perf_counter() - t_put)   # 큐가 가득 차 기다린 시간 → 상세 단계가 느림
+        queued += len(todo) + len(carried)
+        if ready:
+            ready.take()
+        if recycle:
+            driver = recycle.check(driver, prefix)
+        page += 1
+    return queued
+
+def run_enumerate(task):
+    """task = (city, region_code, ptype_code, args, wid). 목록 워커 풀에서 조합 1개 열거"""
+    city, region_code, ptype, args, wid = task
+    prefix = f"[L{wid}]"
+    ptype_name = PROPERTY_TYPES.get(ptype, f"type_{ptype}")
+    log(prefix, f"목록 시작 → {city}/{ptype_name}")
+    state, t0 = {}, time.time()
+    with worker_driver(args, prefix, f"list_{city}_{ptype}") as driver:
+        queued = enumerate_combo(driver, args, city, region_code, ptype, prefix, state)
+    tally: Dict[str, Dict] = {}
+    tally_combo(tally, combo_key(region_code, ptype), state["pages"], state["cards"], time.time() - t0)
+    startup_sec, starts = take_startup_stats()
+    return {"city": city, "ptype": ptype_name, "ok": 0, "fail": 0, "queued": queued, "out_csv": "",
+            "startup_sec": startup_sec, "driver_starts": starts, "pid": os.getpid(), "stats": STATS.take(),
+            "combos": tally}
+
+def extract_page(driver, args: Dict, item: Dict, outs: Dict, seen: Dict[str, set], tally: Dict,
+                 prefix: str, ready: Optional[Readiness] = None) -> Tuple[int, int]:
+    """
+    큐 묶음 1개(= 목록 페이지 1개) 상세 수집. 출력은 조합별 프로세스 파일(__x{pid}) 또는 공유 결과 저장소,
+    기록 후 저널 커밋 → shared_seen 추가 (crawl_region_property 의 페이지 끝과 같은 순서). 반환: (성공, 실패)
+    """
+    city, ptype, page = item["city"], item["ptype"], item["page"]
+    ptype_name = PROPERTY_TYPES.get(ptype, f"type_{ptype}")
+    key = combo_key(item["region_code"], ptype)
+    if key not in outs:
+        out_csv, fail_csv = _prepare_out(args, city, ptype_name, suffix=f"__x{os.getpid()}")
+        outs[key] = (ResultSink(out_csv, args.get("out_format", "csv"), get_result_store(args.get("result_db"))), fail_csv)
+    sink, fail_csv = outs[key]
+    urls = seen.setdefault(key, set())
+    detail_pause = args.get("detail_pause", DEFAULT_DETAIL_PAUSE)
+
+    t0 = time.perf_counter()
+    order = [r[0] for r in item["refs"]]
+    sub = [(name, url) for _, name, url, _ in item["refs"]]
+    hkeys = {r[0]: r[3] for r in item["refs"]}
+    hkeys.update({c[0]: c[3] for c in item["carried"]})
+    if not sub:
+        details = iter([])
+    elif isinstance(driver, HttpBackend):
+        details = iter_http_details(driver, sub, detail_pause, prefix)
+    else:
+        details = iter_url_details(driver, sub, detail_pause, prefix, readiness=ready)
+    details = ((order[i - 1], d, r, why) for i, d, r, why in details)
+    carried_ci = {c[0] for c in item["carried"]}
+
+    rows, fails, page_urls, page_keys = [], [], [], []
+    t_card = time.perf_counter()
+    for ci, detail, ratings, reason in chain((c[:3] + ("",) for c in item["carried"]), details):
+        now = time.perf_counter()
+        if ci not in carried_ci:
+            STATS.observe("card", now - t_card)
+            governor_report(reason or ("" if any(detail.values()) else "parse_detail:empty"), prefix)
+        t_card = now
+        if not reason and not any(detail.values()):
+            reason = "parse_detail:empty"
+        if reason:
+            fails.append({"city": city, "property_type": ptype_name, "page": page,
+                          "card_index": ci, "reason": reason, "page_url": item["page_url"]})
+            continue
+        durl = detail.get("detail_url", "")
+        if durl and durl in urls:
+            continue
+        if durl:
+            urls.add(durl)
+            page_urls.append(durl)
+        row = detail_row(city, ptype_name, 0, 0, detail, ratings)   # idx / region_idx 는 병합에서 부여
+        log(prefix, f"→ {row.city}/{row.property_type} p{page} | {row.name} | {row.grade} | {row.tel} | {row.address}", CARD_LOG)
+        rows.append(row)
+        page_keys.append(hkeys[ci])
+        report_progress()
+
+    sink.write(rows)
+    if fails:
+        write_failures(fail_csv, fails, header=False)
+    journal = get_journal(args.get("journal_path"))
+    if journal:
+        sink.flush()
+        journal.commit_page(key, page, item["cards"], len(rows), len(fails), page_urls)
+    if args.get("seen_cards") is not None and page_keys:
+        SharedSeen(args["seen_cards"]).add(page_keys, key)
+    tally_combo(tally, key, 0, 0, time.perf_counter() - t0)   # 카드 수는 목록 단계(run_enumerate)가 집계
+    return len(rows), len(fails)
+
+def fail_item(args: Dict, item: Dict, reason: str, refs: List[Tuple]) -> int:
+    """큐 묶음의 카드(refs/carried 항목, 첫 값이 카드 번호)를 실패로 기록 (재시도 패스가 다시 수집). 반환: 기록 수"""
+    ptype_name = PROPERTY_TYPES.get(item["ptype"], f"type_{item['ptype']}")
+    _, fail_csv = _prepare_out(args, item["city"], ptype_name, suffix=f"__x{os.getpid()}")
+    write_failures(fail_csv, [{"city": item["city"], "property_type": ptype_name, "page": item["page"],
+                               "card_index": r[0], "reason": reason, "page_url": item["page_url"]} for r in refs],
+                   header=False)
+    return len(refs)
+
+def fail_queued(args: Dict, reason: str) -> int:
+    """상세 워커가 모두 사라졌을 때 마스터가 큐를 비우며 묶음을 실패로 기록 → 목록 워커의 put 대기 해제. 반환: 페이지 수"""
+    n = 0
+    while True:
+        try:
+            item = args["pipe_queue"].get_nowait()
+        except queue.Empty:
+            return n
+        if item is not None:
+            fail_item(args, item, reason, item["refs"] + item["carried"])
+            n += 1
+
+def run_extract(task):
+    """
+    task = (args, wid). 상세 워커 풀에서 큐가 끝(None)을 줄 때까지 묶음 처리.
+    묶음 처리 중 오류면 드라이버를 버리고 그 페이지 카드를 실패로 남김 (재시도 패스가 다시 수집)
+    """
+    args, wid = task
+    prefix = f"[X{wid}]"
+    q = args["pipe_queue"]
+    outs: Dict[str, Tuple[ResultSink, str]] = {}
+    seen: Dict[str, set] = {}
+    tally: Dict[str, Dict] = {}
+    ready = Readiness(floor=args.get("politeness_floor", DEFAULT_POLITENESS_FLOOR)) \
+        if args.get("readiness") == "event" and args.get("backend") != "http" else None
+    recycle = worker_recycler(args)
+    ok_sum, fail_sum, pages = 0, 0, 0
+    while True:
+        t_get = time.perf_counter()
+        item = q.get()
+        STATS.observe("queue_get", time.perf_counter() - t_get)   # 큐가 비어 기다린 시간 → 목록 단계가 느림
+        if item is None:
+            break
+        try:
+            driver = acquire_worker_driver(args, f"x{wid}")
+            ok_n, fail_n = extract_page(driver, args, item, outs, seen, tally, prefix, ready)
+            if recycle:
+                recycle.check(driver, prefix)
+        except Exception as e:
+            ptype_name = PROPERTY_TYPES.get(item["ptype"], f"type_{item['ptype']}")
+            log(prefix, f"[WARN] {item['city']}/{ptype_name} p{item['page']} 상세 오류 → 드라이버 재기동: {type(e).__name__}: {e}")
+            release_worker_driver()
+            ok_n, fail_n = 0, fail_item(args, item, f"pipeline:{type(e).__name__}", item["refs"])
+        ok_sum, fail_sum, pages = ok_sum + ok_n, fail_sum + fail_n, pages + 1
+    for sink, _ in outs.values():
+        sink.close()
+    log(prefix, f"[EXTRACT] 페이지 {pages}개 처리 ok:{ok_sum} fail:{fail_sum}")
+    startup_sec, starts = take_startup_stats()
+    return {"city": "*", "ptype": f"extract:{pages}", "ok": ok_sum, "fail": fail_sum, "out_csv": "",
+            "startup_sec": startup_sec, "driver_starts": starts, "extract": True,
+            "pid": os.getpid(), "stats": STATS.take(), "combos": tally}
+
+def run_pipeline(tasks: List[Tuple], args: Dict, log_queue, progress, list_workers: int, detail_workers: int,
+                 prefix: str, retry_failures: bool = True) -> Tuple[List[Dict], Dict]:
+    """
+    목록 풀(list_workers) 과 상세 풀(detail_workers) 을 따로 띄워 args["pipe_queue"] 로 연결.
+    열거가 끝나면 상세 워커 수만큼 None 을 넣어 종료시키고, 실패 재시도는 상세 풀에서.
+    큐 깊이를 PIPE_SAMPLE_SEC 마다 표본으로 모아 병목 단계 판정 → (결과 목록, {"queue_*": ...})
+    """
+    q, cap = args["pipe_queue"], args["pipe_queue_size"]
+    largs = dict(args, backend=args.get("list_backend") or args.get("backend", "chrome"), detail_tabs=1)
+    results: List[Dict] = []
+    depths: List[int] = []
+    last_log = time.time()
+
+    def drain(futs, label: str, xfuts=None):
+        nonlocal last_log
+        pending = set(futs)
+        while pending:
+            done, pending = wait(pending, timeout=PIPE_SAMPLE_SEC, return_when=FIRST_COMPLETED)
+            if xfuts and all(f.done() for f in xfuts):
+                # 상세 워커가 모두 끝남(프로세스 사망 → BrokenProcessPool 등): 큐를 읽을 쪽이 없으니
+                # 시작 안 한 목록 작업은 취소하고, 큐에 쌓인/쌓일 페이지는 실패로 기록해 put 대기를 풂
+                cancelled = sum(f.cancel() for f in pending)
+                failed = fail_queued(args, "pipeline:no_extractor")
+                if cancelled or failed:
+                    log(prefix, f"[ERROR] 상세 워커 없음 → 목록 작업 {cancelled}개 취소, 큐의 페이지 {failed}개 실패 처리")
+            for fut in done:
+                try:
+                    r = fut.result()
+                    results.append(r)
+                    if "queued" in r:
+                        log(prefix, f"[LISTED] {r['city']}/{r['ptype']} 카드 {r['queued']} 큐 투입")
+                except Exception as e:
+                    log(prefix, f"[ERROR] {label} 작업 실패: {e}")
+            if label == "목록":
+                depths.append(q.qsize())
+                if time.time() - last_log >= PIPE_REPORT_SEC:
+                    last_log = time.time()
+                    log(prefix, f"[PIPE] 큐 {depths[-1]}/{cap}, 남은 목록 작업 {len(pending)}")
+
+    def send_stop(xfuts) -> bool:
+        """상세 워커 수만큼 종료 신호(None). 보내는 도중 상세 워커가 모두 사라지면 False (가득 찬 큐에서 멈추지 않음)"""
+        for _ in xfuts:
+            while True:
+                if all(f.done() for f in xfuts):
+                    return False
+                try:
+                    q.put(None, timeout=PIPE_SAMPLE_SEC)
+                    break
+                except queue.Full:
+                    pass
+        return True
+
+    with ProcessPoolExecutor(max_workers=detail_workers, initializer=_worker_init,
+                             initargs=(args, log_queue, progress)) as dx, \
+         ProcessPoolExecutor(max_workers=list_workers, initializer=_worker_init,
+                             initargs=(largs, log_queue, progress)) as lx:
+        xfuts = [dx.submit(run_extract, (args, i)) for i in range(1, detail_workers + 1)]
+        drain([lx.submit(run_enumerate, (c, rc, pt, largs, wid)) for c, rc, pt, _, wid in tasks], "목록", xfuts)
+        extractors_alive = send_stop(xfuts)
+        if not extractors_alive:
+            fail_queued(args, "pipeline:no_extractor")
+        drain(xfuts, "상세")
+        if retry_failures and extractors_alive:
+            results.extend(retry_failed_pages(dx, args, prefix))
+        elif retry_failures:
+            log(prefix, "[WARN] 상세 풀 사용 불가 → 실패 재시도 생략 (failures.csv 에 남김)")
+
+    info = {}
+    if depths:
+        full = sum(d >= cap for d in depths) / len(depths)
+        empty = sum(d == 0 for d in depths) / len(depths)
+        verdict = "상세 추출" if full >= PIPE_BOTTLENECK else "목록 열거" if empty >= PIPE_BOTTLENECK else "균형"
+        info = {"queue_cap": cap, "queue_depth_avg": round(sum(depths) / len(depths), 2),
+                "queue_full_ratio": round(full, 3), "queue_empty_ratio": round(empty, 3), "bottleneck": verdict}
+        log(prefix, f"[PIPE] 큐 평균 {info['queue_depth_avg']}/{cap}, 가득 참 {full:.0%}, 비어 있음 {empty:.0%} "
+                    f"→ 병목: {verdict} (list_workers={list_workers}, detail_workers={detail_workers})")
+    return results, info
+
+# ------------ 실패 재시도 패스 ------------
+def load_failed_pages(tmp_dir: str) -> Tuple[Dict[Tuple[str, str, int], List[Dict]], List[str]]:
+    """조합별 *_fail.csv → {(city, property_type, page): [실패 행]}, 읽은 파일 목록"""
+    files = sorted(os.path.join(tmp_dir, f) for f in os.listdir(tmp_dir) if f.endswith("_fail.csv"))
+    pages: Dict[Tuple[str, str, int], List[Dict]] = {}
+    for path in files:
+        for r in iter_csv_rows(path):
+            try:
+                key = (r["city"], r["property_type"], int(r["page"]))
+            except (KeyError, ValueError):
+                continue
+            pages.setdefault(key, []).append(r)
+    return pages, files
 
-        ok_cnt, fail_cnt, g_last, r_last = crawl_region_property(
-            driver=driver,
-            city=city,
-            region_code=region_code,
-            property_type_code=ptype,
-            page_pause=args.get("page_pause", DEFAULT_PAGE_PAUSE),
-            detail_pause=args.get("detail_pause", DEFAULT_DETAIL_PAUSE),
-            checkpoint_enabled=True,
-            checkpoint_every=args.get("checkpoint_every", 50),
-            out_csv=out_csv,
-            fail_csv=fail_csv,
-            start_page=1,
-            max_pages=args.get("max_pages_per_combo", None),
-            global_index_start=1,
-            region_index_start=1,
-            prefix=prefix
+def run_retry(task):
+    """
+    task = (args, city, region_code, ptype, page, card_indices, wid)
+    실패한 페이지 하나를 다시 열어 실패했던 카드만 재수집 (저널/증분 미사용, 출력은 프로세스별 __r 파일)
+    """
+    args, city, region_code, ptype, page, indices, wid = task
+    prefix = f"[R{wid}]"
+    ptype_name = PROPERTY_TYPES.get(ptype, f"type_{ptype}")
+    out_csv, fail_csv = _prepare_out(args, city, ptype_name, suffix=f"__r{os.getpid()}")
+    log(prefix, f"[RETRY] {city}/{ptype_name} p{page} 카드 {indices}")
+    kw = dict(_crawl_kwargs(args), journal=None, prev_catalog=None)
+    with worker_driver(args, prefix, f"retry{wid}") as driver:
+        ok_cnt, fail_cnt, _, _ = crawl_region_property(
+            driver=driver, city=city, region_code=region_code, property_type_code=ptype,
+            out_csv=out_csv, fail_csv=fail_csv, start_page=page, max_pages=page,
+            prefix=prefix, only_cards=set(indices), **kw,
         )
-        log(prefix, f"완료 → {city}/{ptype_name} ok:{ok_cnt} fail:{fail_cnt}")
-        return {"city": city, "ptype": ptype_name, "ok": ok_cnt, "fail": fail_cnt, "out_csv": out_csv}
+    startup_sec, starts = take_startup_stats()
+    return {"city": city, "ptype": f"{ptype_name} p{page} retry", "ok": ok_cnt, "fail": fail_cnt, "out_csv": out_csv,
+            "startup_sec": startup_sec, "driver_starts": starts, "retry": True,
+            "pid": os.getpid(), "stats": STATS.take()}
+
+# 다시 열어도 결과가 같은 실패 사유 (재시도하지 않고 그대로 failures.csv 로)
+PERMANENT_FAIL_REASONS = {"http:no_detail_url", "pipeline:no_detail_url"}
+
+def retry_failed_pages(ex: ProcessPoolExecutor, args: Dict, prefix: str,
+                       scaler: Optional[Autoscaler] = None) -> List[Dict]:
+    """
+    본 수집 후 실패 카드만 페이지 단위로 병렬 재시도.
+    기존 *_fail.csv 는 *.retried 로 옮기고(병합 제외), 남은 실패는 재시도 작업의 __r*_fail.csv 에만 남음.
+    작업 자체가 죽은 페이지의 원래 실패 행과 재시도해도 소용없는 사유(PERMANENT_FAIL_REASONS)의 행은
+    retry_pending_fail.csv 로 보존.
+    """
+    tmp_dir = args["tmp_out_dir"]
+    pages, files = load_failed_pages(tmp_dir)
+    if not pages:
+        return []
+    codes = {name: code for code, name in PROPERTY_TYPES.items()}
+    regions = dict(REGIONS)
+    jobs, job_rows, kept = [], [], []
+    for wid, ((city, ptype_name, page), rows) in enumerate(sorted(pages.items()), start=1):
+        ptype = codes.get(ptype_name)
+        if ptype is None and ptype_name.startswith("type_"):
+            ptype = int(ptype_name[len("type_"):])
+        if city not in regions or ptype is None:
+            kept += rows
+            continue
+        kept += [r for r in rows if r.get("reason") in PERMANENT_FAIL_REASONS]
+        rows = [r for r in rows if r.get("reason") not in PERMANENT_FAIL_REASONS]
+        if not rows:
+            continue
+        indices = sorted({int(r["card_index"]) for r in rows if str(r.get("card_index", "")).lstrip("-").isdigit()})
+        jobs.append((run_retry, (args, city, regions[city], ptype, page, indices, wid)))
+        job_rows.append(rows)
+    log(prefix, f"[RETRY] 실패 {sum(len(v) for v in pages.values())}건 → 페이지 {len(jobs)}개 재시도, "
+                f"그대로 유지 {len(kept)}건")
+
+    results = []
+    for i, fut in iter_pool(ex, jobs, scaler, prefix):
+        try:
+            r = fut.result()
+            results.append(r)
+        except Exception as e:
+            log(prefix, f"[ERROR] 재시도 작업 실패: {e}")
+            kept += job_rows[i]
+    for path in files:
+        os.replace(path, path + ".retried")
+    if kept:
+        write_failures(os.path.join(tmp_dir, "retry_pending_fail.csv"), kept, header=True)
+    log(prefix, f"[RETRY] 복구 {sum(r['ok'] for r in results)}건, 남은 실패 {sum(r['fail'] for r in results) + len(kept)}건")
+    return results
+
+# ------------ 스트리밍 병합 ------------
+MERGE_CHUNK_ROWS = 50_000   # 메모리에 올리는 최대 행 수 (초과 시 정렬된 청크를 디스크로)
+MERGE_WRITE_ROWS = 5_000    # 출력 버퍼 행 수
+
+def iter_csv_rows(path: str, prefix: str = ""):
+    """헤더 기준 dict 행 스트림. 기록 중인 파일의 잘린 마지막 줄 등 열 수가 맞지 않는 행은 건너뜀."""
+    try:
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            rd = csv.reader(f)
+            header = next(rd, None)
+            if not header:
+                return
+            n = len(header)
+            for rec in rd:
+                if len(rec) == n:
+                    yield dict(zip(header, rec))
+    except (OSError, csv.Error, UnicodeDecodeError) as e:
+        log(prefix, f"[SKIP] {path} 읽기 실패: {e}")
+
+def iter_parquet_rows(path: str, prefix: str = ""):
+    """Parquet 세그먼트 → CSV 와 같은 문자열 dict 행. footer 가 없는(기록 중/비정상 종료) 파일은 건너뜀."""
+    try:
+        pf = pq.ParquetFile(path)
+        for batch in pf.iter_batches(batch_size=MERGE_WRITE_ROWS):
+            for row in table_str_rows(pa.Table.from_batches([batch])):
+                yield dict(zip(RESULT_COLS, row))
+    except (OSError, pa.ArrowException) as e:
+        log(prefix, f"[SKIP] {path} 읽기 실패: {e}")
+
+_DEDUP_COLS = [RESULT_COLS.index(c) for c in ("detail_url", "name", "address")]
+
+def dedup_key(row: List[str]) -> int:
+    """정규화된 행의 detail_url|name|address 64bit blake2b 해시 (문자열 대신 정수만 보관)."""
+    key = "|".join(row[i] for i in _DEDUP_COLS)
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little")
+
+def merge_sort_key(row: List[str]):
+    # (city, property_type, name) 오름차순, 빈 값은 뒤로 (pandas na_position="last" 와 동일)
+    c, p, n = row[1], row[5], row[3]
+    return (c == "", c, p == "", p, n == "", n)
+
+# 근접 중복 판정
+NEAR_NAME_SIM = 0.7         # 이름 2-gram Jaccard 하한
+NEAR_ADDR_SIM = 0.5         # 주소 2-gram Jaccard 하한 (한쪽 주소가 비면 생략) → 같은 대표번호의 다른 지점 배제
+ADDR_BLOCK_CHARS = 12       # 주소 블록 키: 공백 제거 후 앞 N자
+LSH_MIN_BLOCK = 16          # 이 크기 이상 블록만 MinHash 밴드로 후보 추림 (작으면 쌍별 비교)
+MINHASH_PERM = 16
+LSH_BANDS = 8               # 밴드당 2행 → Jaccard ~0.35 이상이면 높은 확률로 후보
+LSH_BUCKET_CAP = 64         # 버킷당 비교 상한 (거대 버킷에서 이차 비용 방지)
+GRAMS_CACHE_ROWS = 4096     # 블록 비교 중 2-gram 집합 캐시 상한 (넘으면 비움)
+_MH_SALTS = [random.Random(i).getrandbits(32) for i in range(MINHASH_PERM)]   # 고정 시드 → 실행마다 같은 묶음
+KEY_STRIP_RE = re.compile(r"[\W_]+")
+DIGITS_RE = re.compile(r"\d+")
+CLUSTER_COLS = ["cluster", "action", "reason", "name_sim", "city", "property_type", "name", "tel", "address", "detail_url"]
+
+def bigrams(s: str) -> frozenset:
+    return frozenset(s[i:i + 2] for i in range(len(s) - 1)) if len(s) > 1 else frozenset([s] if s else [])
+
+def jaccard(a: frozenset, b: frozenset) -> float:
+    return len(a & b) / len(a | b) if a and b else 0.0
+
+def minhash(shingles: frozenset) -> Tuple[int, ...]:
+    """XOR 마스크 순열 MinHash 서명 (crc32 기반)"""
+    hs = [zlib.crc32(x.encode("utf-8")) for x in shingles] or [0]
+    return tuple(min([h ^ salt for h in hs]) for salt in _MH_SALTS)
+
+class NearDupIndex:
+    """
+    병합 1차 패스에서 행마다 add() → clusters() 로 같은 숙소 묶음 계산
+    - detail_url 의 정규 숙소 ID(N…)가 같으면 같은 숙소 (쿼리 파라미터/숙소유형 무관)
+    - 그 외: 전화번호 숫자 또는 주소 앞 ADDR_BLOCK_CHARS 자가 같은 블록 안에서만 비교.
+      큰 블록은 이름 MinHash 밴드가 겹치는 후보만 비교 → 카탈로그 전체로는 거의 선형.
+      판정: 이름 Jaccard ≥ NEAR_NAME_SIM, 이름 속 숫자(지점/호점) 일치, 주소 Jaccard ≥ NEAR_ADDR_SIM (주소가 없으면 생략)
+    - 대표: 묶음에서 채워진 필드가 가장 많은 행 (같으면 먼저 읽은 행)
+    - 메모리: 행당 정규화 이름/주소 문자열 + 정수 몇 개 (array). 2-gram 집합/MinHash 서명은
+      블록을 비교할 때만 그 블록 행에 대해 만들고 버림 → 병합의 평탄한 메모리 유지
+    """
+    _URL, _NAME, _TEL, _ADDR = (RESULT_COLS.index(c) for c in ("detail_url", "name", "tel", "address"))
+
+    def __init__(self):
+        self.ids: Dict[int, int] = {}              # 숙소 ID 키 → 처음 본 seq
+        self.blocks: Dict[int, object] = {}         # 블록 키 crc32 → seq (1행) | [seq, ...]
+        self.hids = array("q")                      # 숙소 ID 키 (0 = 없음)
+        self.nums = array("L")                      # 이름 속 숫자열 crc32
+        self.names: List[str] = []
+        self.addrs: List[str] = []
+        self.filled = bytearray()
+        self.parent = array("l")
+
+    @staticmethod
+    def _hid_key(hid: str) -> int:
+        if not hid:
+            return 0
+        return int(hid[1:]) + 1 if len(hid) <= 19 else zlib.crc32(hid.encode("utf-8")) + (1 << 62)
+
+    def _block(self, key: str, seq: int):
+        # 키 충돌은 비교 대상이 늘 뿐 (판정은 similar 가 정확히)
+        k = zlib.crc32(key.encode("utf-8"))
+        cur = self.blocks.get(k)
+        if cur is None:
+            self.blocks[k] = seq
+        elif isinstance(cur, list):
+            cur.append(seq)
+        else:
+            self.blocks[k] = [cur, seq]
+
+    def add(self, row: List[str]) -> int:
+        seq = len(self.parent)
+        self.parent.append(seq)
+        hid = self._hid_key(hotel_id_from_url(row[self._URL]))
+        name = KEY_STRIP_RE.sub("", row[self._NAME].lower())
+        addr = KEY_STRIP_RE.sub("", row[self._ADDR])
+        tel = tel_digits(row[self._TEL])
+        self.hids.append(hid)
+        self.names.append(name)
+        self.nums.append(zlib.crc32(" ".join(DIGITS_RE.findall(name)).encode("ascii")))
+        self.addrs.append(addr)
+        self.filled.append(min(255, sum(1 for v in row if v)))
+        if hid:
+            if hid in self.ids:
+                self._union(self.ids[hid], seq)
+            else:
+                self.ids[hid] = seq
+        if name:
+            if len(tel) >= 7:
+                self._block("t" + tel, seq)
+            if len(addr) >= ADDR_BLOCK_CHARS:
+                self._block("a" + addr[:ADDR_BLOCK_CHARS], seq)
+        return seq
+
+    def _find(self, x: int) -> int:
+        p = self.parent
+        while p[x] != x:
+            p[x] = p[p[x]]
+            x = p[x]
+        return x
+
+    def _union(self, a: int, b: int):
+        ra, rb = self._find(a), self._find(b)
+        if ra != rb:
+            self.parent[max(ra, rb)] = min(ra, rb)
+
+    def similar(self, a: int, b: int, grams: Dict[int, Tuple[frozenset, frozenset]]) -> bool:
+        """grams: 블록 안에서만 쓰는 {seq: (이름 2-gram, 주소 2-gram)} 캐시"""
+        if self.nums[a] != self.nums[b]:
+            return False
+        (na, aa), (nb, ab) = self._grams(a, grams), self._grams(b, grams)
+        if jaccard(na, nb) < NEAR_NAME_SIM:
+            return False
+        return not aa or not ab or jaccard(aa, ab) >= NEAR_ADDR_SIM
+
+    def _grams(self, seq: int, grams: Dict[int, Tuple[frozenset, frozenset]]) -> Tuple[frozenset, frozenset]:
+        g = grams.get(seq)
+        if g is None:
+            if len(grams) >= GRAMS_CACHE_ROWS:
+                grams.clear()
+            g = grams[seq] = (bigrams(self.names[seq]), bigrams(self.addrs[seq]))
+        return g
+
+    def _link_block(self, members: List[int]):
+        grams: Dict[int, Tuple[frozenset, frozenset]] = {}
+        if len(members) < LSH_MIN_BLOCK:
+            for i, a in enumerate(members):
+                for b in members[i + 1:]:
+                    if self._find(a) != self._find(b) and self.similar(a, b, grams):
+                        self._union(a, b)
+            return
+        rows = MINHASH_PERM // LSH_BANDS
+        buckets: Dict[Tuple, List[int]] = {}
+        for seq in members:
+            sig = minhash(bigrams(self.names[seq]))   # 서명은 밴드 버킷 키로만 쓰고 보관하지 않음
+            for band in range(LSH_BANDS):
+                bucket = buckets.setdefault((band,) + sig[band * rows:(band + 1) * rows], [])
+                for other in bucket[:LSH_BUCKET_CAP]:
+                    if self._find(other) != self._find(seq) and self.similar(other, seq, grams):
+                        self._union(other, seq)
+                        break
+                bucket.append(seq)
+
+    def clusters(self) -> Dict[int, List[int]]:
+        """{대표 seq: [묶음 전체 seq]} (2행 이상인 묶음만)"""
+        for members in self.blocks.values():
+            if isinstance(members, list):
+                self._link_block(members)
+        groups: Dict[int, List[int]] = {}
+        for seq in range(len(self.parent)):
+            root = self._find(seq)      # 루트 = 묶음의 최소 seq → 먼저 지나감
+            if root != seq:
+                groups.setdefault(root, [root]).append(seq)
+        out = {}
+        for members in groups.values():
+            if len(members) > 1:
+                out[max(members, key=lambda s: (self.filled[s], -s))] = members
+        return out
+
+    def reason(self, rep: int, seq: int) -> Tuple[str, float]:
+        sim = jaccard(bigrams(self.names[rep]), bigrams(self.names[seq]))
+        return ("id" if self.hids[seq] and self.hids[seq] == self.hids[rep] else "near"), sim
+
+def _spill_chunk(rows: List[List[str]], spill_dir: str) -> str:
+    rows.sort(key=merge_sort_key)
+    fd, path = tempfile.mkstemp(suffix=".csv", dir=spill_dir)
+    with os.fdopen(fd, "w", newline="", encoding="utf-8") as f:
+        csv.writer(f).writerows(rows)
+    return path
+
+def _iter_spill(path: str):
+    with open(path, newline="", encoding="utf-8") as f:
+        yield from csv.reader(f)
+
+def write_merged(stream, final_csv: str, final_pq: str, index: Optional[NearDupIndex], prefix: str,
+                 note: str = "", cluster_csv: Optional[str] = None) -> int:
+    """
+    merge_sort_key 순서로 정렬된 행 스트림 → final_csv (+ final_pq). .part 에 쓴 뒤 교체
+    - idx / region_idx 는 쓰면서 바로 부여
+    - index 가 있으면 행 맨 뒤 열이 index 의 seq: 묶음의 대표 행만 쓰고 묶음은 cluster_csv 에 보고
+    반환: 기록한 행 수
+    """
+    clusters = index.clusters() if index else {}
+    cluster_of = {seq: (rep, cid) for cid, (rep, members) in enumerate(sorted(clusters.items()), start=1)
+                  for seq in members}
+    report, near = [], 0
+
+    part = final_csv + ".part"
+    pw = pq.ParquetWriter(final_pq + ".part", result_schema(), compression="zstd") if final_pq else None
+    with open(part, "w", newline="", encoding="utf-8-sig") as f:
+        w = csv.writer(f, lineterminator="\n")
+        w.writerow(RESULT_COLS)
+        out, group, ridx = [], None, 0
+        idx = 0
+        for row in stream:
+            if index:
+                seq = int(row.pop())
+                if seq in cluster_of:
+                    rep, cid = cluster_of[seq]
+                    why, sim = index.reason(rep, seq)
+                    keep = seq == rep
+                    report.append([cid, "keep" if keep else "drop", "" if keep else why,
+                                   "" if keep else f"{sim:.2f}", row[1], row[5], row[3], row[7], row[8], row[14]])
+                    if not keep:
+                        near += 1
+                        continue
+            idx += 1
+            g = (row[1], row[5])
+            ridx = ridx + 1 if g == group else 1
+            group = g
+            row[0], row[2] = idx, ridx
+            out.append(row)
+            if len(out) >= MERGE_WRITE_ROWS:
+                w.writerows(out)
+                if pw:
+                    pw.write_table(rows_to_table(out))
+                out = []
+        w.writerows(out)
+        if pw:
+            if out:
+                pw.write_table(rows_to_table(out))
+            pw.close()
+    os.replace(part, final_csv)
+    log(prefix, f"[MERGE] {idx} rows ({note + ', ' if note else ''}near-dup {near}) → {final_csv}")
+    if index:
+        cluster_csv = cluster_csv or os.path.splitext(final_csv)[0] + "_clusters.csv"
+        report.sort(key=lambda r: (r[0], r[1] != "keep"))
+        with open(cluster_csv, "w", newline="", encoding="utf-8-sig") as f:
+            w = csv.writer(f, lineterminator="\n")
+            w.writerow(CLUSTER_COLS)
+            w.writerows(report)
+        log(prefix, f"[MERGE] 중복 묶음 {len(clusters)}개 → {cluster_csv}")
+    if pw:
+        os.replace(final_pq + ".part", final_pq)
+        log(prefix, f"[MERGE] Parquet → {final_pq}")
+    return idx
+
+def export_store(store_path: str, final_csv: str, final_pq: str, prefix: str,
+                 near_dup: bool = True, cluster_csv: Optional[str] = None):
+    """
+    공유 결과 저장소 → 최종 CSV. 중복은 저장소 UNIQUE 키가 이미 제거했고 정렬도 SQLite 가 하므로
+    정렬 순서 그대로 한 번 내보냄 (near_dup 이면 같은 스냅숏을 한 번 더 읽어 근접 중복 묶음 계산)
+    """
+    if not os.path.exists(store_path):
+        log(prefix, f"[WARN] 결과 저장소 없음: {store_path}")
+        return
+    store = ResultStore(store_path)
+    try:
+        store.conn.execute("BEGIN")   # 읽기 스냅숏: 실행 중 내보내도 두 번 읽는 사이 행이 바뀌지 않음
+        n_rows = store.count()
+        if not n_rows:
+            log(prefix, "[WARN] 병합할 결과 행 없음")
+            return
+        index = None
+        if near_dup:
+            index = NearDupIndex()
+            for row in store.iter_rows():
+                index.add(row)
+        stream = (row + [seq] for seq, row in enumerate(store.iter_rows())) if index else store.iter_rows()
+        os.makedirs(os.path.dirname(final_csv) or ".", exist_ok=True)
+        write_merged(stream, final_csv, final_pq, index, prefix, f"store {store_path}", cluster_csv)
     finally:
+        store.conn.execute("END")
+        store.close()
+
+def merge_and_polish(tmp_dir: str, final_csv: str, final_fail_csv: str, prefix: str,
+                     chunk_rows: int = MERGE_CHUNK_ROWS, out_format: str = "csv",
+                     near_dup: bool = True, cluster_csv: Optional[str] = None,
+                     store_path: Optional[str] = None):
+    """
+    조합별 CSV → 최종 CSV 스트리밍 병합
+    - 정규화: 주소/전화/등급/평점을 읽은 묶음 단위로 컬럼별 일괄 정리 (normalize_rows)
+    - 중복 제거: 정규화된 행 키의 64bit 해시 집합만 메모리에 유지
+    - near_dup: NearDupIndex 로 같은 숙소 묶음을 찾아 대표 행만 기록, 묶음은 cluster_csv(기본 {결과}_clusters.csv)에 보고
+    - 정렬: chunk_rows 단위로 정렬해 임시 파일로 내리고 heapq.merge 로 외부 병합
+    - idx / region_idx 는 정렬된 스트림을 쓰면서 바로 부여
+    - 크롤 진행 중에도 실행 가능 (잘린 행은 건너뛰고, 결과는 .part 에 쓴 뒤 교체)
+    - out_format="parquet": 조합별 Parquet 세그먼트를 읽음 / "parquet"|"both": 최종 .parquet 도 함께 기록
+    - store_path: 조합별 결과 파일 대신 공유 결과 저장소를 정렬 순서로 내보냄 (export_store, 실패 CSV 병합은 동일)
+    """
+    names = sorted(os.listdir(tmp_dir)) if os.path.isdir(tmp_dir) else []
+    if out_format == "parquet":
+        files = [os.path.join(tmp_dir, f) for f in names if f.endswith(".parquet")]
+        read_rows = iter_parquet_rows
+    else:
+        files = [os.path.join(tmp_dir, f) for f in names if f.endswith(".csv") and not f.endswith("_fail.csv")]
+        read_rows = iter_csv_rows
+    final_pq = os.path.splitext(final_csv)[0] + ".parquet" if out_format != "csv" else ""
+    fail_files = [os.path.join(tmp_dir, f) for f in names if f.endswith("_fail.csv")]
+
+    if store_path:
+        export_store(store_path, final_csv, final_pq, prefix, near_dup, cluster_csv)
+    elif files:
+        seen, buf, spills, dups = set(), [], [], 0
+        index = NearDupIndex() if near_dup else None
+        os.makedirs(os.path.dirname(final_csv) or ".", exist_ok=True)
+        spill_dir = tempfile.mkdtemp(prefix="merge_", dir=os.path.dirname(os.path.abspath(final_csv)))
         try:
-            if driver: driver.quit()
-        except Exception: pass
-        shutil.rmtree(tmp_profile, ignore_errors=True)
-
-def merge_and_polish(tmp_dir: str, final_csv: str, final_fail_csv: str, prefix: str):
-    files = [os.path.join(tmp_dir, f) for f in os.listdir(tmp_dir)
-             if f.endswith(".csv") and not f.endswith("_fail.csv")]
-    fail_files = [os.path.join(tmp_dir, f) for f in os.listdir(tmp_dir)
-                  if f.endswith("_fail.csv")]
-
-    if files:
-        dfs = []
-        for f in files:
-            try:
-                df = pd.read_csv(f, dtype=str)
-                dfs.append(df)
-            except Exception as e:
-                log(prefix, f"[SKIP] {f} 읽기 실패: {e}")
-
-        if dfs:
-            all_df = pd.concat(dfs, ignore_index=True)
-            if "detail_url" in all_df.columns:
-                all_df["__dupk"] = all_df["detail_url"].fillna("") + "|" + all_df["name"].fillna("") + "|" + all_df["address"].fillna("")
+            for path in files:
+                for batch in iter_row_batches(read_rows(path, prefix), MERGE_WRITE_ROWS):
+                    for row in normalize_rows(batch):
+                        k = dedup_key(row)
+                        if k in seen:
+                            dups += 1
+                            continue
+                        seen.add(k)
+                        if index:
+                            row.append(index.add(row))   # 맨 뒤 임시 열: 행 번호(seq)
+                        buf.append(row)
+                        if len(buf) >= chunk_rows:
+                            spills.append(_spill_chunk(buf, spill_dir))
+                            buf = []
+            n_rows = len(seen)
+            del seen
+
+            if n_rows:
+                buf.sort(key=merge_sort_key)
+                stream = heapq.merge(*[_iter_spill(p) for p in spills], buf, key=merge_sort_key) if spills else iter(buf)
+                write_merged(stream, final_csv, final_pq, index, prefix, f"dup {dups}, spill {len(spills)}", cluster_csv)
             else:
-                all_df["__dupk"] = all_df["name"].fillna("") + "|" + all_df["address"].fillna("")
-            all_df = all_df.drop_duplicates("__dupk").drop(columns="__dupk")
-
-            all_df = all_df.sort_values(["city", "property_type", "name"], na_position="last")
-            all_df["region_idx"] = (all_df.groupby(["city", "property_type"]).cumcount() + 1).astype(int)
-            all_df["idx"] = range(1, len(all_df) + 1)
-
-            cols = ["idx","city","region_idx","name","name_en","property_type",
-                    "grade","tel","address","rating_hotelscombined","rating_booking",
-                    "rating_tripadvisor","rating_naver","website","detail_url"]
-            for c in cols:
-                if c not in all_df.columns:
-                    all_df[c] = ""
-            all_df = all_df[cols]
-
-            os.makedirs(os.path.dirname(final_csv), exist_ok=True)
-            all_df.to_csv(final_csv, index=False, encoding="utf-8-sig")
-            log(prefix, f"[MERGE] {len(all_df)} rows → {final_csv}")
-        else:
-            log(prefix, "[WARN] 병합할 결과 DF 없음")
+                log(prefix, "[WARN] 병합할 결과 행 없음")
+        finally:
+            shutil.rmtree(spill_dir, ignore_errors=True)
     else:
         log(prefix, "[WARN] 결과 파일 없음")
 
     if fail_files:
-        fdfs = []
-        for f in fail_files:
+        header, n_fail = None, 0
+        part = final_fail_csv + ".part"
+        os.makedirs(os.path.dirname(final_fail_csv) or ".", exist_ok=True)
+        with open(part, "w", newline="", encoding="utf-8-sig") as f:
+            w = csv.writer(f, lineterminator="\n")
+            for path in fail_files:
+                if header is None:
+                    with open(path, newline="", encoding="utf-8-sig") as src:
+                        header = next(csv.reader(src), None)
+                    if header:
+                        w.writerow(header)
+                for r in iter_csv_rows(path, prefix):
+                    w.writerow([r.get(c, "") for c in header])
+                    n_fail += 1
+        if not header:
+            os.remove(part)
+        else:
+            os.replace(part, final_fail_csv)
+            log(prefix, f"[MERGE FAIL] {n_fail} rows → {final_fail_csv}")
+
+# ------------ 조합 크기 카탈로그 (LPT 배정) ------------
+DEFAULT_CATALOG_PATH = "out/combo_catalog.json"
+EMPTY_PROBE_AFTER = 3       # 연속 N회 빈 조합은 다음 실행부터 HTTP 1회 탐색으로 확인 후 건너뜀
+
+class ComboCatalog:
+    """
+    조합별 크기 기록 {"combos": {combo_key: {city, property_type, pages, cards, sec, empty_runs, runs, updated}}}
+    cards 는 목록에서 본 카드 수 (이월/중복 건너뜀/실패 포함, 만든 행 수가 아님) → 0 일 때만 empty_runs 증가
+    sec 는 해당 조합에 든 작업 시간 합(샤드로 나뉘어도 합산) → LPT 배정/예상 시간의 비용
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self.combos: Dict[str, Dict] = {}
+        if os.path.exists(path):
             try:
-                df = pd.read_csv(f, dtype=str)
-                fdfs.append(df)
-            except Exception as e:
-                log(prefix, f"[SKIP] {f} 읽기 실패: {e}")
-        if fdfs:
-            all_fail = pd.concat(fdfs, ignore_index=True)
-            os.makedirs(os.path.dirname(final_fail_csv), exist_ok=True)
-            all_fail.to_csv(final_fail_csv, index=False, encoding="utf-8-sig")
-            log(prefix, f"[MERGE FAIL] {len(all_fail)} rows → {final_fail_csv}")
+                with open(path, encoding="utf-8") as f:
+                    self.combos = json.load(f).get("combos", {})
+            except (OSError, ValueError) as e:
+                log("[CATALOG]", f"[WARN] {path} 읽기 실패 → 빈 카탈로그: {e}")
+
+    def sec_per_card(self) -> Optional[float]:
+        known = [e for e in self.combos.values() if e.get("sec") and e.get("cards")]
+        return sum(e["sec"] for e in known) / sum(e["cards"] for e in known) if known else None
+
+    def cost(self, key: str) -> Optional[float]:
+        """예상 작업 시간(초): 지난 실측, 없으면 카드 수 × 평균 카드당 시간. 기록 없으면 None"""
+        e = self.combos.get(key)
+        if not e:
+            return None
+        if e.get("sec"):
+            return e["sec"]
+        spc = self.sec_per_card()
+        return e.get("cards", 0) * spc if spc else 0.0
+
+    def dormant(self, key: str) -> bool:
+        return self.combos.get(key, {}).get("empty_runs", 0) >= EMPTY_PROBE_AFTER
+
+    def order(self, tasks: List[Tuple]) -> List[Tuple]:
+        """큰 조합부터 (LPT). 기록이 없는 조합은 크기를 모르므로 맨 앞"""
+        def rank(t):
+            c = self.cost(combo_key(t[1], t[2]))
+            return (c is not None, -(c or 0.0))
+        return sorted(tasks, key=rank)
+
+    def update(self, key: str, city: str, ptype_name: str, pages: int, cards: int, sec: float):
+        e = self.combos.setdefault(key, {"empty_runs": 0, "runs": 0})
+        e.update(city=city, property_type=ptype_name, pages=pages, cards=cards, sec=round(sec, 3),
+                 runs=e["runs"] + 1, updated=time.strftime("%Y-%m-%dT%H:%M:%S"))
+        e["empty_runs"] = e["empty_runs"] + 1 if cards == 0 else 0
+
+    def save(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        part = self.path + ".part"
+        with open(part, "w", encoding="utf-8") as f:
+            json.dump({"combos": self.combos}, f, ensure_ascii=False, indent=1, sort_keys=True)
+        os.replace(part, self.path)
+
+def probe_dormant(catalog: ComboCatalog, tasks: List[Tuple], prefix: str,
+                  rate_limit: Optional[float] = None) -> Tuple[List[Tuple], List[Tuple]]:
+    """
+    연속으로 비어 있던 조합만 HTTP 로 1페이지 확인 (Chrome 기동 없음).
+    '숙소 없음' 표시가 있을 때만 작업에서 빼고 카탈로그에 빈 실행으로 기록.
+    카드가 있거나 요청 실패/차단 페이지/구조 변경 등 확인 불가면 그대로 수집
+    rate_limit: 탐색 요청도 전체 요청률 상한을 지킴 (마스터 프로세스 토큰 버킷)
+    """
+    dormant = [t for t in tasks if catalog.dormant(combo_key(t[1], t[2]))]
+    if not dormant:
+        return tasks, []
+    try:
+        hb = HttpBackend()
+    except RuntimeError as e:
+        log(prefix, f"[CATALOG] 빈 조합 탐색 생략 ({e})")
+        return tasks, []
+    prev_gov = _GOV["gov"]
+    if rate_limit:
+        install_governor(RateGovernor(RateGovernor.initial_state(rate_limit), threading.Lock(), rate_limit))
+    skipped = []
+    try:
+        for t in dormant:
+            city, region_code, ptype = t[:3]
+            try:
+                http_go_list_page(hb, region_code, ptype, 1, page_pause=0, prefix=prefix)
+            except Exception:
+                continue   # 확인 불가 → 수집
+            if http_no_items(hb):
+                skipped.append(t)
+                catalog.update(combo_key(region_code, ptype), city, PROPERTY_TYPES.get(ptype, f"type_{ptype}"), 1, 0, 0.0)
+    finally:
+        install_governor(prev_gov)
+        hb.quit()
+    log(prefix, f"[CATALOG] 빈 조합 후보 {len(dormant)}개 탐색 → {len(skipped)}개 여전히 비어 건너뜀")
+    return [t for t in tasks if t not in skipped], skipped
+
+def predict_wall(costs: List[float], workers: int) -> float:
+    """주어진 순서대로 가장 먼저 비는 워커에 배정했을 때의 완료 시각 (LPT 시뮬레이션)"""
+    loads = [0.0] * max(1, workers)
+    for c in costs:
+        heapq.heapreplace(loads, loads[0] + c)
+    return max(loads)
+
+def log_plan(catalog: ComboCatalog, tasks: List[Tuple], workers: int, prefix: str):
+    """dry-run: 배정 순서와 조합별 예상 시간, 전체 예상 벽시계 시간 출력"""
+    costs = [catalog.cost(combo_key(t[1], t[2])) for t in tasks]
+    known = sorted(c for c in costs if c is not None)
+    guess = known[len(known) // 2] if known else None
+    for i, (t, c) in enumerate(zip(tasks, costs), start=1):
+        e = catalog.combos.get(combo_key(t[1], t[2]), {})
+        size = f"{e.get('pages', '?')}p / {e.get('cards', '?')}건" if e else "기록 없음"
+        flag = " (빈 조합 탐색)" if catalog.dormant(combo_key(t[1], t[2])) else ""
+        est = f"{c:.0f}s" if c is not None else (f"~{guess:.0f}s(중앙값 가정)" if guess is not None else "?")
+        log(prefix, f"[PLAN] {i:>3}. {t[0]}/{PROPERTY_TYPES.get(t[2], t[2])} {size} 예상 {est}{flag}")
+    if guess is None:
+        log(prefix, "[PLAN] 카탈로그 기록 없음 → 예상 시간 계산 불가 (한 번 실행하면 생성)")
+        return
+    wall = predict_wall([c if c is not None else guess for c in costs], workers)
+    log(prefix, f"[PLAN] 예상 소요 {wall / 60:.1f}분 (workers={workers}, 작업 합 {sum(known) / 60:.1f}분, "
+                f"기록 없는 조합 {len(costs) - len(known)}개는 중앙값 가정)")
 
 # ------------ 멀티프로세스 오케스트레이터 ------------
 def crawl_all_mp(max_workers: int = 6,
@@ -655,12 +3796,58 @@ def crawl_all_mp(max_workers: int = 6,
                  page_pause: float = DEFAULT_PAGE_PAUSE,
                  detail_pause: float = DEFAULT_DETAIL_PAUSE,
                  property_types: Optional[List[int]] = None,
-                 max_pages_per_combo: Optional[int] = None):
+                 max_pages_per_combo: Optional[int] = None,
+                 capture_mode: str = "dom",
+                 capture_dump_dir: Optional[str] = None,
+                 backend: str = "chrome",
+                 http_concurrency: int = DEFAULT_HTTP_CONCURRENCY,
+                 reuse_driver: bool = True,
+                 detail_tabs: int = 1,
+                 readiness: str = "sleep",
+                 politeness_floor: float = DEFAULT_POLITENESS_FLOOR,
+                 scheduler: str = "combo",
+                 shard_pages: int = DEFAULT_SHARD_PAGES,
+                 journal_path: Optional[str] = None,
+                 max_restarts: int = 2,
+                 final_fp_csv: Optional[str] = "out/fingerprints.csv",
+                 incremental: bool = False,
+                 out_format: str = "csv",
+                 stats_json: Optional[str] = "out/stats.json",
+                 stats_prom: Optional[str] = "out/stats.prom",
+                 log_level: str = "info",
+                 log_format: str = "text",
+                 log_path: Optional[str] = None,
+                 rate_limit: Optional[float] = None,
+                 rate_floor: float = DEFAULT_RATE_FLOOR,
+                 retry_failures: bool = True,
+                 block_profile: Optional[str] = DEFAULT_BLOCK_PROFILE,
+                 block_urls: Optional[List[str]] = None,
+                 recycle_pages: Optional[int] = DEFAULT_RECYCLE_PAGES,
+                 recycle_rss_mb: Optional[float] = DEFAULT_RECYCLE_RSS_MB,
+                 autoscale: bool = False,
+                 autoscale_start: int = 2,
+                 autoscale_interval: float = AUTOSCALE_INTERVAL,
+                 shared_dedup: bool = False,
+                 catalog_path: Optional[str] = DEFAULT_CATALOG_PATH,
+                 dry_run: bool = False,
+                 result_db: Optional[str] = None,
+                 list_workers: int = DEFAULT_LIST_WORKERS,
+                 queue_pages: int = DEFAULT_QUEUE_PAGES,
+                 list_backend: Optional[str] = None):
+    """
+    autoscale=True 면 max_workers 는 상한: autoscale_start 개로 시작해 Autoscaler 가 동시 작업 수를 조절
+    catalog_path: 조합 크기 카탈로그 (큰 조합부터 배정, 빈 조합 탐색, 종료 시 갱신) / dry_run: 계획만 출력하고 종료
+    result_db: 공유 결과 저장소(SQLite WAL) 경로. 주면 조합별 결과 CSV 대신 여기에 upsert 하고 병합은 내보내기만
+    scheduler="pipeline": max_workers 는 상세 워커 수, list_workers 는 목록 워커 수, queue_pages 는 큐 용량(페이지 묶음),
+    list_backend 로 목록 단계만 다른 백엔드(예: "http") 사용 가능. capture_mode="network"/detail_tabs/autoscale 은 적용 안 됨
+    shared_dedup: 기본 False. 켜면 여러 숙소유형에 걸친 숙소를 한 번만 열지만 남는 숙소유형이 완료 순서에 좌우됨
+    """
 
     if property_types is None:
         property_types = list(PROPERTY_TYPES.keys())
 
     os.makedirs(tmp_out_dir, exist_ok=True)
+    log_queue = start_log_listener(log_level, log_format, log_path)
 
     args = {
         "headless": headless,
@@ -669,7 +3856,33 @@ def crawl_all_mp(max_workers: int = 6,
         "page_pause": page_pause,
         "detail_pause": detail_pause,
         "max_pages_per_combo": max_pages_per_combo,
+        "capture_mode": capture_mode,
+        "capture_dump_dir": capture_dump_dir,
+        "backend": backend,
+        "http_concurrency": http_concurrency,
+        "reuse_driver": reuse_driver,
+        "detail_tabs": detail_tabs,
+        "readiness": readiness,
+        "politeness_floor": politeness_floor,
+        "scheduler": scheduler,
+        "shard_pages": shard_pages,
+        "journal_path": journal_path,
+        "max_restarts": max_restarts,
+        "out_format": out_format,
+        "log_level": log_level,
+        "block_profile": block_profile,
+        "block_urls": block_urls,
+        "recycle_pages": recycle_pages,
+        "recycle_rss_mb": recycle_rss_mb,
+        "result_db": result_db,
+        "list_backend": list_backend,
     }
+    if incremental:
+        # 이전 실행 결과를 기준으로 지문이 같은 숙소는 이월 (각 워커가 시작 시 1회 로딩)
+        args["prev_results_csv"] = final_out_csv
+        args["prev_fp_csv"] = final_fp_csv
+        if not (final_fp_csv and os.path.exists(final_fp_csv) and os.path.exists(final_out_csv)):
+            log("[MASTER]", "[WARN] 이전 결과/지문 파일 없음 → 전체 수집")
 
     tasks = []
     wid = 1
@@ -679,22 +3892,107 @@ def crawl_all_mp(max_workers: int = 6,
             wid += 1
 
     master_prefix = "[MASTER]"
-    log(master_prefix, f"[PLAN] 총 작업 수: {len(tasks)}, workers={max_workers}")
-    results = []
-    with ProcessPoolExecutor(max_workers=max_workers) as ex:
-        futs = [ex.submit(run_combo, t) for t in tasks]
-        for fut in as_completed(futs):
-            try:
-                r = fut.result()
-                results.append(r)
-                log(master_prefix, f"[DONE] {r['city']}/{r['ptype']} ok:{r['ok']} fail:{r['fail']}")
-            except Exception as e:
-                log(master_prefix, f"[ERROR] 작업 실패: {e}")
+    catalog = ComboCatalog(catalog_path) if catalog_path else None
+    if catalog:
+        tasks = catalog.order(tasks)
+        if dry_run:
+            log_plan(catalog, tasks, max_workers, master_prefix)
+            stop_log_listener()
+            return
+        tasks, _ = probe_dormant(catalog, tasks, master_prefix, rate_limit)
+
+    manager = None
+    if scheduler in ("pages", "pipeline") or rate_limit or shared_dedup:
+        manager = mp.Manager()
+    if shared_dedup:
+        # 숙소 ID → 처음 수집한 조합. 여러 숙소유형에 걸친 숙소를 한 번만 열도록 전 워커가 공유
+        args["seen_cards"] = manager.dict()
+    if scheduler == "pages":
+        args["page_cursors"] = manager.dict()
+        args["page_lock"] = manager.Lock()
+        args["combos"] = [(c, rc, pt) for c, rc, pt, _, _ in tasks]
+    if scheduler == "pipeline":
+        args["pipe_queue"] = manager.Queue(maxsize=max(1, queue_pages))
+        args["pipe_queue_size"] = max(1, queue_pages)
+        if autoscale:
+            log(master_prefix, "[WARN] pipeline 스케줄러는 autoscale 미지원 → 고정 워커 수로 실행")
+            autoscale = False
+    if rate_limit:
+        # 전체 워커 합산 요청률 상한 (차단성 실패가 늘면 자동 감속, 회복 시 상한까지 복귀)
+        args["rate_state"] = manager.dict(RateGovernor.initial_state(rate_limit))
+        args["rate_lock"] = manager.Lock()
+        args["rate_limit"], args["rate_floor"] = rate_limit, rate_floor
+
+    progress = mp.Value("q", 0) if autoscale else None
+    scaler = Autoscaler(autoscale_start, max_workers, progress, autoscale_interval) if autoscale else None
+    log(master_prefix, f"[PLAN] 총 작업 수: {len(tasks)}, workers={max_workers}"
+                       f"{f' (자동 조절, 시작 {scaler.target})' if scaler else ''}"
+                       f"{f' (목록 {list_workers}, 큐 {queue_pages})' if scheduler == 'pipeline' else ''}, backend={backend}, scheduler={scheduler}, "
+                       f"rate_limit={rate_limit or '-'}")
+    results, pipe_info = [], {}
+    t_start = time.time()
+    if scheduler == "pipeline":
+        results, pipe_info = run_pipeline(tasks, args, log_queue, progress, list_workers, max_workers,
+                                          master_prefix, retry_failures)
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_worker_init, initargs=(args, log_queue, progress)) as ex:
+            jobs = [(run_combo, t) for t in tasks]
+            if scheduler == "pages":
+                # 제출은 순서대로 → 조합 작업이 모두 배정된 뒤 빈 워커가 steal 작업을 집어감
+                jobs += [(run_steal, (args, i)) for i in range(1, max_workers + 1)]
+            for _, fut in iter_pool(ex, jobs, scaler, master_prefix):
+                try:
+                    r = fut.result()
+                    results.append(r)
+                    log(master_prefix, f"[DONE] {r['city']}/{r['ptype']} ok:{r['ok']} fail:{r['fail']}")
+                except Exception as e:
+                    log(master_prefix, f"[ERROR] 작업 실패: {e}")
+            if retry_failures:
+                # 같은 풀(상주 드라이버 재사용)에서 실패 카드만 페이지 단위로 재시도
+                results += retry_failed_pages(ex, args, master_prefix, scaler)
+    if rate_limit:
+        log(master_prefix, f"[GOV] 종료 시 전체 요청률 {args['rate_state']['rate']:.2f} req/s (상한 {rate_limit})")
+    if manager:
+        manager.shutdown()
+    if catalog:
+        sizes: Dict[str, Dict] = {}
+        for r in results:
+            for key, t in (r.get("combos") or {}).items():
+                tally_combo(sizes, key, t["pages"], t["cards"], t["sec"])
+        names = {combo_key(rc, pt): (c, PROPERTY_TYPES.get(pt, f"type_{pt}")) for c, rc, pt, _, _ in tasks}
+        for key, t in sizes.items():
+            if t["pages"] and key in names:   # 저널상 이미 끝나 건너뛴 조합(0페이지)은 기록 유지
+                catalog.update(key, *names[key], t["pages"], t["cards"], t["sec"])
+        catalog.save()
+        log(master_prefix, f"[CATALOG] 조합 {len(sizes)}개 크기 갱신 → {catalog.path}")
+
+    wall = time.time() - t_start
+    startup = sum(r.get("startup_sec", 0.0) for r in results)
+    starts = sum(r.get("driver_starts", 0) for r in results)
+    done_combos = sum(1 for r in results if not (r.get("steal") or r.get("retry") or r.get("extract")))
+    log(master_prefix, f"[SUMMARY] 조합 {done_combos}/{len(tasks)} 완료, 경과 {wall:.1f}s, "
+                       f"드라이버 기동 {starts}회 / 총 {startup:.1f}s "
+                       f"(기동 평균 {startup / max(1, starts):.2f}s, 워커시간 대비 {100 * startup / max(1e-9, wall * max_workers):.1f}%)")
+    total, per_worker = StageStats(), {}
+    for r in results:
+        total.merge(r.get("stats") or {})
+        per_worker.setdefault(f"p{r.get('pid', 0)}", StageStats()).merge(r.get("stats") or {})
+    write_stats_report(total, per_worker,
+                       {"wall_sec": round(wall, 3), "workers": max_workers, "combos": len(tasks), "combos_done": done_combos,
+                        "ok": sum(r["ok"] for r in results), "fail": sum(r["fail"] for r in results),
+                        "driver_starts": starts, "startup_sec": round(startup, 3),
+                        **({"workers_final": scaler.target, "scale_decisions": scaler.decisions} if scaler else {}),
+                        **({"list_workers": list_workers, **pipe_info} if scheduler == "pipeline" else {})},
+                       stats_json, stats_prom, prefix=master_prefix)
 
-    merge_and_polish(tmp_out_dir, final_out_csv, final_fail_csv, prefix=master_prefix)
+    merge_and_polish(tmp_out_dir, final_out_csv, final_fail_csv, prefix=master_prefix, out_format=out_format,
+                     store_path=result_db)
+    if final_fp_csv:
+        merge_fingerprints(os.path.join(tmp_out_dir, "fingerprints"), final_fp_csv, prefix=master_prefix)
     log(master_prefix, "=== 전체 완료 ===")
     log(master_prefix, f"결과: {final_out_csv}")
     log(master_prefix, f"실패: {final_fail_csv}")
+    stop_log_listener()
 
 # ------------ 단일 프로세스(디버그용) ------------
 def crawl_all_single(headless: bool = True,
@@ -704,19 +4002,61 @@ def crawl_all_single(headless: bool = True,
                      page_pause: float = DEFAULT_PAGE_PAUSE,
                      detail_pause: float = DEFAULT_DETAIL_PAUSE,
                      property_types: Optional[List[int]] = None,
-                     max_pages_per_combo: Optional[int] = None):
+                     max_pages_per_combo: Optional[int] = None,
+                     capture_mode: str = "dom",
+                     capture_dump_dir: Optional[str] = None,
+                     backend: str = "chrome",
+                     http_concurrency: int = DEFAULT_HTTP_CONCURRENCY,
+                     detail_tabs: int = 1,
+                     readiness: str = "sleep",
+                     politeness_floor: float = DEFAULT_POLITENESS_FLOOR,
+                     journal_path: Optional[str] = None,
+                     out_format: str = "csv",
+                     stats_json: Optional[str] = "out/stats.json",
+                     stats_prom: Optional[str] = "out/stats.prom",
+                     log_level: str = "info",
+                     log_format: str = "text",
+                     log_path: Optional[str] = None,
+                     rate_limit: Optional[float] = None,
+                     rate_floor: float = DEFAULT_RATE_FLOOR,
+                     block_profile: Optional[str] = DEFAULT_BLOCK_PROFILE,
+                     block_urls: Optional[List[str]] = None,
+                     recycle_pages: Optional[int] = DEFAULT_RECYCLE_PAGES,
+                     recycle_rss_mb: Optional[float] = DEFAULT_RECYCLE_RSS_MB,
+                     shared_dedup: bool = False):
     if property_types is None:
         property_types = list(PROPERTY_TYPES.keys())
+    configure_logging(log_level, log_format, log_path)
+    if rate_limit:
+        install_governor(RateGovernor(RateGovernor.initial_state(rate_limit), threading.Lock(), rate_limit, rate_floor))
 
-    driver = make_driver(headless=headless, user_data_dir=None, suppress_logs=True)
+    def new_driver():
+        return make_backend(backend, http_concurrency=http_concurrency,
+                            headless=headless, user_data_dir=None, suppress_logs=True,
+                            capture_network=capture_mode == "network",
+                            page_load_strategy="none" if detail_tabs > 1 else None,
+                            block_profile=block_profile, block_urls=block_urls)
 
-    if not os.path.exists(out_csv):
+    def restart(old):
+        try:
+            old.quit()
+        except Exception:
+            pass
+        return new_driver()
+
+    driver = new_driver()
+    recycler = DriverRecycler(restart, recycle_pages, recycle_rss_mb)
+    shared_seen = SharedSeen({}) if shared_dedup else None
+
+    if out_format != "parquet" and not os.path.exists(out_csv):
         write_csv(out_csv, [], header=True)
     if not os.path.exists(fail_csv):
         write_failures(fail_csv, [], header=True)
 
     global_idx = 1
     prefix = "[W1]"
+    t_start = time.time()
+    ok_sum, fail_sum = 0, 0
     for city, region_code in REGIONS:
         region_idx = 1
         for ptype in property_types:
@@ -736,9 +4076,20 @@ def crawl_all_single(headless: bool = True,
                 max_pages=max_pages_per_combo,
                 global_index_start=global_idx,
                 region_index_start=region_idx,
-                prefix=prefix
+                prefix=prefix,
+                capture_mode=capture_mode,
+                capture_dump_dir=capture_dump_dir,
+                detail_tabs=detail_tabs,
+                readiness=readiness,
+                politeness_floor=politeness_floor,
+                journal=get_journal(journal_path),
+                out_format=out_format,
+                recycle=recycler,
+                shared_seen=shared_seen,
             )
+            driver = recycler.driver or driver   # 페이지 경계에서 교체됐을 수 있음
             log(prefix, f"[DONE] {city}/{PROPERTY_TYPES.get(ptype, ptype)} → ok:{ok_cnt}, fail:{fail_cnt}")
+            ok_sum, fail_sum = ok_sum + ok_cnt, fail_sum + fail_cnt
             global_idx = global_last + 1
             region_idx = 1
 
@@ -746,20 +4097,47 @@ def crawl_all_single(headless: bool = True,
         driver.quit()
     except Exception:
         pass
+    # 최종 CSV 는 항상 기록: parquet 출력이면 세그먼트에서 만듦
+    normalize_csv(out_csv, prefix, segments=parquet_segments(out_csv) if out_format == "parquet" else None)
+    write_stats_report(STATS, {}, {"wall_sec": round(time.time() - t_start, 3), "workers": 1, "ok": ok_sum, "fail": fail_sum},
+                       stats_json, stats_prom, prefix=prefix)
     log(prefix, "=== 단일 프로세스 완료 ===")
     log(prefix, f"결과: {out_csv}")
     log(prefix, f"실패: {fail_csv}")
 
 # ------------ 엔트리 포인트 ------------
 if __name__ == "__main__":
-    import multiprocessing as mp
     mp.freeze_support()
 
-    workers = int(input("프로세서 수 : "))
+    if sys.argv[1:2] == ["merge"]:
+        # 크롤 진행 중 중간 병합: python NaverStayCrawler_multi.py merge [csv|parquet|both] [결과 저장소.sqlite]
+        merge_and_polish("out/tmp", "out/results.csv", "out/failures.csv", prefix="[MERGE]",
+                         out_format=sys.argv[2] if len(sys.argv) > 2 else "csv",
+                         store_path=sys.argv[3] if len(sys.argv) > 3 else None)
+        sys.exit(0)
+
+    if sys.argv[1:2] == ["store"]:
+        # 실행 중 결과 저장소 조회: python NaverStayCrawler_multi.py store [out/results.sqlite]
+        store = ResultStore(sys.argv[2] if len(sys.argv) > 2 else "out/results.sqlite")
+        for city, ptype_name, n in store.summary():
+            log("[STORE]", f"{city}/{ptype_name}: {n}")
+        log("[STORE]", f"합계 {store.count()} → {store.path}")
+        store.close()
+        sys.exit(0)
+
+    if sys.argv[1:2] == ["plan"]:
+        # 카탈로그 기준 배정 순서/예상 소요 시간만 출력: python NaverStayCrawler_multi.py plan [workers]
+        crawl_all_mp(max_workers=int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 4), dry_run=True)
+        sys.exit(0)
+
+    answer = input("프로세서 수 (auto: 자동 조절) : ").strip()
+    autoscale = answer.lower() == "auto"
+    workers = (os.cpu_count() or 4) if autoscale else int(answer)
 
     # 병렬 실행
     crawl_all_mp(
-        max_workers=workers,           # 리소스에 맞게 조절
+        max_workers=workers,           # 리소스에 맞게 조절 (autoscale 이면 상한)
+        autoscale=autoscale,           # True: 2개로 시작해 CPU/가용 메모리/처리량 보고 워커 증감 ([SCALE] 로그)
         headless=False,                # 디버그 시 False
         checkpoint_every=50,
         tmp_out_dir="out/tmp",
@@ -768,7 +4146,26 @@ if __name__ == "__main__":
         page_pause=1.0,
         detail_pause=1.0,
         property_types=list(PROPERTY_TYPES.keys()),
-        max_pages_per_combo=None
+        max_pages_per_combo=None,
+        capture_mode="dom",            # "network": CDP 응답 JSON 캡처 모드
+        backend="chrome",              # "http": 브라우저 없이 수집 (workers 크게 가능)
+        reuse_driver=True,             # 워커당 드라이버 1개 재사용 (False: 조합마다 새 Chrome)
+        detail_tabs=1,                 # >1: 탭 N개로 상세 페이지 동시 로딩
+        readiness="sleep",             # "event": 고정 말미 대신 DOM 안정 감지
+        scheduler="combo",             # "pages": 큰 조합을 페이지 샤드로 나눠 빈 워커가 가져감 / "pipeline": 목록·상세 단계 분리
+        list_workers=1,                # pipeline: 목록 워커 수 (상세 워커 수 = max_workers)
+        queue_pages=8,                 # pipeline: 목록→상세 큐 용량(페이지 묶음). [PIPE] 로그의 큐 깊이로 병목 확인
+        journal_path=None,             # 예: "out/journal.sqlite" → 중단 후 재실행 시 완료 페이지 건너뜀
+        result_db=None,                # 예: "out/results.sqlite" → 조합별 CSV 대신 공유 저장소에 upsert (실행 중 조회 가능)
+        incremental=False,             # True: 이전 results.csv/fingerprints.csv 기준 변경된 숙소만 상세 열기
+        shared_dedup=False,            # True: 다른 숙소유형에서 이미 연 숙소는 건너뜀 (남는 숙소유형은 실행마다 다를 수 있음)
+        out_format="csv",              # "both": 조합별/최종 Parquet(평점 float, 사전 인코딩) 함께 기록
+        log_level="debug",             # "info": 카드별 수집 줄 생략 / log_format="json": 워커 필드 포함 JSON lines
+        retry_failures=True,           # 수집 후 failures 의 페이지만 다시 열어 실패 카드 재시도
+        block_profile="safe",          # 글꼴/광고·분석/지도 타일 차단 ("aggressive": CSS 까지, "off": 차단 안 함)
+        rate_limit=None,               # 예: 5.0 → 전체 워커 합산 초당 요청 상한 (타임아웃/빈 패널 급증 시 자동 감속)
+        recycle_pages=300,             # 드라이버당 페이지 N개마다 Chrome 교체 (메모리 누수 대비, 0: 끔)
+        recycle_rss_mb=1500,           # 브라우저 프로세스 트리 RSS 가 넘으면 다음 페이지 전에 교체
     )
 
     # 단일 프로세스 테스트가 필요하면 위 주석처리 후 아래 호출
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""
+오프라인 처리량 벤치마크 (fixture_server 합성 사이트 대상, 네트워크 불필요)
+- 합성 사이트를 로컬 스레드로 띄우고 NAVER_STAY_BASE 로 크롤러를 향하게 함
+- 설정(모드 × 워커 수 × pause × 백엔드)마다 별도 프로세스에서 crawl_all_single / crawl_all_mp 실행
+- 측정: 카드 수, 벽시계 시간, cards/s, CPU 시간(자식 전체), 코어 사용률, 최대 RSS(프로세스 트리 합, psutil)
+- 결과는 표로 출력하고 --out 에 CSV 로 저장 (단계별 p50 은 stats.json 에서)
+
+사용:
+    python bench.py --modes single mp --workers 2 4 --pauses 0 0.3 --backends http chrome
+    python bench.py --pages 10 --cards 30 --skew 1.5 --latency-ms 120 --regions 4 --out out/bench.csv
+"""
+
+import os
+import sys
+import csv
+import json
+import time
+import shutil
+import argparse
+import resource
+import tempfile
+import threading
+import subprocess
+from itertools import product
+from typing import Dict, List, Optional
+
+try:
+    import psutil
+except ImportError:  # 없으면 ru_maxrss(최대 단일 자식) 로 대체
+    psutil = None
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+RESULT_MARK = "BENCH_RESULT "
+BENCH_COLS = ["mode", "backend", "workers", "pause", "cards", "failures", "wall_s", "cards_per_s",
+              "cpu_s", "cpu_util", "peak_rss_mb", "card_p50", "page_p50"]
+
+# ------------ 자식: 설정 하나 실행 ------------
+def count_rows(path: str) -> int:
+    if not os.path.exists(path):
+        return 0
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        return max(0, sum(1 for _ in csv.reader(f)) - 1)
+
+def stage_p50(stats_json: str, stage: str) -> Optional[float]:
+    try:
+        with open(stats_json, encoding="utf-8") as f:
+            return json.load(f)["stages"][stage]["p50"]
+    except (OSError, KeyError, ValueError):
+        return None
+
+def run_one(cfg: Dict) -> Dict:
+    import NaverStayCrawler_multi as m   # NAVER_STAY_BASE 는 부모가 환경변수로 지정
+
+    m.REGIONS[:] = m.REGIONS[:cfg["regions"]]
+    out = tempfile.mkdtemp(prefix="naver_bench_")
+    results, fails, stats = (os.path.join(out, n) for n in ("results.csv", "failures.csv", "stats.json"))
+    common = dict(headless=True, page_pause=cfg["pause"], detail_pause=cfg["pause"],
+                  property_types=cfg["ptypes"], max_pages_per_combo=cfg["max_pages"],
+                  backend=cfg["backend"], readiness=cfg["readiness"], detail_tabs=cfg["tabs"],
+                  stats_json=stats, stats_prom=None, log_level="warning")
+    try:
+        if cfg["mode"] == "single":
+            m.crawl_all_single(out_csv=results, fail_csv=fails, **common)
+        else:
+            m.crawl_all_mp(max_workers=cfg["workers"], tmp_out_dir=os.path.join(out, "tmp"),
+                           final_out_csv=results, final_fail_csv=fails, final_fp_csv=None,
+                           scheduler=cfg["scheduler"], catalog_path=None, **common)
+        return {"cards": count_rows(results), "failures": count_rows(fails),
+                "card_p50": stage_p50(stats, "card"), "page_p50": stage_p50(stats, "page")}
+    finally:
+        shutil.rmtree(out, ignore_errors=True)
+
+# ------------ 부모: 측정 ------------
+def tree_rss(proc) -> int:
+    try:
+        procs = [proc] + proc.children(recursive=True)
+    except psutil.Error:
+        return 0
+    total = 0
+    for p in procs:
+        try:
+            total += p.memory_info().rss
+        except psutil.Error:
+            pass
+    return total
+
+def measure(cfg: Dict, base: str, sample_every: float = 0.2) -> Dict:
+    env = dict(os.environ, NAVER_STAY_BASE=base, PYTHONPATH=os.pathsep.join(filter(None, [HERE, os.environ.get("PYTHONPATH")])))
+    before = resource.getrusage(resource.RUSAGE_CHILDREN)
+    t0 = time.perf_counter()
+    child = subprocess.Popen([sys.executable, os.path.abspath(__file__), "--run-one", json.dumps(cfg)],
+                             cwd=HERE, env=env, stdout=subprocess.PIPE, text=True)
+    peak = 0
+    if psutil is not None:
+        proc = psutil.Process(child.pid)
+        while child.poll() is None:
+            peak = max(peak, tree_rss(proc))
+            time.sleep(sample_every)
+    out, _ = child.communicate()
+    wall = time.perf_counter() - t0
+    after = resource.getrusage(resource.RUSAGE_CHILDREN)
+    cpu = (after.ru_utime - before.ru_utime) + (after.ru_stime - before.ru_stime)
+    if not peak:
+        peak = after.ru_maxrss * 1024   # Linux: KB
+    lines = [l for l in out.splitlines() if l.startswith(RESULT_MARK)]
+    res = json.loads(lines[-1][len(RESULT_MARK):]) if lines else {"cards": 0, "failures": 0}
+    if child.returncode:
+        print(f"[BENCH][WARN] {cfg['mode']}/{cfg['backend']} 종료코드 {child.returncode}", flush=True)
+    return {
+        "mode": cfg["mode"], "backend": cfg["backend"], "workers": cfg["workers"], "pause": cfg["pause"],
+        "cards": res["cards"], "failures": res["failures"],
+        "wall_s": round(wall, 2), "cards_per_s": round(res["cards"] / wall, 2) if wall else 0.0,
+        "cpu_s": round(cpu, 2), "cpu_util": round(cpu / wall, 2) if wall else 0.0,
+        "peak_rss_mb": round(peak / 2 ** 20, 1),
+        "card_p50": res.get("card_p50"), "page_p50": res.get("page_p50"),
+    }
+
+def bench_configs(a) -> List[Dict]:
+    cfgs = []
+    for mode, backend, pause in product(a.modes, a.backends, a.pauses):
+        for workers in ([1] if mode == "single" else a.workers):
+            cfgs.append({"mode": mode, "backend": backend, "workers": workers, "pause": pause,
+                         "regions": a.regions, "ptypes": a.ptypes, "max_pages": a.max_pages,
+                         "readiness": a.readiness, "tabs": a.tabs, "scheduler": a.scheduler})
+    return cfgs
+
+def print_table(rows: List[Dict]):
+    widths = {c: max(len(c), *(len(str(r[c])) for r in rows)) for c in BENCH_COLS}
+    print("  ".join(c.rjust(widths[c]) for c in BENCH_COLS))
+    for r in rows:
+        print("  ".join(str(r[c]).rjust(widths[c]) for c in BENCH_COLS))
+
+def main():
+    ap = argparse.ArgumentParser(description="오프라인 크롤러 처리량 벤치마크")
+    ap.add_argument("--run-one", help=argparse.SUPPRESS)
+    ap.add_argument("--modes", nargs="+", default=["single", "mp"], choices=["single", "mp"])
+    ap.add_argument("--workers", nargs="+", type=int, default=[2, 4])
+    ap.add_argument("--pauses", nargs="+", type=float, default=[0.0])
+    ap.add_argument("--backends", nargs="+", default=["http"], choices=["chrome", "http"])
+    ap.add_argument("--regions", type=int, default=2, help="REGIONS 앞에서부터 사용할 지역 수")
+    ap.add_argument("--ptypes", nargs="+", type=int, default=[0, 1])
+    ap.add_argument("--max-pages", type=int, default=None)
+    ap.add_argument("--readiness", default="event", choices=["sleep", "event"])
+    ap.add_argument("--tabs", type=int, default=1)
+    ap.add_argument("--scheduler", default="combo", choices=["combo", "pages", "pipeline"])
+    ap.add_argument("--pages", type=int, default=3, help="합성 사이트: 조합당 페이지 수")
+    ap.add_argument("--cards", type=int, default=20, help="합성 사이트: 페이지당 카드 수")
+    ap.add_argument("--skew", type=float, default=0.0)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--latency-ms", type=float, default=50.0)
+    ap.add_argument("--jitter-ms", type=float, default=10.0)
+    ap.add_argument("--out", default=None, help="결과 CSV 경로")
+    a = ap.parse_args()
+
+    if a.run_one:
+        print(RESULT_MARK + json.dumps(run_one(json.loads(a.run_one))), flush=True)
+        return
+
+    from fixture_server import SyntheticSite, serve
+    httpd = serve(SyntheticSite(a.pages, a.cards, a.skew, a.seed), "127.0.0.1", 0,
+                  latency_ms=a.latency_ms, jitter_ms=a.jitter_ms)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{httpd.server_address[1]}"
+
+    rows = []
+    try:
+        for cfg in bench_configs(a):
+            print(f"[BENCH] {cfg['mode']} backend={cfg['backend']} workers={cfg['workers']} pause={cfg['pause']}", flush=True)
+            rows.append(measure(cfg, base))
+    finally:
+        httpd.shutdown()
+
+    if not rows:
+        return
+    print_table(rows)
+    if a.out:
+        os.makedirs(os.path.dirname(os.path.abspath(a.out)), exist_ok=True)
+        with open(a.out, "w", encoding="utf-8-sig", newline="") as f:
+            w = csv.DictWriter(f, fieldnames=BENCH_COLS)
+            w.writeheader()
+            w.writerows(rows)
+        print(f"[BENCH] 저장: {a.out}")
+
+if __name__ == "__main__":
+    main()
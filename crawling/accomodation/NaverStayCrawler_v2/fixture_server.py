@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+"""
+네이버 호텔 로컬 픽스처 서버 (녹화 재생 / 합성 사이트)
+- 녹화 모드: NaverStayCrawler_multi 의 capture_dump_dir 로 저장한 JSON 을 그대로 서빙
+    {root}/list/{region}_{ptype}_{page}.json , {root}/detail/{hotel_id}.json
+- 합성 모드(--synthetic): 녹화 없이 조합별 페이지 수/카드 수를 지정해 결정적 가짜 숙소 생성 (벤치마크용)
+- 목록/상세 HTML 은 collect_cards / parse_detail_panel 이 쓰는 클래스명으로 렌더링
+- 카드 클릭 시 /api/hotels/detail 을 fetch → CDP 캡처 모드 검증 가능
+- --latency-ms / --jitter-ms: 모든 응답에 인위적 지연 (실서버 왕복 흉내)
+
+사용:
+    python fixture_server.py --root fixtures --port 8765
+    python fixture_server.py --synthetic --pages 5 --cards 20 --latency-ms 80 --port 8765
+    NAVER_STAY_BASE=http://127.0.0.1:8765 python NaverStayCrawler_multi.py
+"""
+
+import os
+import json
+import html
+import time
+import zlib
+import random
+import argparse
+from typing import Dict, Optional
+from urllib.parse import urlparse, parse_qs, urlencode
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from NaverStayCrawler_multi import extract_hotels_from_json
+
+# ------------ 픽스처 로딩 ------------
+def load_json(root: str, kind: str, key: str):
+    path = os.path.join(root, kind, f"{key}.json")
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+class RecordedSite:
+    """capture_dump_dir 녹화 재생"""
+    def __init__(self, root: str):
+        self.root = root
+
+    def list_payload(self, region: str, ptype: str, page: int):
+        return load_json(self.root, "list", f"{region}_{ptype}_{page}") or {"hotels": []}
+
+    def detail_payload(self, region: str, hotel_id: str, ptype: str, page: int):
+        return load_json(self.root, "detail", hotel_id)
+
+    def has_page(self, region: str, ptype: str, page: int) -> bool:
+        return os.path.exists(os.path.join(self.root, "list", f"{region}_{ptype}_{page}.json"))
+
+    def describe(self) -> str:
+        return os.path.abspath(self.root)
+
+class SyntheticSite:
+    """
+    결정적 합성 사이트 (seed 고정 → 실행마다 같은 데이터)
+    - 조합별 페이지 수: skew=0 이면 모두 pages, >0 이면 파레토 꼬리(일부 조합만 매우 큼, 최대 pages*20)
+    - empty_ratio: 숙소가 하나도 없는 조합 비율
+    - hotel_id = N{조합해시 5자리}{페이지 4자리}{카드 3자리} → 상세 요청에서 역산
+    """
+    def __init__(self, pages: int = 5, cards: int = 20, skew: float = 0.0, seed: int = 0, empty_ratio: float = 0.0):
+        self.pages, self.cards, self.skew, self.seed, self.empty_ratio = pages, cards, skew, seed, empty_ratio
+
+    def combo_pages(self, region: str, ptype: str) -> int:
+        rnd = random.Random(f"{self.seed}:{region}:{ptype}")
+        if rnd.random() < self.empty_ratio:
+            return 0
+        if not self.skew:
+            return self.pages
+        return min(self.pages * 20, max(1, round(self.pages * rnd.paretovariate(1.0 / self.skew) / 2)))
+
+    def _combo(self, region: str, ptype: str) -> int:
+        return zlib.crc32(f"{self.seed}:{region}:{ptype}".encode()) % 100000
+
+    def hotel(self, region: str, ptype: str, page: int, i: int) -> Dict:
+        hid = f"N{self._combo(region, ptype):05d}{page:04d}{i:03d}"
+        rnd = random.Random(hid)
+        n = (page - 1) * self.cards + i
+        return {
+            "hotelId": hid,
+            "name": f"합성호텔 {region[-3:]}-{ptype}-{n}",
+            "nameEn": f"Synthetic Hotel {region[-3:]}-{ptype}-{n}",
+            "grade": rnd.choice(["", "1성급", "2성급", "3성급", "4성급", "5성급"]),
+            "tel": f"02-{rnd.randint(100, 999)}-{rnd.randint(1000, 9999)}",
+            "address": f"테스트시 {rnd.choice(['중구', '동구', '서구'])} 벤치로 {n}",
+            "homepage": f"http://hotel{n}.example" if rnd.random() < 0.5 else "",
+            "ratings": [{"provider": p, "score": f"{rnd.uniform(6, 10):.1f}"}
+                        for p in ("호텔스컴바인", "부킹닷컴", "트립어드바이저", "네이버") if rnd.random() < 0.7],
+        }
+
+    def list_payload(self, region: str, ptype: str, page: int):
+        if not self.has_page(region, ptype, page):
+            return {"hotels": []}
+        return {"hotels": [self.hotel(region, ptype, page, i) for i in range(self.cards)]}
+
+    def detail_payload(self, region: str, hotel_id: str, ptype: str, page: int):
+        try:
+            p, i = int(hotel_id[6:10]), int(hotel_id[10:])
+        except ValueError:
+            return None
+        if not self.has_page(region, ptype, p) or i >= self.cards:
+            return None
+        h = self.hotel(region, ptype, p, i)
+        return {"hotel": h} if h["hotelId"] == hotel_id else None
+
+    def has_page(self, region: str, ptype: str, page: int) -> bool:
+        return 1 <= page <= self.combo_pages(region, ptype)
+
+    def describe(self) -> str:
+        return f"synthetic(pages={self.pages}, cards={self.cards}, skew={self.skew}, seed={self.seed})"
+
+def detail_hotel(site, region: str, hotel_id: str, ptype: str, page: int) -> Optional[Dict[str, str]]:
+    payload = site.detail_payload(region, hotel_id, ptype, page)
+    hotels = extract_hotels_from_json(payload) if payload is not None else []
+    if not hotels:
+        # 상세 녹화가 없으면 목록 항목으로 대체
+        hotels = [h for h in extract_hotels_from_json(site.list_payload(region, ptype, page))
+                  if h["hotel_id"] == hotel_id]
+    return hotels[0] if hotels else None
+
+# ------------ HTML 렌더링 ------------
+def render_card(region: str, h: Dict[str, str], query: Dict[str, str]) -> str:
+    href = f"/{region}/hotels/{h['hotel_id']}?{urlencode(query)}"
+    return (
+        f'<li class="SearchList_item__fx"><div class="HotelItem_HotelItem__fx" data-hotel-id="{h["hotel_id"]}">'
+        f'<a class="HotelItem_link__fx" href="{html.escape(href)}">'
+        f'<div class="SearchList_InfoArea__fx"><h3>{html.escape(h["name"])}</h3>'
+        f'<span class="HotelItem_grade__fx">{html.escape(h.get("grade", ""))}</span></div></a></div></li>'
+    )
+
+def render_panel(h: Optional[Dict[str, str]]) -> str:
+    if not h:
+        return ""
+    e = html.escape
+    items = [f'<li class="Info_item__bDb4b address"><span class="Info_txt__5XJl0">{e(h.get("address", ""))} 위치 길찾기 거리뷰</span></li>']
+    if h.get("tel"):
+        items.append(f'<li class="Info_item__bDb4b"><i data-label="tel"></i><div><span class="Info_txt__5XJl0">{e(h["tel"])}복사</span></div></li>')
+    if h.get("website"):
+        items.append(f'<li class="Info_item__bDb4b homepage"><a class="Info_link__ikjyU" href="{e(h["website"])}">홈페이지</a></li>')
+    labels = {"hotelscombined": "호텔스컴바인", "booking": "부킹닷컴", "tripadvisor": "트립어드바이저", "naver": "네이버"}
+    rates = "".join(
+        f'<span class="Info_txt__5XJl0"><a class="Info_link__ikjyU">{labels[k]}</a><b class="Info_current__Ocnim">{e(v)}</b></span>'
+        for k, v in (h.get("ratings") or {}).items() if v and k in labels
+    )
+    if rates:
+        items.append(f'<li class="Info_item__bDb4b"><i data-label="rating"></i><div>{rates}</div></li>')
+    return (
+        '<div class="Info_Info__Nutkw">'
+        f'<h3 class="Info_name__ogaJE"><span class="Info_txt__5XJl0">{e(h["name"])}</span></h3>'
+        f'<i class="Info_eng__InlcK">{e(h.get("name_en", ""))}</i>'
+        f'<div class="Info_grade__Xn_uy"><i class="Info_gradetxt___V9AF">{e(h.get("grade", ""))}</i></div>'
+        f'<ul>{"".join(items)}</ul></div>'
+    )
+
+PAGE_SCRIPT = """
+<script>
+const q = new URLSearchParams(location.search);
+fetch(`/api/hotels/list?regionCode=${REGION}&propertyTypes=${q.get("propertyTypes")}&pageIndex=${q.get("pageIndex") || 1}`);
+document.querySelectorAll("[data-hotel-id]").forEach(card => card.addEventListener("click", ev => {
+  ev.preventDefault();
+  const id = card.dataset.hotelId;
+  const href = card.querySelector("a").getAttribute("href");
+  history.pushState(null, "", href);
+  document.getElementById("panel").innerHTML = "";
+  fetch(`/api/hotels/detail?hotelId=${id}&regionCode=${REGION}&${q}`)
+    .then(() => fetch(`/fixture/panel?hotelId=${id}&regionCode=${REGION}&${q}`))
+    .then(r => r.text())
+    .then(t => { document.getElementById("panel").innerHTML = t; });
+}));
+</script>
+"""
+
+def render_list_page(site, region: str, query: Dict[str, str], panel_html: str = "",
+                     has_more: Optional[bool] = None) -> str:
+    ptype = query.get("propertyTypes", "0")
+    page = int(query.get("pageIndex", "1") or 1)
+    hotels = extract_hotels_from_json(site.list_payload(region, ptype, page))
+    if hotels:
+        body = f'<ul class="SearchList_SearchList__fx">{"".join(render_card(region, h, query) for h in hotels)}</ul>'
+    else:
+        body = '<div class="Condition_NoItemWithCondition__hPSou">조건에 맞는 숙소가 없습니다.</div>'
+    if has_more is None:
+        has_more = site.has_page(region, ptype, page + 1)
+    nq = dict(query, pageIndex=str(page + 1))
+    style = "" if has_more else ' style="display:none"'
+    nav = f'<a class="Pagination_next__fx" href="/{region}/hotels?{html.escape(urlencode(nq))}"{style}>다음</a>'
+    return (
+        '<!doctype html><html><head><meta charset="utf-8"><title>fixture</title></head><body>'
+        f'{body}{nav}<div id="panel">{panel_html}</div>'
+        f'<script>const REGION = "{region}";</script>{PAGE_SCRIPT}</body></html>'
+    )
+
+# ------------ HTTP 핸들러 ------------
+class FixtureHandler(BaseHTTPRequestHandler):
+    site = RecordedSite("fixtures")
+    latency = 0.0   # 초
+    jitter = 0.0    # 초 (정규분포 표준편차)
+
+    def log_message(self, fmt, *args):
+        pass
+
+    def _send(self, code: int, body: str, ctype: str):
+        data = body.encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", f"{ctype}; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.latency or self.jitter:
+            time.sleep(max(0.0, random.gauss(self.latency, self.jitter)))
+        u = urlparse(self.path)
+        query = {k: v[0] for k, v in parse_qs(u.query).items()}
+        parts = [p for p in u.path.split("/") if p]
+        page = int(query.get("pageIndex", "1") or 1)
+        ptype = query.get("propertyTypes", "0")
+        region = query.get("regionCode", "")
+
+        if u.path == "/api/hotels/list":
+            return self._send(200, json.dumps(self.site.list_payload(region, ptype, page), ensure_ascii=False), "application/json")
+        if u.path == "/api/hotels/detail":
+            payload = self.site.detail_payload(region, query.get("hotelId", ""), ptype, page)
+            if payload is None:
+                return self._send(404, "{}", "application/json")
+            return self._send(200, json.dumps(payload, ensure_ascii=False), "application/json")
+        if u.path == "/fixture/panel":
+            h = detail_hotel(self.site, region, query.get("hotelId", ""), ptype, page)
+            return self._send(200, render_panel(h), "text/html")
+        if len(parts) == 2 and parts[1] == "hotels":
+            return self._send(200, render_list_page(self.site, parts[0], query), "text/html")
+        if len(parts) == 3 and parts[1] == "hotels":
+            h = detail_hotel(self.site, parts[0], parts[2], ptype, page)
+            return self._send(200, render_list_page(self.site, parts[0], query, panel_html=render_panel(h)), "text/html")
+        return self._send(404, "not found", "text/plain")
+
+def serve(site, host: str = "127.0.0.1", port: int = 8765, handler=FixtureHandler,
+          latency_ms: float = 0.0, jitter_ms: float = 0.0):
+    """site: RecordedSite / SyntheticSite (문자열이면 녹화 디렉터리). port=0 이면 빈 포트 자동 선택"""
+    handler.site = RecordedSite(site) if isinstance(site, str) else site
+    handler.latency, handler.jitter = latency_ms / 1000.0, jitter_ms / 1000.0
+    httpd = ThreadingHTTPServer((host, port), handler)
+    httpd.daemon_threads = True
+    print(f"[FIXTURE] http://{host}:{httpd.server_address[1]} ← {handler.site.describe()} "
+          f"(latency {latency_ms:.0f}±{jitter_ms:.0f}ms)", flush=True)
+    return httpd
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--root", default="fixtures")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--synthetic", action="store_true", help="녹화 대신 합성 데이터 서빙")
+    ap.add_argument("--pages", type=int, default=5, help="조합당 페이지 수 (합성)")
+    ap.add_argument("--cards", type=int, default=20, help="페이지당 카드 수 (합성)")
+    ap.add_argument("--skew", type=float, default=0.0, help=">0: 조합 크기 롱테일 (합성)")
+    ap.add_argument("--empty-ratio", type=float, default=0.0, help="빈 조합 비율 (합성)")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--latency-ms", type=float, default=0.0)
+    ap.add_argument("--jitter-ms", type=float, default=0.0)
+    a = ap.parse_args()
+    site = (SyntheticSite(a.pages, a.cards, a.skew, a.seed, a.empty_ratio) if a.synthetic
+            else RecordedSite(a.root))
+    serve(site, a.host, a.port, latency_ms=a.latency_ms, jitter_ms=a.jitter_ms).serve_forever()
@@ -0,0 +1,475 @@
+# -*- coding: utf-8 -*-
+"""
+합성 픽스처 사이트(fixture_server.SyntheticSite) 대상 오프라인 회귀 테스트 (backend="http", 네트워크/Chrome 불필요)
+
+실행:
+    python -m pytest -q test_offline_crawl.py
+"""
+
+import os
+import csv
+import json
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+import NaverStayCrawler_multi as m
+from fixture_server import FixtureHandler, SyntheticSite, serve
+
+PAGES, CARDS = 2, 3
+REGIONS = [("서울", "KR1000073"), ("인천", "KR1000532")]
+PTYPES = [0, 1]
+TOTAL = len(REGIONS) * len(PTYPES) * PAGES * CARDS
+
+class CountingHandler(FixtureHandler):
+    """경로별 요청 기록 (목록: /{region}/hotels, 상세: /{region}/hotels/{id})"""
+    requests = []
+
+    def do_GET(self):
+        CountingHandler.requests.append(self.path)
+        return super().do_GET()
+
+def list_requests(page=None):
+    reqs = [p for p in CountingHandler.requests if p.split("?")[0].count("/") == 2]
+    return [p for p in reqs if f"pageIndex={page}&" in p] if page else reqs
+
+def detail_requests():
+    return [p for p in CountingHandler.requests if p.split("?")[0].count("/") == 3]
+
+def read_rows(path):
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        return list(csv.DictReader(f))
+
+@pytest.fixture
+def site(monkeypatch):
+    httpd = serve(SyntheticSite(PAGES, CARDS, seed=1), "127.0.0.1", 0, handler=CountingHandler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    monkeypatch.setattr(m, "BASE", f"http://127.0.0.1:{httpd.server_address[1]}")
+    monkeypatch.setattr(m, "REGIONS", list(REGIONS))
+    CountingHandler.requests = []
+    yield httpd
+    httpd.shutdown()
+
+def run_mp(out, **kw):
+    opts = dict(max_workers=2, backend="http", property_types=PTYPES, page_pause=0, detail_pause=0,
+                tmp_out_dir=os.path.join(out, "tmp"), final_out_csv=os.path.join(out, "results.csv"),
+                final_fail_csv=os.path.join(out, "failures.csv"), final_fp_csv=os.path.join(out, "fingerprints.csv"),
+                stats_json=None, stats_prom=None, log_level="warning", catalog_path=None)
+    opts.update(kw)
+    m.crawl_all_mp(**opts)
+    return read_rows(opts["final_out_csv"])
+
+# ------------ 전체 수집 ------------
+def test_crawl_all_single(site, tmp_path):
+    out_csv = str(tmp_path / "results.csv")
+    m.crawl_all_single(backend="http", property_types=PTYPES, page_pause=0, detail_pause=0,
+                       out_csv=out_csv, fail_csv=str(tmp_path / "failures.csv"),
+                       stats_json=None, stats_prom=None, log_level="warning")
+    rows = read_rows(out_csv)
+    assert len(rows) == TOTAL
+    assert [r["idx"] for r in rows] == [str(i) for i in range(1, TOTAL + 1)]
+
+@pytest.mark.parametrize("scheduler", ["combo", "pages", "pipeline"])
+def test_crawl_all_mp(site, tmp_path, scheduler):
+    rows = run_mp(str(tmp_path), scheduler=scheduler, shard_pages=1)
+    assert len(rows) == TOTAL
+    assert len({r["detail_url"] for r in rows}) == TOTAL
+    assert len(detail_requests()) == TOTAL
+
+# ------------ 재개 / 증분 ------------
+def test_journal_resume(site, tmp_path):
+    journal = str(tmp_path / "journal.sqlite")
+    rows = run_mp(str(tmp_path), journal_path=journal, max_pages_per_combo=1)
+    assert len(rows) == TOTAL // PAGES
+
+    CountingHandler.requests = []
+    rows = run_mp(str(tmp_path), journal_path=journal)
+    assert len(rows) == TOTAL
+    assert list_requests(page=1) == []                     # 저널상 완료 페이지는 다시 열지 않음
+    assert len(detail_requests()) == TOTAL - TOTAL // PAGES
+
+def test_incremental_carry(site, tmp_path):
+    first = run_mp(str(tmp_path))
+    CountingHandler.requests = []
+    rows = run_mp(str(tmp_path), incremental=True, tmp_out_dir=str(tmp_path / "tmp2"))
+    assert len(rows) == len(first) == TOTAL
+    assert detail_requests() == []                         # 지문이 같으면 상세를 열지 않고 이월
+    assert {r["name"] for r in rows} == {r["name"] for r in first}
+
+def test_prev_catalog_falls_back_to_hotel_id(tmp_path):
+    # 병합에서 유형 간 같은 ID 가 한 행으로 합쳐져도 다른 유형의 지문은 이전 행을 찾아야 함
+    results, fps = str(tmp_path / "results.csv"), str(tmp_path / "fingerprints.csv")
+    m.write_csv(results, [m.HotelRow(city="서울", property_type="호텔", idx=1, region_idx=1, name="호텔 1",
+                                     name_en="", grade="", tel="", address="",
+                                     detail_url="http://x/KR/hotels/N10001", website="")], header=True)
+    m.write_fingerprints(fps, "서울", "호텔", [("N10001", "fp1")])
+    m.write_fingerprints(fps, "서울", "리조트", [("N10001", "fp1"), ("호텔 1", "fp1")])
+    cat = m.PrevCatalog(results, fps)
+    assert cat.lookup("서울", "리조트", "N10001", "fp1")["name"] == "호텔 1"
+    assert cat.lookup("서울", "리조트", "N10001", "fp2") is None          # 지문이 다르면 다시 열기
+    assert cat.lookup("서울", "리조트", "호텔 1", "fp1") is None           # 이름 키는 폴백하지 않음
+
+# ------------ 병합 ------------
+def test_merge_and_polish(tmp_path):
+    tmp_dir = tmp_path / "tmp"
+
+    def row(n, city):
+        return m.HotelRow(city=city, property_type="호텔", idx=0, region_idx=0, name=f"호텔 {n}", name_en="",
+                          grade="3성급", tel=f"02-100-{1000 + n}", address=f"서울 중구 {n}",
+                          detail_url=f"http://x/KR/hotels/N{10000 + n}", website="")
+
+    m.write_csv(str(tmp_dir / "서울_호텔.csv"), [row(n, "서울") for n in (1, 2, 3)], header=True)
+    m.write_csv(str(tmp_dir / "서울_호텔__p1.csv"), [row(n, "서울") for n in (3, 4)], header=True)   # 3 은 중복
+    m.write_failures(str(tmp_dir / "서울_호텔_fail.csv"),
+                     [{"city": "서울", "property_type": "호텔", "page": 1, "card_index": 2, "reason": "x"}], header=True)
+    final = str(tmp_path / "results.csv")
+    m.merge_and_polish(str(tmp_dir), final, str(tmp_path / "failures.csv"), prefix="[T]")
+    rows = read_rows(final)
+    assert [r["name"] for r in rows] == ["호텔 1", "호텔 2", "호텔 3", "호텔 4"]
+    assert [r["idx"] for r in rows] == ["1", "2", "3", "4"]
+    assert [r["region_idx"] for r in rows] == ["1", "2", "3", "4"]
+    assert len(read_rows(str(tmp_path / "failures.csv"))) == 1
+
+# ------------ 정규화 ------------
+@pytest.mark.parametrize("raw, want", [
+    ("02-1234-5678 (내선 3)", "02-1234-5678"),          # 내선 번호를 이어 붙이지 않음
+    ("02-123-4567~8", "02-123-4567"),                   # 범위 표기는 첫 번호만
+    ("+82 2-123-4567", "02-123-4567"),
+    ("+82-10-1234-5678", "010-1234-5678"),
+    ("복사 010.1234.5678", "010-1234-5678"),
+    ("1588-1234", "1588-1234"),
+    ("0507-1234-5678", "0507-1234-5678"),
+    ("tel: 064-123-4567 / 031-987-6543", "064-123-4567, 031-987-6543"),
+    ("문의: 프론트", "문의: 프론트"),                  # 번호 모양이 아니면 원문 유지
+    ("", ""),
+])
+def test_canonical_tel(raw, want):
+    assert m.canonical_tel(raw) == want
+    assert m.canonical_tel(want) == want                  # 멱등
+
+@pytest.mark.parametrize("raw, want", [
+    ("3성", "3성급"), ("3 성급", "3성급"), ("★★★★", "4성급"), ("5-star", "5성급"),
+    ("특 1 급", "특1급"), ("2급", "2급"), ("☆☆", ""), ("부티크", "부티크"), ("", ""),
+])
+def test_canonical_grade(raw, want):
+    assert m.canonical_grade(raw) == want
+
+@pytest.mark.parametrize("raw, want", [("8.5점", "8.5"), ("8,5", "8.5"), ("4.37/5", "4.37"), ("9", "9"), ("", ""), ("-", "")])
+def test_canonical_rating(raw, want):
+    assert m.canonical_rating(raw) == want
+
+# ------------ 회귀 ------------
+class StubDriver:
+    """목록/캡처 함수를 대체한 테스트에서 crawl_region_property 가 만지는 최소 속성만"""
+    current_url = "http://stub/KR1000073/hotels?pageIndex=1"
+
+def test_retry_single_card_network_capture(monkeypatch, tmp_path):
+    hotels = [{"hotel_id": f"N1000{i}", "name": f"캡처호텔 {i}", "name_en": "", "grade": "", "tel": f"02-000-000{i}",
+               "address": f"서울 {i}", "website": "", "ratings": {}} for i in (1, 2, 3)]
+    hotels[0].update(address="", tel="")   # 목록 JSON 만으로 부족 → 처리 대상이면 카드를 염
+    opened = []
+    monkeypatch.setattr(m, "go_list_page", lambda *a, **k: True)
+    monkeypatch.setattr(m, "collect_cards", lambda driver: ["c1", "c2", "c3"])
+    monkeypatch.setattr(m, "card_detail_urls", lambda driver, cards: [f"http://stub/KR1000073/hotels/N1000{c[1]}" for c in cards])
+    monkeypatch.setattr(m, "drain_network_json", lambda driver, *a: [])
+    monkeypatch.setattr(m, "wait_network_hotels", lambda *a, **k: [dict(h) for h in hotels])
+    monkeypatch.setattr(m, "open_card", lambda driver, card, **k: opened.append(card))
+    monkeypatch.setattr(m, "page_traffic", lambda driver: None)
+    out_csv = str(tmp_path / "r.csv")
+    ok, fail, _, _ = m.crawl_region_property(
+        StubDriver(), "서울", "KR1000073", 0, page_pause=0, detail_pause=0, out_csv=out_csv,
+        fail_csv=str(tmp_path / "f.csv"), start_page=1, max_pages=1, capture_mode="network", only_cards={3})
+    rows = read_rows(out_csv)
+    assert (ok, fail) == (1, 0)
+    assert [r["name"] for r in rows] == ["캡처호텔 3"]
+    assert "N10003" in rows[0]["detail_url"]
+    assert opened == []
+
+def test_recorded_end_does_not_skip_pending_shard(site, tmp_path):
+    # pages 스케줄러: 뒤쪽 샤드가 끝(p3)을 먼저 기록했고 앞 샤드 [1, 2] 는 아직 (예외 후 재시도 대기)
+    journal = m.CrawlJournal(str(tmp_path / "journal.sqlite"))
+    key = m.combo_key("KR1000073", 0)
+    journal.commit_page(key, PAGES + 1, 0, 0, 0, [])
+    journal.finish_combo(key, PAGES + 1)
+    hb = m.HttpBackend()
+    out_csv = str(tmp_path / "r.csv")
+    state = {}
+    ok, fail, _, _ = m.crawl_region_property(
+        hb, "서울", "KR1000073", 0, page_pause=0, detail_pause=0, out_csv=out_csv,
+        fail_csv=str(tmp_path / "f.csv"), start_page=1, max_pages=PAGES, journal=journal, state=state)
+    assert (ok, fail) == (PAGES * CARDS, 0)
+    assert len(read_rows(out_csv)) == PAGES * CARDS
+
+    # 다시 실행하면 구간 전체가 완료 → 요청 없이 건너뜀
+    CountingHandler.requests = []
+    ok, _, _, _ = m.crawl_region_property(
+        hb, "서울", "KR1000073", 0, page_pause=0, detail_pause=0, out_csv=out_csv,
+        fail_csv=str(tmp_path / "f.csv"), start_page=1, journal=journal)
+    assert ok == 0 and CountingHandler.requests == []
+    hb.quit()
+    journal.close()
+
+def test_retry_skips_permanent_failures(tmp_path):
+    # 상세 URL 이 없는 카드는 다시 열어도 같으므로 재시도 작업 없이 그대로 실패 목록에 남음
+    tmp_dir = str(tmp_path / "tmp")
+    fails = [{"city": "서울", "property_type": m.PROPERTY_TYPES[0], "page": 1, "card_index": ci,
+              "reason": reason, "page_url": ""} for ci, reason in ((1, "http:no_detail_url"), (2, "pipeline:no_detail_url"))]
+    m.write_failures(os.path.join(tmp_dir, "서울_호텔_fail.csv"), fails, header=True)
+    assert m.retry_failed_pages(None, {"tmp_out_dir": tmp_dir}, "[T]") == []   # 제출할 작업 없음
+    kept = read_rows(os.path.join(tmp_dir, "retry_pending_fail.csv"))
+    assert [r["reason"] for r in kept] == ["http:no_detail_url", "pipeline:no_detail_url"]
+
+class PerfLogDriver:
+    """performance 로그만 흉내: 교차 출처 글꼴(Resource Timing 상 0B) + 동일 출처 문서, 하나는 차단"""
+    def __init__(self):
+        self.entries = [json.dumps({"message": {"method": method, "params": params}}) for method, params in (
+            ("Network.loadingFinished", {"requestId": "1", "encodedDataLength": 40_000}),
+            ("Network.loadingFinished", {"requestId": "2", "encodedDataLength": 2_000}),
+            ("Network.loadingFailed", {"requestId": "3", "blockedReason": "inspector"}),
+        )]
+
+    def get_log(self, kind):
+        out, self.entries = [{"message": e} for e in self.entries], []
+        return out
+
+    def execute_script(self, script, *args):
+        return [2, 2_000]
+
+def test_page_traffic_counts_cross_origin_bytes():
+    driver = PerfLogDriver()
+    assert m.drain_network_json(driver) == []
+    assert m.page_traffic(driver) == (2, 42_000)         # CDP 집계: 교차 출처 포함, 차단 요청 제외
+    assert m.page_traffic(driver) == (0, 0)              # 가져가면 비움
+    del driver._net_traffic
+    assert m.page_traffic(driver) == (2, 2_000)          # 로그를 받지 않는 드라이버는 Resource Timing
+
+class BlockedHandler(FixtureHandler):
+    """인천 목록은 카드도 '숙소 없음' 표시도 없는 차단 페이지"""
+    def do_GET(self):
+        if "KR1000532" in self.path:
+            return self._send(200, "<html><body>잠시 후 다시 시도해 주세요</body></html>", "text/html")
+        return super().do_GET()
+
+def test_probe_skips_only_marked_empty(monkeypatch, tmp_path):
+    httpd = serve(SyntheticSite(PAGES, CARDS, seed=1, empty_ratio=1.0), "127.0.0.1", 0, handler=BlockedHandler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    monkeypatch.setattr(m, "BASE", f"http://127.0.0.1:{httpd.server_address[1]}")
+    acquired = []
+    monkeypatch.setattr(m.RateGovernor, "acquire", lambda self: acquired.append(self.ceiling))
+    catalog = m.ComboCatalog(str(tmp_path / "catalog.json"))
+    tasks = [(city, rc, 0, {}, i) for i, (city, rc) in enumerate(REGIONS, start=1)]
+    for _, rc, pt, _, _ in tasks:
+        catalog.combos[m.combo_key(rc, pt)] = {"empty_runs": m.EMPTY_PROBE_AFTER, "runs": m.EMPTY_PROBE_AFTER}
+    try:
+        kept, skipped = m.probe_dormant(catalog, tasks, "[T]", rate_limit=5.0)
+    finally:
+        httpd.shutdown()
+    assert [t[0] for t in skipped] == ["서울"]
+    assert [t[0] for t in kept] == ["인천"]           # 차단/확인 불가 → 수집
+    assert acquired == [5.0, 5.0]
+    assert m._GOV["gov"] is None
+
+@pytest.mark.parametrize("scheduler", ["combo", "pipeline"])
+def test_catalog_counts_list_cards(site, tmp_path, scheduler):
+    # 저널로 전부 건너뛴 재실행도 행은 0 이지만 목록 카드는 그대로 → 빈 조합으로 세지 않음
+    journal, catalog = str(tmp_path / "journal.sqlite"), str(tmp_path / "catalog.json")
+    for _ in range(2):
+        run_mp(str(tmp_path), scheduler=scheduler, journal_path=journal, catalog_path=catalog)
+    combos = m.ComboCatalog(catalog).combos
+    assert len(combos) == len(REGIONS) * len(PTYPES)
+    assert all(e["cards"] == PAGES * CARDS and e["empty_runs"] == 0 for e in combos.values())
+
+def test_reset_failure_keeps_combo_result(monkeypatch):
+    def broken_reset(driver):
+        raise RuntimeError("session gone")
+    monkeypatch.setattr(m, "reset_worker_driver", broken_reset)
+    with m.worker_driver({"backend": "http", "reuse_driver": True}, "[T]", "x") as driver:
+        assert isinstance(driver, m.HttpBackend)
+        done = True
+    assert done and m._WORKER["driver"] is None        # 결과는 살리고 드라이버만 폐기
+
+class TabDriver:
+    """ensure_tab_pool 이 쓰는 창 전환 + CDP 호출만 기록"""
+    def __init__(self):
+        self.window_handles, self.current_window_handle, self.cdp = ["t0"], "t0", []
+        self._cdp_network = [("Network.enable", {}), ("Network.setBlockedURLs", {"urls": ["*.woff2"]})]
+        self.switch_to = self
+
+    def new_window(self, kind):
+        self.current_window_handle = f"t{len(self.window_handles)}"
+        self.window_handles.append(self.current_window_handle)
+
+    def window(self, h):
+        self.current_window_handle = h
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.cdp.append((self.current_window_handle, cmd))
+
+def test_tab_pool_applies_network_settings():
+    driver = TabDriver()
+    assert m.ensure_tab_pool(driver, 2) == ["t1", "t2"]
+    assert driver.cdp == [(h, c) for h in ("t1", "t2") for c in ("Network.enable", "Network.setBlockedURLs")]
+    assert driver.current_window_handle == "t0"
+
+def test_failure_records_list_url(monkeypatch, tmp_path):
+    driver = StubDriver()
+    def details(drv, cards, *a, **k):
+        drv.current_url = "http://stub/KR1000073/hotels/N1?tab=detail"   # 상세 탭으로 옮겨간 상태
+        yield 1, None, None, "TimeoutException"
+    monkeypatch.setattr(m, "go_list_page", lambda *a, **k: True)
+    monkeypatch.setattr(m, "collect_cards", lambda drv: ["c1"])
+    monkeypatch.setattr(m, "iter_dom_details", details)
+    monkeypatch.setattr(m, "page_traffic", lambda drv: None)
+    fail_csv = str(tmp_path / "f.csv")
+    m.crawl_region_property(driver, "서울", "KR1000073", 0, page_pause=0, detail_pause=0, out_csv=str(tmp_path / "r.csv"),
+                            fail_csv=fail_csv, start_page=1, max_pages=1)
+    assert [r["page_url"] for r in read_rows(fail_csv)] == [StubDriver.current_url]
+
+@pytest.mark.parametrize("scheduler", ["combo", "pages"])
+def test_restart_keeps_partial_counts(site, tmp_path, monkeypatch, scheduler):
+    # 한 워커가 p2 목록에서 한 번 죽음 → 드라이버 재기동 후 저널로 재개. p1 성공 수가 합계에서 빠지면 안 됨
+    marker, collect = tmp_path / "crashed", m.http_collect_cards
+    def flaky(hb, region_code, ptype, page):
+        if page == 2 and not marker.exists():
+            marker.touch()
+            raise RuntimeError("driver crashed")
+        return collect(hb, region_code, ptype, page)
+    monkeypatch.setattr(m, "http_collect_cards", flaky)
+    stats = str(tmp_path / "stats.json")
+    rows = run_mp(str(tmp_path), scheduler=scheduler, shard_pages=PAGES, journal_path=str(tmp_path / "journal.sqlite"),
+                  stats_json=stats)
+    assert marker.exists() and len(rows) == TOTAL
+    with open(stats, encoding="utf-8") as f:
+        assert json.load(f)["ok"] == TOTAL
+
+class NavTabDriver(TabDriver):
+    """탭마다 이동이 폴링 2회 뒤에야 커밋 → 그 전에는 이전 숙소 문서가 남아 있음"""
+    NAMES = {"/KR1000073/hotels/N1": "숙소 A", "/KR1000073/hotels/N2": "숙소 B"}
+
+    def __init__(self):
+        super().__init__()
+        self.docs, self.pending = {}, {}
+
+    def execute_script(self, script, *args):
+        h = self.current_window_handle
+        if "window.location.href" in script:
+            self.pending[h] = [args[0], 2]
+            return None
+        if h in self.pending:
+            self.pending[h][1] -= 1
+            if self.pending[h][1] <= 0:
+                self.docs[h] = self.pending.pop(h)[0]
+        url = self.docs.get(h, "about:blank")
+        name = self.NAMES.get(url.replace("http://stub", ""), "")
+        if args:   # PANEL_READY_JS(target, prev)
+            return name if url == args[0] and name != args[1] else ""
+        return bool(name)
+
+def test_reused_tab_waits_for_new_document(monkeypatch):
+    driver = NavTabDriver()
+    urls = ["http://stub/KR1000073/hotels/N1", "http://stub/KR1000073/hotels/N2"]
+    monkeypatch.setattr(m, "card_detail_urls", lambda drv, cards: urls)
+    monkeypatch.setattr(m, "card_name_fallback", lambda card: "")
+    monkeypatch.setattr(m, "sleep_jitter", lambda *a: None)
+    def panel(drv, fallback_name=""):
+        url = drv.docs.get(drv.current_window_handle, "about:blank")
+        return {"name": NavTabDriver.NAMES.get(url.replace("http://stub", ""), ""), "detail_url": url}, {}
+    monkeypatch.setattr(m, "parse_panel", panel)
+    got = [(ci, d["name"], d["detail_url"]) for ci, d, _, _ in m.iter_tab_details(driver, ["c1", "c2"], 1, 0, "[T]")]
+    assert got == [(1, "숙소 A", urls[0]), (2, "숙소 B", urls[1])]
+
+def _pid(_):
+    return os.getpid()
+
+def test_pool_worker_releases_driver_on_shutdown(monkeypatch, tmp_path):
+    def release():
+        (tmp_path / f"released_{os.getpid()}").touch()
+    monkeypatch.setattr(m, "release_worker_driver", release)
+    with ProcessPoolExecutor(max_workers=2, initializer=m._worker_init,
+                             initargs=({"backend": "http", "reuse_driver": True, "log_level": "warning"},)) as ex:
+        pids = set(ex.map(_pid, range(4)))
+    assert {f"released_{p}" for p in pids} <= {f.name for f in tmp_path.iterdir()}   # fork 워커도 종료 시 정리
+
+def test_network_details_match_cards_by_hotel_id(monkeypatch):
+    # 목록 JSON: 순서 뒤바뀜 + 카드에 없는 항목 + 카드 2 의 항목 누락
+    hotels = {hid: {"hotel_id": hid, "name": f"JSON {hid}", "name_en": "", "grade": "", "tel": "02-000-0000",
+                    "address": f"서울 {hid}", "website": "", "ratings": {}} for hid in ("N3", "N9", "N1")}
+    opened = []
+    monkeypatch.setattr(m, "card_detail_urls", lambda drv, cards: [f"http://stub/KR1000073/hotels/N{c[1]}" for c in cards])
+    monkeypatch.setattr(m, "card_name_fallback", lambda card: f"카드 {card}")
+    monkeypatch.setattr(m, "drain_network_json", lambda drv, *a: [])
+    monkeypatch.setattr(m, "open_card", lambda drv, card, **k: opened.append(card))
+    monkeypatch.setattr(m, "wait_network_hotels", lambda *a, **k: [])
+    monkeypatch.setattr(m, "parse_panel", lambda drv, fallback_name="": (
+        {"name": fallback_name, "tel": "02-111-1111", "address": "서울 DOM", "detail_url": ""}, {}))
+    got = {ci: d for ci, d, _, why in m.iter_network_details(
+        StubDriver(), ["c1", "c2", "c3"], list(hotels.values()), "KR1000073", 0, 1, 0.1, None, "[T]")}
+    assert sorted(got) == [1, 2, 3]
+    assert (got[1]["name"], got[3]["name"]) == ("JSON N1", "JSON N3")
+    assert got[2]["name"] == "카드 c2" and got[2]["address"] == "서울 DOM" and "N2" in got[2]["detail_url"]
+    assert opened == ["c2"]
+
+class FlakyListHandler(CountingHandler):
+    """서울/호텔 목록 p2 첫 요청만 404"""
+    failed = False
+
+    def do_GET(self):
+        path = self.path.split("?")[0]
+        if path == "/KR1000073/hotels" and "pageIndex=2&" in self.path and "propertyTypes=0" in self.path \
+                and not FlakyListHandler.failed:
+            FlakyListHandler.failed = True
+            return self._send(404, "not found", "text/plain")
+        return super().do_GET()
+
+def test_list_page_failure_resumes_instead_of_finishing(tmp_path, monkeypatch):
+    httpd = serve(SyntheticSite(PAGES, CARDS, seed=1), "127.0.0.1", 0, handler=FlakyListHandler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    monkeypatch.setattr(m, "BASE", f"http://127.0.0.1:{httpd.server_address[1]}")
+    monkeypatch.setattr(m, "REGIONS", list(REGIONS))
+    try:
+        rows = run_mp(str(tmp_path), journal_path=str(tmp_path / "journal.sqlite"))
+    finally:
+        httpd.shutdown()
+    assert FlakyListHandler.failed and len(rows) == TOTAL   # 남은 p2 를 버리지 않고 재기동 후 이어서 수집
+
+def test_single_parquet_writes_final_csv(site, tmp_path):
+    out_csv = str(tmp_path / "results.csv")
+    m.crawl_all_single(backend="http", property_types=PTYPES, page_pause=0, detail_pause=0, out_format="parquet",
+                       out_csv=out_csv, fail_csv=str(tmp_path / "failures.csv"),
+                       stats_json=None, stats_prom=None, log_level="warning")
+    assert len(m.parquet_segments(out_csv)) >= 1
+    assert len(read_rows(out_csv)) == TOTAL
+
+def test_parquet_segment_readable_at_journal_commit(site, tmp_path, monkeypatch):
+    # p2 처리 중 죽는 시점에 p1(저널 커밋 완료)의 행은 footer 가 있는 세그먼트에 있어야 함
+    out_csv, collect, readable = str(tmp_path / "r.csv"), m.http_collect_cards, []
+    def dying(hb, region_code, ptype, page):
+        if page == 2:
+            readable.extend(m.pq.ParquetFile(p).metadata.num_rows for p in m.parquet_segments(out_csv))
+            raise RuntimeError("killed")
+        return collect(hb, region_code, ptype, page)
+    monkeypatch.setattr(m, "http_collect_cards", dying)
+    journal = m.CrawlJournal(str(tmp_path / "journal.sqlite"))
+    hb = m.HttpBackend()
+    with pytest.raises(RuntimeError):
+        m.crawl_region_property(hb, "서울", "KR1000073", 0, page_pause=0, detail_pause=0, out_csv=out_csv,
+                                fail_csv=str(tmp_path / "f.csv"), start_page=1, journal=journal, out_format="parquet")
+    hb.quit()
+    journal.close()
+    assert sum(readable) == CARDS
+
+def test_pipeline_survives_dead_extractors(site, tmp_path, monkeypatch):
+    # 상세 워커 프로세스가 시작하자마자 죽음(BrokenProcessPool) → 목록 쪽이 가득 찬 큐에서 멈추지 않고 실패로 남김
+    recycler = m.worker_recycler
+    def dying(args):
+        if sys._getframe(1).f_code.co_name == "run_extract":
+            os._exit(1)
+        return recycler(args)
+    monkeypatch.setattr(m, "worker_recycler", dying)
+    with pytest.raises(FileNotFoundError):   # 결과 행 없음 → 최종 결과 CSV 없음
+        run_mp(str(tmp_path), scheduler="pipeline", queue_pages=1)
+    fails = read_rows(str(tmp_path / "failures.csv"))
+    assert fails
+    assert {r["reason"] for r in fails} == {"pipeline:no_extractor"}